@@ -0,0 +1,476 @@
+"""Tests for the testid package; run with python -m pytest from this directory."""
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from testid import scanner
+from testid.annotator import ChakraTestIdAdder
+from testid.cli import main
+from testid.config import TestIdConfig
+from testid.edits import strip_content
+from testid.files import JSX_EXTENSIONS, walk_jsx_files
+from testid.sinks import MANIFEST_INDEX_VERSION, RunJournal, TestIdIndex
+from testid.strategies import STRATEGIES, get_strategy
+
+HTML_CONFIG = TestIdConfig({'html': {'elements': True}})
+
+TEST_FILES = sorted((Path(__file__).parent.parent / 'test_files').glob('*.jsx'))
+# {stem}_{strategy}_result.jsx: each strategy's output on test_files; the earlier strategies' as their
+# scripts wrote it at the baseline, and final's as annotate writes it with the default settings
+RESULTS_DIR = Path(__file__).parent.parent / 'results'
+
+
+def annotate(content, config=HTML_CONFIG, id_mode='counter'):
+    """Annotate content as one file of an annotate run would be."""
+    processor = ChakraTestIdAdder(id_mode=id_mode, verbose=False, config=config)
+    processor.reset_file_state()
+    processor.extract_chakra_imports(content)
+    processor.resolve_components()
+    return processor.annotate_content(content)
+
+
+def lexed(content):
+    """(component, is_closing) of every tag lex_tags finds."""
+    return [(tag['component'], tag['is_closing']) for tag in scanner.lex_tags(content)]
+
+
+@pytest.mark.parametrize('code', [
+    'const x = "<div class=\\"a\\">";',
+    "const x = '<span>';",
+    'const x = `<div>\n  <span>`;',
+    '// <span>',
+    '/* <div>\n <span> */',
+])
+def test_html_elements_in_js_literals_and_comments_are_not_annotated(code):
+    content = f"import {{ Box }} from '@chakra-ui/react';\n{code}\nconst y = <div>ok</div>;\n"
+    assert annotate(content) == content.replace('<div>ok', '<div data-testid="div-1">ok')
+
+
+def test_comments_and_strings_inside_jsx_expressions_are_skipped():
+    content = "<Box>{/* <div> */}{'<span>'}{items.map(i => <div key={i}>{i}</div>)}</Box>"
+    assert lexed(content) == [('Box', False), ('div', False), ('div', True), ('Box', True)]
+
+
+def test_jsx_text_is_not_lexed_as_code():
+    content = "<p>Don't // stop <a href='x'>it's</a> http://x /* </p>"
+    assert lexed(content) == [('p', False), ('a', False), ('a', True), ('p', True)]
+    assert 'data-testid="a-1"' in annotate(content)
+
+
+def test_fragments_keep_jsx_text_nesting():
+    content = "const x = <>it's <span>'</span></>;\nconst y = '<b>';"
+    assert lexed(content) == [('span', False), ('span', True)]
+
+
+def test_byte_core_skips_the_same_literals():
+    content = "const s = \"<div>\";\n<Box>{/* <span> */}<span>'</span>\n// <p>\n</Box>"
+    assert list(scanner.lex_tags_bytes(content.encode())) == list(scanner.lex_tags(content))
+
+
+STREAM_SOURCE = """import { Box, Text } from '@chakra-ui/react';
+const [items, setItems] = useState<Box>([]);
+const s = "<Text>";
+export const Page = () => (
+  <Box
+    className="page" title={`a > b`}
+  >
+    {/* <Text> */}
+    {items.map(item => <Text key={item}>{item}</Text>)}
+    <Text>it's</Text>
+  </Box>
+);
+"""
+
+# Pieces of random documents for fuzzing: tags, literal and comment delimiters, braces and generics
+FUZZ_PIECES = ('<Box>', '</Box>', '<div a="1">', '</div>', ' <Text/>', '<>', '</>', '{', '}', '"', "'", '`',
+               '//', '/*', '*/', '\\', '/', '<', 'a<b', ' c="}"', '>', '\n', 'x', 'é')
+
+
+def annotate_chunked(content, chunk_size, config=HTML_CONFIG):
+    """Annotate content with annotate_stream, fed in chunks of chunk_size characters."""
+    processor = ChakraTestIdAdder(verbose=False, config=config)
+    processor.reset_file_state()
+    processor.extract_chakra_imports(content)
+    processor.resolve_components()
+    output = []
+    processor.annotate_stream([content[i:i + chunk_size] for i in range(0, len(content), chunk_size)],
+                              output.append)
+    return ''.join(output)
+
+
+def streamed_tags(content, chunk_size):
+    """(start, end, component, is_closing, context) of each tag lex_stream finds, in whole-text offsets."""
+    tags = []
+    offset = 0
+    for segment, segment_tags in scanner.lex_stream([content[i:i + chunk_size]
+                                                     for i in range(0, len(content), chunk_size)]):
+        tags.extend((tag['start'] + offset, tag['end'] + offset, tag['component'], tag['is_closing'], tag['context'])
+                    for tag in segment_tags)
+        offset += len(segment)
+    return tags
+
+
+def fuzz_documents(seed, count=500):
+    """Random documents built from FUZZ_PIECES."""
+    rng = random.Random(seed)
+    return [''.join(rng.choice(FUZZ_PIECES) for _ in range(rng.randrange(60))) for _ in range(count)]
+
+
+class EntryList(list):
+    """Location sink keeping the entries it is given."""
+
+    def write_entry(self, entry):
+        self.append(entry)
+
+
+def annotate_each_core(content, id_mode, chunk_size=7):
+    """[(output, location entries)] of annotate_content, annotate_bytes and annotate_stream on content."""
+    results = []
+    for core in ('text', 'bytes', 'stream'):
+        entries = EntryList()
+        processor = ChakraTestIdAdder(id_mode=id_mode, manifest=entries, verbose=False, config=HTML_CONFIG)
+        processor.reset_file_state()
+        processor.extract_chakra_imports(content)
+        processor.resolve_components()
+        if core == 'text':
+            output = processor.annotate_content(content)
+        elif core == 'bytes':
+            output = processor.annotate_bytes(content.encode()).decode()
+        else:
+            pieces = []
+            processor.annotate_stream([content[i:i + chunk_size] for i in range(0, len(content), chunk_size)],
+                                      pieces.append)
+            output = ''.join(pieces)
+        results.append((output, entries))
+    return results
+
+
+@pytest.mark.parametrize('id_mode', ['counter', 'stable'])
+@pytest.mark.parametrize('seed', range(4))
+def test_text_byte_and_stream_cores_agree(seed, id_mode):
+    for content in [STREAM_SOURCE] + fuzz_documents(seed, 200):
+        text, byte, stream = annotate_each_core(content, id_mode)
+        assert byte == text, content
+        assert stream == text, content
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 4096])
+def test_stream_matches_annotate_content(chunk_size):
+    assert annotate_chunked(STREAM_SOURCE, chunk_size) == annotate(STREAM_SOURCE)
+
+
+def test_stream_keeps_the_character_before_a_chunk_boundary():
+    # "useState" ends one chunk and "<Box>" starts the next; it is still a generic
+    content = 'useState<Box>(x);'
+    assert streamed_tags(content, len('useState')) == []
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_stream_chunk_carry_fuzz(seed):
+    rng = random.Random(seed)
+    for content in fuzz_documents(seed):
+        chunk_size = rng.choice((1, 2, 3, 5, 17))
+        expected = [(tag['start'], tag['end'], tag['component'], tag['is_closing'], tag['context'])
+                    for tag in scanner.lex_tags(content)]
+        assert streamed_tags(content, chunk_size) == expected, (chunk_size, content)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_tag_span_table_edits_match_a_full_scan(seed):
+    rng = random.Random(seed)
+    for content in [STREAM_SOURCE] + fuzz_documents(seed, 100):
+        table = scanner.TagSpanTable(content)
+        for _ in range(20):
+            start = rng.randrange(len(table.content) + 1)
+            end = min(len(table.content), start + rng.randrange(6))
+            table.apply_edit(start, end, ''.join(rng.choice(FUZZ_PIECES) for _ in range(rng.randrange(3))))
+            assert table.tags == scanner.scan_tags(table.content), (content, start, end)
+
+
+def test_tag_span_table_update_relexes_only_near_the_edit():
+    content = STREAM_SOURCE * 20
+    table = scanner.TagSpanTable(content)
+    edited = content.replace('<Text>it\'s</Text>', '<Text title="x">it\'s</Text>', 1)
+    table.update(edited)
+    assert table.tags == scanner.scan_tags(edited)
+    assert table.relexed < len(STREAM_SOURCE)
+
+
+# Pieces of random tag bodies: attributes, quotes, braces nested past what the byte pattern covers
+BODY_PIECES = (' a="x>"', " b='}'", ' c={`${d}`}', ' e={{f: 1}}', ' g={h > 1}', '{', '}', '"', "'", '`', '>', '/',
+               ' i', '\n', 'é')
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_byte_tag_body_pattern_matches_find_tag_end(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        body = ''.join(rng.choice(BODY_PIECES) for _ in range(rng.randrange(12)))
+        data = body.encode()
+        end = scanner.find_tag_end(body, 0)
+        expected = len(body[:end].encode()) if end != -1 else -1
+        assert scanner.find_tag_end_bytes(data, 0) == expected, body
+        match = scanner.BYTE_TAG_BODY_PATTERN.match(data)
+        # The pattern may give up on deeper nesting, but never disagrees
+        if match:
+            assert match.end() - 1 == expected, body
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_byte_lexer_matches_text_lexer(seed):
+    for content in [STREAM_SOURCE] + fuzz_documents(seed):
+        data = content.encode()
+        expected = [{**tag, 'start': len(content[:tag['start']].encode()), 'end': len(content[:tag['end']].encode())}
+                    for tag in scanner.scan_tags(content)]
+        assert scanner.scan_tags_bytes(data) == expected, content
+        assert scanner.scan_tags_bytes(memoryview(data)) == expected, content
+
+
+# Pieces of random ignore files and source trees
+IGNORE_PATTERNS = ('*.tsx', 'gen/', 'build-*/', '/root.jsx', '**/gen/**', '!keep.jsx', 'a/**/b.jsx', '[ab]c.jsx',
+                   '?x.jsx', 'docs', 'src/*.jsx', '!src/App.jsx', '\\#hash.jsx', 'lib/**', '*.jsx', 'a/b/',
+                   '**/b.jsx', '[!a]c.jsx', 'b*/', '# comment', '/src', '!lib/keep.jsx', 'a/**', 'a/**/x',
+                   '!a/b/', '*c.jsx', '!*c.jsx', 'x/', '!gen/', 'src/**/App.jsx', '*/b/', 'a/x')
+TREE_DIRECTORIES = ('', 'src/', 'lib/', 'gen/', 'build-x/', 'docs/', 'a/', 'a/b/', 'a/x/b/', 'src/gen/')
+TREE_FILES = ('App.jsx', 'ac.jsx', 'bc.jsx', 'cc.jsx', 'zx.jsx', 'keep.jsx', 'root.jsx', 'b.jsx', '#hash.jsx', 'x.tsx')
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason='needs git')
+@pytest.mark.parametrize('seed', range(6))
+def test_walk_honours_gitignore_like_git(seed, tmp_path, monkeypatch):
+    rng = random.Random(seed)
+    monkeypatch.setenv('GIT_CONFIG_GLOBAL', os.devnull)
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+    for directory in TREE_DIRECTORIES:
+        for name in rng.sample(TREE_FILES, 5):
+            path = tmp_path / directory / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('<Box />\n')
+    for directory in ('', 'src/', 'a/'):
+        (tmp_path / directory / '.gitignore').write_text('\n'.join(rng.sample(IGNORE_PATTERNS, 4)) + '\n')
+
+    listed = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard'], cwd=tmp_path, check=True,
+                            capture_output=True, text=True).stdout.splitlines()
+    expected = sorted(path for path in listed if path.endswith(JSX_EXTENSIONS))
+    walked = sorted(Path(path).relative_to(tmp_path).as_posix() for path, size in walk_jsx_files(tmp_path))
+    assert walked == expected
+
+
+def test_outputs_keep_the_source_extension(tmp_path):
+    for extension in ('js', 'tsx'):
+        (tmp_path / f'Foo.{extension}').write_text(f'<Box className="from{extension}" />\n')
+    assert main(['annotate', str(tmp_path)]) == 0
+    assert 'box-fromjs-1' in (tmp_path / 'Foo_final_result.js').read_text()
+    assert 'box-fromtsx-1' in (tmp_path / 'Foo_final_result.tsx').read_text()
+
+
+def test_walk_skips_every_strategys_outputs(tmp_path):
+    for name in ('App.jsx', 'App_final_result.jsx', 'App_v4_result.jsx', 'App_v6_multiline_result.tsx'):
+        (tmp_path / name).write_text('<Box />\n')
+    assert [Path(path).name for path, size in walk_jsx_files(tmp_path)] == ['App.jsx']
+
+
+def test_annotate_matches_its_results(tmp_path):
+    for path in TEST_FILES:
+        shutil.copy(path, tmp_path)
+    assert main(['annotate', str(tmp_path)]) == 0
+    for path in TEST_FILES:
+        output = f'{path.stem}_final_result.jsx'
+        assert (tmp_path / output).read_text() == (RESULTS_DIR / output).read_text(), output
+
+
+@pytest.mark.parametrize('name', [name for name in STRATEGIES if name != 'final'])
+@pytest.mark.parametrize('path', TEST_FILES, ids=lambda path: path.name)
+def test_strategies_match_their_baseline_scripts(name, path):
+    output, _ = get_strategy(name)(scanner.decode_text(path.read_bytes()))
+    assert output == (RESULTS_DIR / f'{path.stem}_{name}_result.jsx').read_text()
+
+
+@pytest.mark.parametrize('path', TEST_FILES, ids=lambda path: path.name)
+def test_strip_restores_the_source(path):
+    content = scanner.decode_text(path.read_bytes())
+    output = annotate(content)
+    added = output.count('data-testid=') - content.count('data-testid=')
+    assert added
+    assert strip_content(output) == (content, added)
+
+
+@pytest.mark.parametrize('annotated, stripped', [
+    ('<Box title="use data-testid=x here" data-testid="box-1">', '<Box title="use data-testid=x here">'),
+    ('<Box label={`data-testid="x"`} />', '<Box label={`data-testid="x"`} />'),
+    ('<Button icon={<Icon data-testid="icon-1" />} data-testid="button-1">', '<Button icon={<Icon />}>'),
+    ('<Box {...props} hidden data-testid="box-1" />', '<Box {...props} hidden />'),
+    ('<Box\n  // note\n  data-testid="box-1"\n>', '<Box\n  // note\n>'),
+    ('<Box\n  // width={1} data-testid="box-1"\n>', '<Box\n  // width={1}\n>'),
+])
+def test_strip_only_removes_whole_attributes(annotated, stripped):
+    assert strip_content(annotated)[0] == stripped
+
+
+@pytest.mark.parametrize('manifest', ['manifest.ndjson', 'manifest.json'])
+def test_renumber_only_renumbers_ids_generated_in_that_file(manifest, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Path('A.jsx').write_text('<Box />\n<Box />\n<Box />\n')
+    Path('B.jsx').write_text('<Box data-testid="box-3" />\n')
+    assert main(['annotate', '.', '--manifest', 'manifest.ndjson']) == 0
+    output = Path('A_final_result.jsx')
+    output.write_text(output.read_text().replace('<Box data-testid="box-2" />\n', ''))
+
+    assert main(['renumber', 'A_final_result.jsx', 'B_final_result.jsx',
+                 '--manifest', manifest, '--mapping', 'mapping.json']) == 0
+    assert output.read_text() == '<Box data-testid="box-1" />\n<Box data-testid="box-2" />\n'
+    assert Path('B_final_result.jsx').read_text() == '<Box data-testid="box-3" />\n'
+    assert json.loads(Path('mapping.json').read_text()) == {'A_final_result.jsx': {'box-3': 'box-2'}}
+
+
+@pytest.mark.parametrize('jobs', [[], ['--jobs', '2']])
+def test_resume_skips_complete_outputs_and_reruns_truncated_ones(jobs, tmp_path, monkeypatch, capsys):
+    for name in ('A', 'B', 'C'):
+        (tmp_path / f'{name}.jsx').write_text(f'<Box className="{name}" />\n')
+    journal = str(tmp_path / 'journal.ndjson')
+    process_file = ChakraTestIdAdder.process_file
+
+    def interrupt_at_c(self, file_path):
+        if Path(file_path).name == 'C.jsx':
+            raise KeyboardInterrupt
+        return process_file(self, file_path)
+
+    monkeypatch.setattr(ChakraTestIdAdder, 'process_file', interrupt_at_c)
+    with pytest.raises(KeyboardInterrupt):
+        main(['annotate', str(tmp_path), '--resume', journal])
+    monkeypatch.undo()
+    expected = (tmp_path / 'A_final_result.jsx').read_text()
+    (tmp_path / 'A_final_result.jsx').write_text(expected[:10])
+    capsys.readouterr()
+
+    assert main(['annotate', str(tmp_path), '--resume', journal] + jobs) == 0
+    skipped = [line for line in capsys.readouterr().out.splitlines() if 'Already done' in line]
+    assert [Path(line.rpartition(' ')[2]).name for line in skipped] == ['B_final_result.jsx']
+    assert (tmp_path / 'A_final_result.jsx').read_text() == expected
+    assert 'box-c-1' in (tmp_path / 'C_final_result.jsx').read_text()
+    assert not Path(journal).exists()
+
+
+def test_journal_checks_output_size_before_hashing(tmp_path):
+    output = tmp_path / 'App_final_result.jsx'
+    output.write_text('<Box data-testid="box-1" />\n')
+    journal = RunJournal(tmp_path / 'journal.ndjson', 'settings')
+    journal.record('App.jsx', 'input', output, scanner.text_hash(output.read_bytes()))
+    journal.close()
+
+    journal = RunJournal(tmp_path / 'journal.ndjson', 'settings')
+    assert journal.is_complete('App.jsx', 'input', output)
+    assert not journal.is_complete('App.jsx', 'changed', output)
+    output.write_text('<Box data-testid="box-2" />\n')
+    os.utime(output, ns=(0, 0))
+    assert not journal.is_complete('App.jsx', 'input', output)
+    output.write_text('<Box />\n')
+    assert not journal.is_complete('App.jsx', 'input', output)
+    journal.close()
+
+
+STABLE_SOURCE = """import { Badge, Box, Button, Flex, Heading, Input, Text } from "@chakra-ui/react";
+const Tasks = () => (
+  <Box className="page">
+    <Heading>Tasks</Heading>
+    <Button aria-label="save">Save</Button>
+    <Button aria-label="cancel">Cancel</Button>
+    <Input name="title" />
+    <Flex className="footer"><Text>Done</Text></Flex>
+  </Box>
+);
+"""
+
+
+def ids_by_tag(output):
+    """{tag without its data-testid: data-testid} for the annotated tags of output."""
+    return {match.group(1) + match.group(3): match.group(2)
+            for match in re.finditer(r'(<[^<>]*?) data-testid="([^"]*)"([^<>]*>)', output)}
+
+
+def test_stable_ids_survive_reordering_and_inserting_elements():
+    before = ids_by_tag(annotate(STABLE_SOURCE, id_mode='stable'))
+    edited = STABLE_SOURCE.replace('    <Heading>Tasks</Heading>\n',
+                                   '    <Badge>New</Badge>\n    <Heading>Tasks</Heading>\n')
+    edited = edited.replace('    <Button aria-label="save">Save</Button>\n'
+                            '    <Button aria-label="cancel">Cancel</Button>\n'
+                            '    <Input name="title" />\n',
+                            '    <Input name="title" />\n    <Button aria-label="cancel">Cancel</Button>\n'
+                            '    <Button aria-label="save">Save</Button>\n')
+    after = ids_by_tag(annotate(edited, id_mode='stable'))
+    assert len(before) == 7 and len(after) == 8
+    assert {tag: after[tag] for tag in before} == before
+    # Counter IDs follow document order, so the swapped Buttons trade theirs
+    counter_before, counter_after = ids_by_tag(annotate(STABLE_SOURCE)), ids_by_tag(annotate(edited))
+    assert {tag: counter_after[tag] for tag in counter_before} != counter_before
+
+
+def test_stable_ids_number_identical_fingerprints_in_document_order():
+    source = 'import { Button } from "@chakra-ui/react";\n<Button>A</Button>\n<Button>B</Button>\n'
+    output = annotate(source, id_mode='stable')
+    first, second = re.findall(r'data-testid="([^"]*)"', output)
+    assert second == first + '-2'
+    assert annotate(source, id_mode='stable') == output
+
+
+@pytest.mark.parametrize('options', [[], ['--jobs', '2'], ['--stream', '0']])
+def test_manifest_locations_point_at_the_annotated_tags(options, tmp_path):
+    for path in TEST_FILES:
+        shutil.copy(path, tmp_path)
+    manifest = tmp_path / 'manifest.ndjson'
+    assert main(['annotate', str(tmp_path), '--manifest', str(manifest)] + options) == 0
+
+    entries = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert {Path(entry['file']).name for entry in entries} == \
+        {f'{path.stem}_final_result.jsx' for path in TEST_FILES}
+    outputs = {}
+    for entry in entries:
+        if entry['file'] not in outputs:
+            outputs[entry['file']] = Path(entry['file']).read_text().splitlines(keepends=True)
+        lines = outputs[entry['file']]
+        content = ''.join(lines)
+        start = sum(map(len, lines[:entry['line'] - 1])) + entry['column'] - 1
+        tag = content[start:scanner.find_tag_end(content, start) + 1]
+        assert tag.startswith('<' + entry['component']), entry
+        assert f'data-testid="{entry["test_id"]}"' in tag, entry
+
+
+def test_json_index_and_sqlite_lookup_round_trip(tmp_path, capsys):
+    for path in TEST_FILES:
+        shutil.copy(path, tmp_path)
+    manifest, index_path = tmp_path / 'manifest.ndjson', tmp_path / 'index.sqlite'
+    arguments = ['annotate', str(tmp_path), '--manifest', str(manifest), '--index', str(index_path)]
+    assert main(arguments) == 0
+    entries = [json.loads(line) for line in manifest.read_text().splitlines()]
+
+    index = json.loads((tmp_path / 'manifest.json').read_text())
+    assert index['version'] == MANIFEST_INDEX_VERSION
+    assert sorted((test_id, index['files'][location[0]], *location[1:])
+                  for test_id, locations in index['ids'].items() for location in locations) == \
+        sorted((entry['test_id'], entry['file'], entry['line'], entry['column'], entry['component'],
+                entry['parent_id'], entry['generated']) for entry in entries)
+
+    # Re-annotating replaces each file's rows instead of adding to them
+    assert main(arguments) == 0
+    index = TestIdIndex(index_path)
+    try:
+        for entry in entries:
+            assert (entry['test_id'], str(Path(entry['file']).resolve()), entry['line'], entry['column'],
+                    entry['component']) in index.lookup(entry['test_id'])
+        rows = index.lookup('', prefix=True)
+    finally:
+        index.close()
+    assert len(rows) == len(entries)
+
+    entry = entries[0]
+    capsys.readouterr()
+    assert main(['lookup', entry['test_id'], '--index', str(index_path)]) == 0
+    assert f"{Path(entry['file']).resolve()}:{entry['line']}:{entry['column']}" in capsys.readouterr().out
+    assert main(['lookup', 'no-such-id', '--index', str(index_path)]) == 1
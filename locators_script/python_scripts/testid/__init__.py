@@ -0,0 +1,27 @@
+"""
+Add data-testid attributes to Chakra UI components in JSX files.
+
+Modules:
+  cli: the command line (also run by add_test_ids_final.py and python -m testid)
+  scanner: JSX tag lexers over text, bytes and chunked streams, and incremental re-lexing
+  rules: import detection and ID naming rules shared by the scanner and every strategy
+  config: project settings compiled over the rules
+  annotator: the final strategy, adding IDs to the tags the scanner finds
+  strategies: the earlier scripts' strategies, imported when first used
+  files: directory walking with ignore files, and atomic writes
+  pool: largest-first batch scheduling over worker processes
+  cache, symbols, sinks, edits: the parse cache, project symbol index, location
+    sinks (manifest, SQLite index, journal) and in-place strip and renumber
+concurrent.futures, sqlite3 and tomllib are imported where they are used: most
+runs need none of them, and they are about half of the import time.
+
+Needs Python 3.11 or later: the scanner's patterns use possessive quantifiers and
+pyproject.toml settings are read with tomllib.
+"""
+import sys
+
+if sys.version_info < (3, 11):
+    raise ImportError(f"testid needs Python 3.11 or later, not {sys.version.split()[0]}")
+
+# Bump when scanning or import detection changes so cached parse results are not reused
+TOOL_VERSION = '1.2.0'
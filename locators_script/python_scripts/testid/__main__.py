@@ -0,0 +1,6 @@
+"""Run the command line with python -m testid."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,753 @@
+"""
+The final strategy: add data-testid attributes to the components each file imports.
+"""
+import hashlib
+import os
+import re
+
+from .cache import get_parse_cache
+from .config import get_config
+from .files import open_atomic, output_path_for, write_atomic
+from .rules import CHAKRA_LIBRARY
+from .scanner import (
+    BYTE_TESTID_MARKER_PATTERN, BYTE_TESTID_VALUE_PATTERN, TAG_NAME_PATTERN, TESTID_MARKER_PATTERN,
+    TESTID_VALUE_PATTERN, LineIndex, decode_text, hash_text_file, iter_text_chunks, lex_stream, lex_tags_bytes,
+    map_file, read_import_statements, scan_tags, scan_tags_bytes, text_hash)
+from .sinks import LocationBuffer
+from .symbols import get_symbol_index
+
+# How a file was annotated, in report order: not scanned as no tag names a component, scanned as
+# bytes, decoded and scanned as text (parse cache or carriage returns) or streamed in chunks
+SCAN_ROUTES = ('skip', 'bytes', 'text', 'stream')
+
+# Attributes that identify an element for stable test IDs
+KEY_ATTRIBUTE_PATTERN = re.compile(
+    r'\b(className|id|key|name|type|variant|as|role|aria-label|src|href|alt|placeholder)='
+    r'("[^"]*"|\'[^\']*\'|\{[^{}]*\})'
+)
+
+# Length of the fingerprint digest appended to stable test IDs
+STABLE_HASH_LENGTH = 6
+
+
+def decode_utf8(data):
+    """Decode UTF-8 bytes, or a memoryview or mmap slice of them, for annotate_bytes' naming."""
+    return str(data, 'utf-8')
+
+
+def utf8_length(text):
+    """Return the length of text in UTF-8 bytes, for offsets into a byte source."""
+    return len(text.encode('utf-8'))
+
+
+def parse_content(content, cache=None, processor=None):
+    """Return (tags, chakra_components, custom_components) for content.
+
+    The result comes from the cache when possible; otherwise the file is
+    scanned, imports are detected with processor (a quiet adder by default)
+    and the result is stored.
+    """
+    if cache is not None:
+        cached = cache.load(content)
+        if cached is not None:
+            return cached
+
+    if processor is None:
+        processor = ChakraTestIdAdder(verbose=False)
+    processor.chakra_components = set()
+    processor.custom_components = set()
+    processor.extract_chakra_imports(content)
+    result = (scan_tags(content), processor.chakra_components, processor.custom_components)
+
+    if cache is not None:
+        cache.store(content, *result)
+    return result
+
+
+def has_component_tags(data, components):
+    """Whether a tag in UTF-8 data could name one of components; False means scanning would find none."""
+    return any(name.decode('utf-8', 'replace') in components for name in set(TAG_NAME_PATTERN.findall(data)))
+
+
+def parse_bytes(data, processor, file_path=None, skip=True):
+    """parse_content for UTF-8 bytes: tags with byte offsets, found without decoding the file.
+
+    Unlike parse_content, the components are also resolved for file_path, so
+    that a file where no tag can name one is not scanned: its tags are
+    empty and processor.scan_route is 'skip' rather than 'bytes'. skip=False
+    scans every file, e.g. to time what skipping saves.
+    """
+    processor.chakra_components = set()
+    processor.custom_components = set()
+    processor.extract_chakra_imports(read_import_statements(data))
+    processor.resolve_components(file_path)
+    if skip and not has_component_tags(data, processor.chakra_components):
+        processor.scan_route = 'skip'
+        return [], processor.chakra_components, processor.custom_components
+    processor.scan_route = 'bytes'
+    return scan_tags_bytes(data), processor.chakra_components, processor.custom_components
+
+
+# One annotator per settings in each worker process
+_annotators = {}
+
+
+def get_annotator(id_mode='counter', cache_dir=None, symbols_path=None, config_path=None, collect_entries=False):
+    """Return this process's quiet annotator for the given settings, reset for a new file."""
+    key = (id_mode, cache_dir, symbols_path, config_path, collect_entries)
+    if key not in _annotators:
+        config = get_config(config_path)
+        _annotators[key] = ChakraTestIdAdder(
+            id_mode=id_mode,
+            manifest=LocationBuffer() if collect_entries else None,
+            verbose=False,
+            cache=get_parse_cache(cache_dir, config),
+            symbol_index=get_symbol_index(symbols_path, config),
+            config=config,
+        )
+    processor = _annotators[key]
+    processor.reset_file_state()
+    return processor
+
+
+def annotate_file_content(file_path, content, id_mode='counter', cache_dir=None, symbols_path=None,
+                          config_path=None, collect_entries=False):
+    """Annotate one file's content (text or UTF-8 bytes) in a worker process without touching the disk.
+
+    Returns a dict with the output path and content (bytes when the byte core was used), the added IDs and their
+    component types, whether the parse came from the cache, the naming memo
+    hits and misses, the scan route and, when collect_entries is set, the
+    location entries for the parent's sinks.
+    A content of None streams the file from disk instead (see
+    ChakraTestIdAdder.process_large_file) and writes its output here; the
+    result then has no content but the hash of the output written.
+    """
+    processor = get_annotator(id_mode, cache_dir, symbols_path, config_path, collect_entries)
+    config = processor.config
+    naming_hits, naming_misses = config.naming_hits, config.naming_misses
+    output_path = output_path_for(file_path)
+    result = {'output_path': output_path}
+    if content is None:
+        result['output_hash'] = processor.stream_file(file_path, output_path)
+        result['content'], result['cached'] = None, False
+    else:
+        result['content'], result['cached'] = processor.annotate_data(content, file_path, output_path)
+    result.update({
+        'added_test_ids': processor.added_test_ids,
+        'component_types': processor.component_types,
+        'entries': processor.location_sinks[0].entries if collect_entries else None,
+        'naming_hits': config.naming_hits - naming_hits,
+        'naming_misses': config.naming_misses - naming_misses,
+        'scan_route': processor.scan_route,
+    })
+    return result
+
+
+def read_for_pipeline(file_path, journal=None, stream_threshold=None):
+    """Read a file in an I/O thread; returns (content, input hash, finished journal record or None).
+
+    Files of at least stream_threshold bytes are left on disk for the scanner
+    to stream, and their content is None.
+    """
+    if stream_threshold is not None and os.path.getsize(file_path) >= stream_threshold:
+        if journal is None:
+            return None, None, None
+        content = None
+        input_hash = hash_text_file(file_path)
+    else:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        if journal is None:
+            return content, None, None
+        input_hash = text_hash(content)
+    output_path = output_path_for(file_path)
+    return content, input_hash, journal.is_complete(file_path, input_hash, output_path)
+
+
+def audit_file(file_path, cache_dir=None, symbols_path=None, config_path=None):
+    """Count annotated and missing data-testid attributes per component in one file."""
+    with open(file_path, 'rb') as f:
+        content = f.read()
+
+    config = get_config(config_path)
+    processor = ChakraTestIdAdder(verbose=False, cache=get_parse_cache(cache_dir, config),
+                                  symbol_index=get_symbol_index(symbols_path, config), config=config)
+    return str(file_path), processor.audit_content(content, file_path)
+
+
+def collect_test_ids(file_path, cache_dir=None):
+    """Return (test_id, line, column) for every static data-testid in one file.
+
+    Files are scanned as bytes, decoding only the test IDs and the line
+    prefixes their columns are counted from, unless the parse cache is in use
+    or the file has carriage returns.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    locations = []
+    if b'data-testid' not in data:
+        return str(file_path), locations
+
+    if cache_dir is None and b'\r' not in data:
+        lines = LineIndex(data)
+        for tag in lex_tags_bytes(data):
+            if tag['is_closing']:
+                continue
+            match = BYTE_TESTID_VALUE_PATTERN.search(data, tag['start'], tag['end'])
+            if not match or b'${' in match.group(1):
+                continue
+            locations.append((match.group(1).decode('utf-8'), *lines.locate(tag['start'])))
+        return str(file_path), locations
+
+    content = decode_text(data)
+    tags = parse_content(content, get_parse_cache(cache_dir))[0]
+    lines = LineIndex(content)
+    for tag in tags:
+        if tag['is_closing']:
+            continue
+        # Any element counts here, including hand-written IDs on HTML tags
+        match = TESTID_VALUE_PATTERN.search(content, tag['start'], tag['end'])
+        if not match or '${' in match.group(1):
+            continue
+        locations.append((match.group(1), *lines.locate(tag['start'])))
+
+    return str(file_path), locations
+
+
+class ChakraTestIdAdder:
+    def __init__(self, id_mode='counter', manifest=None, index=None, verbose=True, cache=None, symbol_index=None,
+                 config=None, journal=None, stream_threshold=None):
+        # How test IDs are made unique: 'counter' or 'stable'
+        self.id_mode = id_mode
+        # Files of at least this many bytes are memory-mapped and annotated in chunks
+        self.stream_threshold = stream_threshold
+        # Optional ParseCache holding tag spans and detected components per content hash
+        self.cache = cache
+        # Print detected components; disabled in parallel workers
+        self.verbose = verbose
+        # Optional ManifestWriter and TestIdIndex receiving one entry per located test ID
+        self.location_sinks = [sink for sink in (manifest, index) if sink is not None]
+        # Optional RunJournal; it also keeps each file's entries when there are other sinks to replay them to
+        self.journal = journal
+        if journal is not None and self.location_sinks:
+            self.location_sinks.append(journal)
+        # Optional SymbolIndex; replaces the name-based guess at custom Chakra components
+        self.symbol_index = symbol_index
+        # Compiled project config: packages, extra and ignored components, naming rules
+        self.config = config if config is not None else get_config()
+        # Common Chakra UI packages
+        self.chakra_packages = list(self.config.packages)
+        # Will be populated dynamically from imports
+        self.chakra_components = set()
+        # Track additional custom components that might be chakra-based
+        self.custom_components = set()
+        # Component counts for unique IDs
+        self.component_counts = {}
+        # Added test IDs
+        self.added_test_ids = []
+        # Track component types
+        self.component_types = {}
+        # Whether the last import detection fell back to the config's fallback components
+        self.used_fallback = False
+        # How the last file was annotated (one of SCAN_ROUTES), and files per route in this run
+        self.scan_route = None
+        self.scan_routes = {}
+
+    def extract_chakra_imports(self, content):
+        """Extract Chakra UI component names from import statements, with every configured library's."""
+        detected, custom_components = self.config.detect_imports(content)
+        for library_components in detected.values():
+            self.chakra_components.update(library_components)
+        self.custom_components.update(custom_components)
+
+        if self.verbose:
+            print(f"Detected Chakra UI components: {', '.join(sorted(detected.get(CHAKRA_LIBRARY, ())))}")
+            for library, library_components in detected.items():
+                if library != CHAKRA_LIBRARY:
+                    print(f"Detected {library} components: {', '.join(sorted(library_components))}")
+            if self.custom_components:
+                print(f"Detected potential custom Chakra components: {', '.join(sorted(self.custom_components))}")
+
+        # If no Chakra components were found, use common ones as fallback; resolve_components reports it
+        # unless the symbol index replaces them
+        self.used_fallback = not self.chakra_components
+        if self.used_fallback:
+            self.chakra_components = set(self.config.fallback_components)
+
+        # Add custom components to the list
+        self.chakra_components.update(self.custom_components)
+
+    def resolve_components(self, file_path=None):
+        """Finish the detected components with the symbol index and the config's extra and ignored components.
+
+        The index resolves barrels and path aliases, so it replaces both the
+        package-name match and the name-based guess at custom components.
+        """
+        indexed = None
+        if self.symbol_index is not None and file_path is not None:
+            indexed = self.symbol_index.components_for(file_path)
+        if indexed is not None:
+            # Profile components are not imported by name, so the index cannot find them
+            profile_components = self.chakra_components & self.config.library_components
+            self.chakra_components, self.custom_components = indexed
+            self.chakra_components = self.chakra_components | profile_components
+            if self.verbose:
+                print(f"Detected Chakra UI components (symbol index): {', '.join(sorted(self.chakra_components))}")
+        elif self.used_fallback and self.verbose:
+            fallback_components = self.config.fallback_components
+            print(f"No Chakra UI imports found. Using default components: {', '.join(sorted(fallback_components))}")
+
+        if self.config.extra_components or self.config.ignore_pattern is not None:
+            self.chakra_components = {
+                component for component in self.chakra_components | self.config.extra_components
+                if not self.config.is_ignored(component)
+            }
+
+    def _get_component_description(self, attributes, component_name):
+        """Extract meaningful description from component attributes."""
+        return self.config.base_id(attributes, component_name)
+
+    def _generate_test_id(self, component_name, attributes):
+        """Generate a unique test ID for a component."""
+        base_id = self._get_component_description(attributes, component_name)
+
+        if base_id in self.component_counts:
+            self.component_counts[base_id] += 1
+        else:
+            self.component_counts[base_id] = 1
+
+        test_id = f"{base_id}-{self.component_counts[base_id]}"
+        return self._record_test_id(component_name, test_id)
+
+    def _generate_stable_test_id(self, component_name, attributes, parent_path):
+        """Generate a test ID from a structural fingerprint of the component.
+
+        The fingerprint covers the component name, its key attributes and the
+        names of its ancestors, so inserting an unrelated element elsewhere in
+        the file does not change the ID. Identical fingerprints are resolved
+        deterministically by appending the occurrence number in document order.
+        """
+        base_id = self._get_component_description(attributes, component_name)
+
+        key_attributes = []
+        for match in KEY_ATTRIBUTE_PATTERN.finditer(attributes):
+            value = re.sub(r'\s+', ' ', match.group(2))
+            key_attributes.append(f"{match.group(1)}={value}")
+
+        fingerprint = '|'.join([component_name, '/'.join(parent_path)] + sorted(key_attributes))
+        digest = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:STABLE_HASH_LENGTH]
+
+        test_id = f"{base_id}-{digest}"
+        if test_id in self.component_counts:
+            self.component_counts[test_id] += 1
+            test_id = f"{test_id}-{self.component_counts[test_id]}"
+        else:
+            self.component_counts[test_id] = 1
+
+        return self._record_test_id(component_name, test_id)
+
+    def _record_test_id(self, component_name, test_id):
+        """Record an added test ID and its component type."""
+        self.added_test_ids.append(test_id)
+
+        # Track component types
+        component_type = component_name.lower()
+        self.component_types[component_type] = self.component_types.get(component_type, 0) + 1
+
+        return test_id
+
+    def _tag_test_id(self, tag, tag_attributes, parent_path):
+        """Return (test ID, generated) for a Chakra tag, or None if its existing data-testid is not a literal."""
+        if 'data-testid=' not in tag_attributes:
+            if self.id_mode == 'stable':
+                return self._generate_stable_test_id(tag['component'], tag_attributes, parent_path), True
+            return self._generate_test_id(tag['component'], tag_attributes), True
+
+        existing_match = TESTID_VALUE_PATTERN.search(tag_attributes)
+        if not existing_match:
+            return None
+        return existing_match.group(1), False
+
+    def _report_location(self, test_id, tag, file_path, line, column, parent_id, generated):
+        """Pass the location of a test ID to the manifest, index and journal."""
+        entry = {
+            'test_id': test_id,
+            'component': tag['component'],
+            'file': str(file_path),
+            'line': line,
+            'column': column,
+            'parent_id': parent_id,
+            'generated': generated,
+        }
+        for sink in self.location_sinks:
+            sink.write_entry(entry)
+
+    def _annotate_tag(self, tag, tag_text, parent_path, file_path, locate, units=len):
+        """Name one opening tag of a detected component, report its location and find where its ID goes.
+
+        This is every core's per-tag step. tag_text is the tag's source from
+        "<" up to its closing ">" as text; units measures text in the units of
+        the tag's offsets (len for text, utf8_length for bytes). locate(tag)
+        returns (line, column, parent ID) and is only called when there are
+        location sinks. Returns None when the tag keeps an existing data-testid
+        that is not a literal, else (test ID, insert offset); the offset is None
+        when the ID is already in the source, and otherwise falls after the last
+        attribute, keeping any whitespace before ">" or "/>" so line numbers do
+        not move.
+        """
+        result = self._tag_test_id(tag, tag_text, parent_path)
+        if result is None:
+            return None
+        test_id, generated = result
+        if self.location_sinks:
+            line_no, column, parent_id = locate(tag)
+            self._report_location(test_id, tag, file_path, line_no, column, parent_id, generated)
+        if not generated:
+            return test_id, None
+
+        if tag['is_self_closing']:
+            body = tag_text[:-1]
+            tag_close = tag['end'] - 1
+        else:
+            body = tag_text
+            tag_close = tag['end']
+        return test_id, tag_close - units(body[len(body.rstrip()):])
+
+    def _splice_test_ids(self, source, tags, file_path, lines, decode=None):
+        """Return the pieces of source with data-testid attributes added to the detected components' tags.
+
+        source is text, or UTF-8 bytes, a memoryview or an mmap with decode
+        turning a tag's bytes into text; tags and lines (a LineIndex, or None
+        without location sinks) use its offsets.
+        """
+        units = len if decode is None else utf8_length
+        # Test IDs by tag index, used to report the parent ID of each location
+        tag_test_ids = {}
+        # The characters inserted so far on the line inserted into last
+        inserted_line = inserted_width = 0
+
+        def locate(tag):
+            parent_id = None
+            for ancestor in reversed(tag['ancestors']):
+                if ancestor in tag_test_ids:
+                    parent_id = tag_test_ids[ancestor]
+                    break
+            # Columns refer to the annotated output, whose line numbers match the input
+            line_no, column = lines.locate(tag['start'])
+            if line_no == inserted_line:
+                column += inserted_width
+            return line_no, column, parent_id
+
+        # Tags are visited in document order so counters and fingerprints
+        # do not depend on the iteration order of the component set
+        pieces = []
+        last_pos = 0
+        for index, tag in enumerate(tags):
+            if tag['is_closing'] or tag['component'] not in self.chakra_components:
+                continue
+
+            tag_text = source[tag['start']:tag['end']]
+            if decode is not None:
+                tag_text = decode(tag_text)
+            parent_path = [tags[i]['component'] for i in tag['ancestors']] if self.id_mode == 'stable' else None
+            result = self._annotate_tag(tag, tag_text, parent_path, file_path, locate, units)
+            if result is None:
+                continue
+            test_id, insert_at = result
+            tag_test_ids[index] = test_id
+            if insert_at is None:
+                continue
+
+            attribute = f' data-testid="{test_id}"'
+            pieces.append(source[last_pos:insert_at])
+            pieces.append(attribute if decode is None else attribute.encode('utf-8'))
+            last_pos = insert_at
+            if lines is not None:
+                insert_line = lines.line_of(insert_at)
+                if insert_line != inserted_line:
+                    inserted_line, inserted_width = insert_line, 0
+                # Columns count characters
+                inserted_width += len(attribute)
+
+        pieces.append(source[last_pos:])
+        return pieces
+
+    def annotate_content(self, content, file_path=None, tags=None):
+        """Return content with data-testid attributes added to all Chakra UI components.
+
+        tags may be passed in when they are already known, e.g. from a TagSpanTable.
+        """
+        if tags is None:
+            tags = scan_tags(content)
+        lines = LineIndex(content) if self.location_sinks else None
+        return ''.join(self._splice_test_ids(content, tags, file_path, lines))
+
+    def annotate_bytes(self, data, file_path=None, tags=None):
+        """annotate_content for UTF-8 bytes, a memoryview or an mmap; returns bytes.
+
+        Only the tags of Chakra components are decoded, for naming; everything
+        else is copied through by byte offset. Reported columns still count
+        characters, as annotate_content's do.
+        """
+        if tags is None:
+            tags = scan_tags_bytes(data)
+        lines = LineIndex(bytes(data)) if self.location_sinks else None
+        return b''.join(self._splice_test_ids(data, tags, file_path, lines, decode_utf8))
+
+    def annotate_stream(self, chunks, write, file_path=None):
+        """Annotate content arriving in text chunks, passing the output to write piece by piece.
+
+        Produces the same output and locations as annotate_content while
+        holding only one segment at a time: enclosing tags are kept on a stack
+        of (component, test ID) and line tracking is carried between segments.
+        """
+        # (component, test ID or None) of each open tag, outermost first
+        open_stack = []
+        line_no = 1
+        # Relative to the current segment, so negative when the line began in an earlier one
+        line_start = 0
+        scanned_to = 0
+        line_insertions = []
+        segment = ''
+
+        def locate(tag):
+            nonlocal line_no, line_start, scanned_to, line_insertions
+            newlines = segment.count('\n', scanned_to, tag['start'])
+            if newlines:
+                line_no += newlines
+                line_start = segment.rfind('\n', scanned_to, tag['start']) + 1
+                line_insertions = [ins for ins in line_insertions if ins[0] >= line_start]
+            scanned_to = tag['start']
+
+            parent_id = next((ancestor_id for _, ancestor_id in reversed(open_stack) if ancestor_id is not None), None)
+            column = tag['start'] - line_start + sum(length for _, length in line_insertions) + 1
+            return line_no, column, parent_id
+
+        for segment, tags in lex_stream(chunks):
+            last_pos = 0
+            for tag in tags:
+                component = tag['component']
+                if tag['is_closing']:
+                    # Pop back to the matching opening tag, ignoring stray closers
+                    for depth in range(len(open_stack) - 1, -1, -1):
+                        if open_stack[depth][0] == component:
+                            del open_stack[depth:]
+                            break
+                    continue
+
+                test_id = None
+                if component in self.chakra_components:
+                    parent_path = [name for name, _ in open_stack] if self.id_mode == 'stable' else None
+                    result = self._annotate_tag(tag, segment[tag['start']:tag['end']], parent_path, file_path, locate)
+                    if result is not None:
+                        test_id, insert_at = result
+                        if insert_at is not None:
+                            attribute = f' data-testid="{test_id}"'
+                            write(segment[last_pos:insert_at])
+                            write(attribute)
+                            last_pos = insert_at
+                            line_insertions.append((insert_at, len(attribute)))
+
+                if not tag['is_self_closing']:
+                    open_stack.append((component, test_id))
+
+            write(segment[last_pos:])
+
+            # Rebase line tracking onto the next segment
+            if self.location_sinks:
+                newlines = segment.count('\n', scanned_to)
+                if newlines:
+                    line_no += newlines
+                    line_start = segment.rfind('\n', scanned_to) + 1
+                    line_insertions = [ins for ins in line_insertions if ins[0] >= line_start]
+                shift = len(segment)
+                line_start -= shift
+                scanned_to = 0
+                line_insertions = [(offset - shift, length) for offset, length in line_insertions]
+
+    def reset_file_state(self):
+        """Reset counters and detected components before processing another file."""
+        self.component_counts = {}
+        self.added_test_ids = []
+        self.component_types = {}
+        self.chakra_components = set()
+        self.custom_components = set()
+        self.used_fallback = False
+
+    def audit_content(self, content, file_path=None):
+        """Return {component: [annotated, missing]} for the Chakra UI components in content.
+
+        UTF-8 bytes are audited without decoding unless the parse cache, which keys text, is in use.
+        """
+        if isinstance(content, bytes) and self.cache is not None:
+            content = decode_text(content)
+        if isinstance(content, bytes):
+            tags, self.chakra_components, self.custom_components = parse_bytes(content, self, file_path)
+            testid_pattern = BYTE_TESTID_MARKER_PATTERN
+        else:
+            tags, self.chakra_components, self.custom_components = parse_content(content, self.cache, self)
+            self.resolve_components(file_path)
+            testid_pattern = TESTID_MARKER_PATTERN
+
+        counts = {}
+        for tag in tags:
+            if tag['is_closing'] or tag['component'] not in self.chakra_components:
+                continue
+            component_counts = counts.setdefault(tag['component'], [0, 0])
+            if testid_pattern.search(content, tag['start'], tag['end']):
+                component_counts[0] += 1
+            else:
+                component_counts[1] += 1
+
+        return counts
+
+    def process_file(self, file_path):
+        """Process a JSX file to add data-testid attributes to all Chakra UI components."""
+        if self.stream_threshold is not None and os.path.getsize(file_path) >= self.stream_threshold:
+            return self.process_large_file(file_path)
+
+        print(f"\nProcessing file: {file_path}")
+
+        self.reset_file_state()
+
+        # Read the file content; it is only decoded if the byte core cannot be used
+        with open(file_path, 'rb') as f:
+            content = f.read()
+
+        # Output file; reported locations point here since it holds the test IDs
+        output_path = output_path_for(file_path)
+
+        # Files finished before an interrupted run stopped are only replayed to the sinks
+        if self.journal is not None:
+            input_hash = text_hash(content)
+            if self._replay_journal(file_path, input_hash, output_path):
+                return 0
+
+        modified_content = self.annotate_data(content, file_path, output_path)[0]
+        self.scan_routes[self.scan_route] = self.scan_routes.get(self.scan_route, 0) + 1
+
+        write_atomic(output_path, modified_content)
+
+        if self.journal is not None:
+            self.journal.record(file_path, input_hash, output_path, text_hash(modified_content))
+
+        print(f"✅ Added {len(self.added_test_ids)} data-testid attributes")
+        print(f"✅ Modified file saved as: {output_path}")
+
+        return len(self.added_test_ids)
+
+    def annotate_data(self, content, file_path, output_path):
+        """Detect components in and annotate one file's text or UTF-8 bytes; returns (output, cached).
+
+        Bytes go through the byte core and give bytes, unless they need
+        newline translation or the parse cache (which keys text) is in use;
+        then they are decoded and annotated as text. Bytes where no tag can
+        name a component are returned as they are, unscanned. The route taken
+        is left in self.scan_route. Locations are reported against output_path.
+        """
+        if isinstance(content, bytes) and (self.cache is not None or b'\r' in content):
+            content = decode_text(content)
+
+        # Extract Chakra UI components and tag spans, from the cache when possible
+        hits = self.cache.hits if self.cache is not None else 0
+        if isinstance(content, bytes):
+            tags, self.chakra_components, self.custom_components = parse_bytes(content, self, file_path)
+        else:
+            tags, self.chakra_components, self.custom_components = parse_content(content, self.cache, self)
+            self.scan_route = 'text'
+        cached = self.cache is not None and self.cache.hits > hits
+        if self.verbose and cached:
+            print(f"Detected Chakra UI components (cached): {', '.join(sorted(self.chakra_components))}")
+        if self.scan_route == 'text':
+            self.resolve_components(file_path)
+
+        for sink in self.location_sinks:
+            if hasattr(sink, 'begin_file'):
+                sink.begin_file(output_path)
+
+        if self.scan_route == 'skip':
+            return content, cached
+        if isinstance(content, bytes):
+            return self.annotate_bytes(content, output_path, tags), cached
+        return self.annotate_content(content, output_path, tags), cached
+
+    def process_large_file(self, file_path):
+        """Annotate a file too large to read whole: it is memory-mapped, scanned in chunks and written as it goes.
+
+        Peak memory stays at about one chunk plus the IDs added, whatever the
+        file size. The parse cache is not used, since it stores every tag span.
+        """
+        print(f"\nProcessing file (streamed): {file_path}")
+
+        self.reset_file_state()
+        output_path = output_path_for(file_path)
+
+        if self.journal is not None:
+            input_hash = hash_text_file(file_path)
+            if self._replay_journal(file_path, input_hash, output_path):
+                return 0
+
+        output_hash = self.stream_file(file_path, output_path)
+        self.scan_routes['stream'] = self.scan_routes.get('stream', 0) + 1
+        if self.journal is not None:
+            self.journal.record(file_path, input_hash, output_path, output_hash)
+
+        print(f"✅ Added {len(self.added_test_ids)} data-testid attributes")
+        print(f"✅ Modified file saved as: {output_path}")
+
+        return len(self.added_test_ids)
+
+    def stream_file(self, file_path, output_path):
+        """Detect imports in, annotate and atomically write one memory-mapped file; returns the output hash."""
+        output_digest = hashlib.sha1()
+        self.scan_route = 'stream'
+        with open(file_path, 'rb') as f, map_file(f) as mapped:
+            self.extract_chakra_imports(read_import_statements(mapped))
+            self.resolve_components(file_path)
+
+            for sink in self.location_sinks:
+                if hasattr(sink, 'begin_file'):
+                    sink.begin_file(output_path)
+
+            with open_atomic(output_path) as out:
+                def write(piece):
+                    data = piece.encode('utf-8')
+                    out.write(data)
+                    output_digest.update(data)
+
+                self.annotate_stream(iter_text_chunks(mapped), write, output_path)
+
+        return output_digest.hexdigest()
+
+    def _replay_journal(self, file_path, input_hash, output_path):
+        """Replay a file finished before an interrupted run stopped to the sinks; False if it was not."""
+        record = self.journal.is_complete(file_path, input_hash, output_path)
+        if record is None:
+            return False
+
+        for sink in self.location_sinks:
+            if sink is self.journal:
+                continue
+            if hasattr(sink, 'begin_file'):
+                sink.begin_file(output_path)
+            for entry in record.get('entries', ()):
+                sink.write_entry(entry)
+        self.journal.record(file_path, input_hash, output_path, record['output'])
+        self.journal.skipped += 1
+        print(f"⏭️  Already done before the interrupted run stopped: {output_path}")
+        return True
+
+    def print_summary(self):
+        """Print summary of added test IDs."""
+        print("\nSummary of added test IDs by component type:")
+
+        for component, count in sorted(self.component_types.items()):
+            print(f"  {component}: {count}")
+
+        print("\nSample of added test IDs:")
+        for i, test_id in enumerate(self.added_test_ids[:10]):
+            print(f"  {i+1}. {test_id}")
+
+        if len(self.added_test_ids) > 10:
+            print(f"  ... and {len(self.added_test_ids) - 10} more")
@@ -0,0 +1,95 @@
+"""
+On-disk parse cache of tag spans and detected components, used by --cache.
+"""
+import array
+import hashlib
+import marshal
+import sys
+from pathlib import Path
+
+from . import TOOL_VERSION
+from .config import get_config
+from .files import write_atomic
+from .scanner import link_ancestors
+
+# Default directory of the on-disk parse cache used by --cache
+DEFAULT_CACHE_DIR = '.testid_cache'
+
+
+class ParseCache:
+    """On-disk cache of tag spans and detected components, keyed by content hash.
+
+    Entries are marshalled tuples holding the component names, the distinct
+    JSX nestings, the tag spans packed as an int32 array of (start, end,
+    name index, nesting index, flags) and the detected Chakra and custom components. The key covers the tool version,
+    the Python version (marshal's format) and the config settings that affect
+    detection, so stale entries are never read; ancestors are relinked on load.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, detection_key=''):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.key_prefix = f"{TOOL_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}:{detection_key}:".encode('utf-8')
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, content):
+        digest = hashlib.sha1(self.key_prefix + content.encode('utf-8', 'surrogatepass')).hexdigest()
+        return self.cache_dir / digest[:2] / digest[2:]
+
+    def load(self, content):
+        """Return (tags, chakra_components, custom_components) for content, or None."""
+        try:
+            with open(self._entry_path(content), 'rb') as f:
+                names, contexts, packed_tags, chakra_components, custom_components = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            self.misses += 1
+            return None
+
+        spans = array.array('i')
+        spans.frombytes(packed_tags)
+        tags = []
+        for i in range(0, len(spans), 5):
+            flags = spans[i + 4]
+            tags.append({
+                'start': spans[i],
+                'end': spans[i + 1],
+                'component': names[spans[i + 2]],
+                'is_closing': bool(flags & 1),
+                'is_self_closing': bool(flags & 2),
+                'context': contexts[spans[i + 3]],
+            })
+
+        self.hits += 1
+        return link_ancestors(tags), set(chakra_components), set(custom_components)
+
+    def store(self, content, tags, chakra_components, custom_components):
+        """Write the parse result for content, atomically."""
+        name_indices = {}
+        context_indices = {}
+        spans = array.array('i')
+        for tag in tags:
+            name_index = name_indices.setdefault(tag['component'], len(name_indices))
+            context_index = context_indices.setdefault(tag['context'], len(context_indices))
+            spans.extend((tag['start'], tag['end'], name_index, context_index,
+                          int(tag['is_closing']) | (int(tag['is_self_closing']) << 1)))
+
+        entry = (tuple(name_indices), tuple(context_indices), spans.tobytes(), tuple(sorted(chakra_components)),
+                 tuple(sorted(custom_components)))
+        entry_path = self._entry_path(content)
+        entry_path.parent.mkdir(exist_ok=True)
+        write_atomic(entry_path, marshal.dumps(entry))
+
+
+# One ParseCache per cache directory in each worker process
+_parse_caches = {}
+
+
+def get_parse_cache(cache_dir, config=None):
+    """Return this process's ParseCache for cache_dir and config, or None when caching is off."""
+    if cache_dir is None:
+        return None
+    key = (cache_dir, (config or get_config()).detection_key)
+    if key not in _parse_caches:
+        _parse_caches[key] = ParseCache(cache_dir, key[1])
+    return _parse_caches[key]
@@ -0,0 +1,876 @@
+"""
+Command line of the testid package: add data-testid attributes to Chakra UI components in JSX files.
+Run it as add_test_ids_final.py next to the package or with python -m testid.
+
+Usage: python add_test_ids_final.py [annotate] [file.jsx ...] [options]
+       python add_test_ids_final.py lookup <test-id> [--prefix] [--index PATH]
+       python add_test_ids_final.py audit [path ...] [--jobs N] [--fail-under PCT]
+       python add_test_ids_final.py duplicates [path ...] [--scope global|file|directory|route:GLOB]
+       python add_test_ids_final.py strip [path ...] [--jobs N] [--dry-run]
+       python add_test_ids_final.py renumber [path ...] [--manifest out.ndjson] [--mapping map.json]
+       python add_test_ids_final.py watch [path ...] [--interval SECONDS]
+       python add_test_ids_final.py bench [path ...] [--repeat N] [--strategy NAME ...]
+Annotate options:
+  --id-mode counter: Number IDs per description in document order (default)
+  --id-mode stable: Derive IDs from a structural fingerprint so they do not churn between runs
+  --manifest: Stream test ID locations as NDJSON and write a compact JSON index next to it
+  --index: Keep a SQLite index from test ID to file, line, column and component up to date
+  --jobs N: Read ahead and write behind on I/O threads while N worker processes scan, scheduled
+    like the pool commands below; --stats reports the workers' utilisation
+  --resume: Journal finished files so an interrupted run continues where it stopped
+  --stream [MIB]: Memory-map files of at least MIB MiB (default 32) and annotate them in chunks,
+    writing output as it goes, so peak memory does not grow with file size
+  --strategy NAME: Scan with an earlier script's strategy instead (v6_multiline, v6, v5, v4, fixed,
+    parser, advanced, basic), writing {stem}_{NAME}_result; other options are ignored
+Paths may be files or directories; directories are searched for JSX/TSX files.
+Annotated output goes next to each file as {stem}_final_result with the file's own extension,
+so Foo.js, Foo.jsx and Foo.tsx in one directory never share an output.
+Audit, duplicates, strip and renumber run in a process pool (--jobs N), largest files first with
+small files batched together; results are still reported in path order so output is identical
+across runs. --stats reports per-worker utilisation, the slowest file and the reorder buffer peak.
+Directory searches skip hidden directories, node_modules and build output (storybook-static,
+dist, build, coverage) and honour .gitignore and .testidignore files.
+Audit is read-only and reports data-testid coverage per file and per component.
+Duplicates is read-only and reports test IDs used more than once within a scope.
+Strip removes data-testid attributes in place (e.g. for production builds).
+Renumber rewrites generated counter IDs in place so each base is numbered 1..n in document order.
+With --manifest, an ID counts as generated only in the annotated output it was generated for.
+Watch keeps annotated outputs current, re-lexing only the edited region of each changed file.
+Files are scanned as UTF-8 bytes, decoding only the tags that need naming; text is decoded when
+--cache is used or the file has carriage returns. Files where no tag names a detected component
+are copied through unscanned. Bench times this byte core, with and without that skip, against
+the text core on the same files, in memory, and checks their outputs are identical; with
+--strategy it also times the earlier scripts' strategies side by side ("all" for every one).
+--cache [DIR] (annotate, audit, duplicates, strip, renumber) reuses tag spans and detected
+components stored on disk by content hash, so back-to-back reports parse each file once.
+--symbols [PATH] (annotate, audit) indexes exports across --project-root so custom components
+built on Chakra (forwardRef around Box, chakra('div'), barrel re-exports) are annotated too.
+Imports are followed through barrels and tsconfig/jsconfig "paths" aliases, so Chakra
+re-exported from e.g. "@/ui" is recognised; only files changed since the last run are re-summarized.
+--config PATH (annotate, audit, watch) reads packages, extra and ignored components, fallback
+components, custom-component suffixes and naming priority from .testidrc.json or
+[tool.testid] in pyproject.toml; it is validated and compiled once per process.
+Its "html" setting also annotates plain HTML elements (div, button, input, ...) in the same scan,
+with naming priorities per element kind, e.g. {"html": {"elements": true}} for the v10 list.
+Tags inside comments and string or template literals in code (not JSX text) are never annotated.
+Its "libraries" setting adds design-system profiles (packages and components) next to Chakra's, so
+a repo mixing Chakra with other or in-house libraries is annotated in one run.
+"""
+import argparse
+import collections
+import contextlib
+import fnmatch
+import functools
+import io
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from . import TOOL_VERSION
+from .annotator import (
+    SCAN_ROUTES, ChakraTestIdAdder, annotate_file_content, audit_file, collect_test_ids, parse_bytes, parse_content,
+    read_for_pipeline)
+from .cache import DEFAULT_CACHE_DIR, get_parse_cache
+from .config import CONFIG_FILE_NAME, PYPROJECT_TABLE, find_config_path, get_config
+from .edits import renumber_file, strip_file
+from .files import (
+    OUTPUT_SUFFIXES, find_missing_path, iter_jsx_files, iter_sized_jsx_files, output_path_for, write_atomic)
+from .pool import REORDER_BUFFER_SIZE, SCHEDULE_WINDOW, WorkerStats, plan_batches, run_batch, run_in_pool
+from .scanner import TagSpanTable, decode_text, text_hash
+from .sinks import DEFAULT_INDEX_PATH, DEFAULT_JOURNAL_PATH, ManifestWriter, RunJournal, TestIdIndex, load_generated_ids
+from .strategies import STRATEGIES, get_strategy
+from .symbols import DEFAULT_SYMBOL_INDEX_PATH, get_symbol_index
+
+# Import statements; edits before the last one may change the detected components
+IMPORT_STATEMENT_PATTERN = re.compile(r'^import\s[^;]*?[\'"][^\'"]+[\'"];?', re.MULTILINE)
+
+# Threads reading inputs and writing outputs in the annotate pipeline
+IO_THREADS = 4
+
+# Files of at least this many MiB are streamed by annotate --stream
+DEFAULT_STREAM_THRESHOLD_MB = 32
+
+
+def scope_key(file_path, scope):
+    """Return the group within which test IDs must be unique for a file."""
+    if scope == 'global':
+        return ''
+    if scope == 'file':
+        return file_path
+    if scope == 'directory':
+        return os.path.dirname(file_path)
+
+    # route:GLOB - unique per nearest enclosing directory matching GLOB
+    pattern = scope.split(':', 1)[1]
+    directory = Path(file_path).parent
+    for candidate in [directory] + list(directory.parents):
+        if fnmatch.fnmatch(candidate.as_posix(), pattern) or fnmatch.fnmatch(candidate.name, pattern):
+            return candidate.as_posix()
+    return ''
+
+
+def run_annotate_pipeline(sized_files, args, sinks, journal=None, scan_routes=None, stats=None):
+    """Annotate (path, size) pairs with reads, scanning and writes overlapped; returns (files, IDs added, cache hits).
+
+    Files are scheduled as run_in_pool schedules them: windows of
+    SCHEDULE_WINDOW are split by plan_batches, so the largest files start
+    first and small files share a task, with at most jobs * 4 batches read
+    or scanning at once. I/O threads read each batch's files, a worker
+    process annotates the batch, and I/O threads write the outputs. Results
+    wait in a reorder buffer bounded like run_in_pool's and are taken in path
+    order, so sinks, the journal and the log match a sequential run. A file
+    is only journaled after its output is on disk. The workers' naming memo
+    counts are added to this process's config, files per scan route to
+    scan_routes and batch timings to stats when given.
+    """
+    jobs = args.jobs or os.cpu_count() or 1
+    config = get_config(args.config)
+    stream_threshold = stream_threshold_bytes(args.stream)
+    scan = functools.partial(annotate_file_content, id_mode=args.id_mode, cache_dir=args.cache,
+                             symbols_path=args.symbols, config_path=args.config,
+                             collect_entries=bool(sinks))
+    batch_scan = functools.partial(run_batch, scan)
+    sized_files = iter(sized_files)
+    queued = collections.deque()
+    # [(sequence, file_path, read future)] per batch whose files are being read
+    loading = []
+    # scan future -> (sequence, file_path, input_hash) of the files in its batch
+    pending = {}
+    # sequence -> (file_path, input_hash, scan result or finished journal record)
+    buffered = {}
+    # (future, file_path, output_path, input_hash, output_hash, entries to journal)
+    writes = collections.deque()
+    component_types = {}
+    file_count = added_total = cache_hits = 0
+    discovered = emitted = 0
+    exhausted = False
+
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=IO_THREADS) as io_pool, \
+            concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as cpu_pool:
+        while True:
+            if not queued and not exhausted and discovered - emitted + SCHEDULE_WINDOW <= REORDER_BUFFER_SIZE:
+                window = list(itertools.islice(sized_files, SCHEDULE_WINDOW))
+                exhausted = len(window) < SCHEDULE_WINDOW
+                numbered = [((discovered + i, file_path), size) for i, (file_path, size) in enumerate(window)]
+                discovered += len(window)
+                queued.extend(plan_batches(numbered, jobs))
+            while queued and len(loading) + len(pending) < jobs * 4:
+                loading.append([(sequence, file_path,
+                                 io_pool.submit(read_for_pipeline, file_path, journal, stream_threshold))
+                                for sequence, file_path in queued.popleft()])
+
+            progress = True
+            while progress:
+                progress = False
+                for reads in [reads for reads in loading if all(future.done() for _, _, future in reads)]:
+                    loading.remove(reads)
+                    batch = []
+                    contents = []
+                    for sequence, file_path, future in reads:
+                        content, input_hash, record = future.result()
+                        if record is not None:
+                            # Finished before an interrupted run stopped; replayed in order below
+                            buffered[sequence] = (file_path, input_hash, record)
+                        else:
+                            batch.append((sequence, file_path, input_hash))
+                            contents.append(content)
+                    if batch:
+                        future = cpu_pool.submit(batch_scan, [file_path for _, file_path, _ in batch], contents)
+                        pending[future] = batch
+                    progress = True
+
+                for future in [future for future in pending if future.done()]:
+                    pid, busy, slowest, results = future.result()
+                    for (sequence, file_path, input_hash), result in zip(pending.pop(future), results):
+                        buffered[sequence] = (file_path, input_hash, result)
+                    if stats is not None:
+                        stats.record(pid, busy, slowest, len(results))
+                    progress = True
+                if stats is not None:
+                    stats.peak_buffered = max(stats.peak_buffered, len(buffered))
+
+                while emitted in buffered and len(writes) < IO_THREADS * 2:
+                    file_path, input_hash, result = buffered.pop(emitted)
+                    emitted += 1
+                    file_count += 1
+                    if 'output' in result:
+                        output_path = output_path_for(file_path)
+                        entries = result.get('entries', ())
+                        journal.skipped += 1
+                        print(f"⏭️  Already done before the interrupted run stopped: {output_path}")
+                        write_future = concurrent.futures.Future()
+                        write_future.set_result(None)
+                        output_hash = result['output']
+                    else:
+                        output_path = result['output_path']
+                        entries = result['entries'] or ()
+                        added_total += len(result['added_test_ids'])
+                        cache_hits += result['cached']
+                        config.naming_hits += result['naming_hits']
+                        config.naming_misses += result['naming_misses']
+                        if scan_routes is not None:
+                            scan_routes[result['scan_route']] = scan_routes.get(result['scan_route'], 0) + 1
+                        for component, count in result['component_types'].items():
+                            component_types[component] = component_types.get(component, 0) + count
+                        print(f"✅ {file_path}: added {len(result['added_test_ids'])} data-testid attributes "
+                              f"-> {output_path}")
+                        if result['content'] is None:
+                            # Streamed files are written by the scanner
+                            write_future = concurrent.futures.Future()
+                            write_future.set_result(None)
+                            output_hash = result['output_hash']
+                        else:
+                            write_future = io_pool.submit(write_atomic, output_path, result['content'])
+                            output_hash = None
+                            if journal is not None:
+                                output_hash = text_hash(result['content'])
+
+                    for sink in sinks:
+                        if hasattr(sink, 'begin_file'):
+                            sink.begin_file(output_path)
+                        for entry in entries:
+                            sink.write_entry(entry)
+                    writes.append((write_future, file_path, output_path, input_hash, output_hash,
+                                   entries if sinks else None))
+                    progress = True
+
+                while writes and writes[0][0].done():
+                    write_future, file_path, output_path, input_hash, output_hash, entries = writes.popleft()
+                    write_future.result()
+                    if journal is not None:
+                        journal.record(file_path, input_hash, output_path, output_hash, entries)
+                    progress = True
+
+            # Wait for a read, a scan or the oldest write; everything else is already done
+            waiting = [future for reads in loading for _, _, future in reads if not future.done()]
+            waiting += pending
+            waiting += [writes[0][0]] if writes and not writes[0][0].done() else []
+            if waiting:
+                concurrent.futures.wait(waiting, return_when=concurrent.futures.FIRST_COMPLETED)
+            elif exhausted and not (queued or loading or pending or buffered or writes):
+                break
+
+    if component_types:
+        print("\nSummary of added test IDs by component type:")
+        for component, count in sorted(component_types.items()):
+            print(f"  {component}: {count}")
+    return file_count, added_total, cache_hits
+
+
+def stream_threshold_bytes(threshold_mb):
+    """Return the --stream threshold in bytes, or None when streaming is off."""
+    return None if threshold_mb is None else int(threshold_mb * (1 << 20))
+
+
+def run_strategy(name, jsx_files):
+    """Annotate files with an earlier script's strategy, writing {stem}_{name}_result next to each."""
+    annotate = get_strategy(name)
+    added_total = file_count = 0
+    for jsx_file in jsx_files:
+        file_count += 1
+        print(f"\nProcessing file ({name}): {jsx_file}")
+        with open(jsx_file, 'rb') as f:
+            modified_content, added = annotate(decode_text(f.read()))
+        added_total += added
+
+        output_path = output_path_for(jsx_file, OUTPUT_SUFFIXES[name])
+        write_atomic(output_path, modified_content)
+
+        print(f"✅ Added {added} data-testid attributes")
+        print(f"✅ Modified file saved as: {output_path}")
+
+    print(f"\n✅ Added {added_total} data-testid attributes across {file_count} files ({name} strategy)")
+    return 0
+
+
+def run_annotate(args):
+    """Add data-testid attributes to the given files."""
+    # Directory of add_test_ids_final.py, which sits next to this package
+    script_dir = Path(__file__).parent.parent
+
+    # JSX files with their sizes for scheduling, discovered as the run goes; only the first is found
+    # up front, and the test file next to the script stands in when there is none
+    missing = find_missing_path(args.files)
+    if missing is None:
+        sized_files = iter_sized_jsx_files(args.files)
+        first = next(sized_files, None)
+        if first is None:
+            first = (script_dir / "test.jsx", 0)
+            missing = find_missing_path([first[0]])
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+    sized_files = itertools.chain([first], sized_files)
+
+    if args.strategy != 'final':
+        return run_strategy(args.strategy, (jsx_file for jsx_file, _ in sized_files))
+
+    manifest = ManifestWriter(args.manifest, args.manifest_index) if args.manifest else None
+    index = TestIdIndex(args.index) if args.index else None
+    config = get_config(args.config)
+    cache = get_parse_cache(args.cache, config)
+    symbol_index = build_symbol_index(args.symbols, args.project_root, config) if args.symbols else None
+
+    # A journal is only resumed by a run that would write the same outputs and entries
+    journal = None
+    if args.resume:
+        settings_key = f"{TOOL_VERSION}:{args.id_mode}:{config.settings_key}:{bool(args.symbols)}:" \
+                       f"{bool(manifest or index)}"
+        journal = RunJournal(args.resume, settings_key)
+        if journal.completed:
+            print(f"↩️  Resuming from {journal.journal_path}: {len(journal.completed)} files already done")
+
+    # Process the files
+    processor = ChakraTestIdAdder(id_mode=args.id_mode, manifest=manifest, index=index, cache=cache,
+                                  symbol_index=symbol_index, config=config, journal=journal,
+                                  stream_threshold=stream_threshold_bytes(args.stream))
+    finished = False
+    try:
+        if args.jobs:
+            sinks = [sink for sink in (manifest, index) if sink is not None]
+            stats = WorkerStats() if args.stats else None
+            file_count, added_total, cache_hits = run_annotate_pipeline(sized_files, args, sinks, journal,
+                                                                        processor.scan_routes, stats)
+            print(f"\n✅ Added {added_total} data-testid attributes across {file_count} files")
+            if stats is not None:
+                stats.print_report()
+            if cache is not None:
+                cache.hits += cache_hits
+                cache.misses += file_count - cache_hits - (journal.skipped if journal else 0)
+        else:
+            for jsx_file, _ in sized_files:
+                num_added = processor.process_file(jsx_file)
+
+                if num_added > 0:
+                    processor.print_summary()
+        finished = True
+    finally:
+        if journal is not None:
+            journal.close(finished)
+            if journal.skipped:
+                print(f"\n✅ Skipped {journal.skipped} files finished before the interrupted run")
+        if manifest is not None:
+            manifest.close()
+            print(f"\n✅ Wrote {manifest.entry_count} manifest entries to {manifest.manifest_path}")
+            print(f"✅ Wrote manifest index to {manifest.index_path}")
+        if index is not None:
+            index.close()
+            print(f"✅ Indexed {index.entry_count} test IDs in {index.index_path}")
+        if cache is not None:
+            print(f"✅ Parse cache: {cache.hits} hits, {cache.misses} misses in {cache.cache_dir}")
+        lookups = config.naming_hits + config.naming_misses
+        if lookups:
+            print(f"✅ Naming memo: {config.naming_hits} hits, {config.naming_misses} misses "
+                  f"({100.0 * config.naming_hits / lookups:.1f}% hit rate)")
+        if processor.scan_routes:
+            routes = ', '.join(f"{processor.scan_routes[route]} {route}" for route in SCAN_ROUTES
+                               if route in processor.scan_routes)
+            print(f"✅ Scan routes: {routes}")
+
+    return 0
+
+
+def build_symbol_index(index_path, project_root, config=None):
+    """Bring the symbol index at index_path up to date with project_root and save it."""
+    symbol_index = get_symbol_index(index_path, config)
+    symbol_index.build(project_root)
+    symbol_index.save()
+    print(f"✅ Symbol index: re-summarized {symbol_index.summarized} of {len(symbol_index.modules)} modules "
+          f"in {symbol_index.index_path}")
+    return symbol_index
+
+
+def run_lookup(args):
+    """Print where a test ID is defined using the SQLite index."""
+    if not Path(args.index).exists():
+        print(f"Error: Index not found: {args.index} (run annotate with --index first)")
+        return 1
+
+    index = TestIdIndex(args.index)
+    try:
+        rows = index.lookup(args.test_id, prefix=args.prefix)
+    finally:
+        index.close()
+
+    if not rows:
+        print(f"No locations found for {args.test_id}")
+        return 1
+
+    for test_id, path, line, column, component in rows:
+        print(f"{path}:{line}:{column}  {test_id}  <{component}>")
+
+    return 0
+
+
+def format_coverage(annotated, missing):
+    """Format annotated/total counts with a coverage percentage."""
+    total = annotated + missing
+    percent = 100.0 * annotated / total if total else 100.0
+    return f"{annotated}/{total} ({percent:.1f}%)"
+
+
+def run_audit(args):
+    """Report data-testid coverage without writing any files."""
+    missing = find_missing_path(args.paths)
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+
+    # Workers load the index from disk, so build and save it first
+    if args.symbols:
+        build_symbol_index(args.symbols, args.project_root, get_config(args.config))
+
+    component_totals = {}
+    total_annotated = total_missing = file_count = 0
+
+    # Results arrive in path order, so each file's line is printed as soon as it is ready
+    print("\nCoverage by file:")
+    stats = WorkerStats() if args.stats else None
+    worker = functools.partial(audit_file, cache_dir=args.cache, symbols_path=args.symbols,
+                               config_path=args.config)
+    for file_path, counts in run_in_pool(worker, iter_sized_jsx_files(args.paths), args.jobs, stats):
+        file_count += 1
+        annotated = sum(c[0] for c in counts.values())
+        missing = sum(c[1] for c in counts.values())
+        total_annotated += annotated
+        total_missing += missing
+        for component, (component_annotated, component_missing) in counts.items():
+            totals = component_totals.setdefault(component, [0, 0])
+            totals[0] += component_annotated
+            totals[1] += component_missing
+        if annotated or missing:
+            print(f"  {file_path}: {format_coverage(annotated, missing)}")
+
+    print("\nCoverage by component:")
+    for component, (annotated, missing) in sorted(component_totals.items()):
+        print(f"  {component}: {format_coverage(annotated, missing)}")
+
+    total = total_annotated + total_missing
+    coverage = 100.0 * total_annotated / total if total else 100.0
+    print(f"\nOverall: {format_coverage(total_annotated, total_missing)} "
+          f"elements have a data-testid across {file_count} files")
+
+    if stats is not None:
+        stats.print_report()
+
+    if args.fail_under is not None and coverage < args.fail_under:
+        print(f"❌ Coverage {coverage:.1f}% is below the required {args.fail_under:.1f}%")
+        return 1
+
+    return 0
+
+
+def run_duplicates(args):
+    """Report test IDs that appear more than once within a file or scope."""
+    if not (args.scope in ('global', 'file', 'directory') or args.scope.startswith('route:')):
+        print(f"Error: Unknown scope: {args.scope} (use global, file, directory or route:GLOB)")
+        return 1
+
+    missing = find_missing_path(args.paths)
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+
+    # Inverted index: scope -> test ID -> [(file, line, column), ...]
+    inverted_index = {}
+    id_count = file_count = 0
+    stats = WorkerStats() if args.stats else None
+    worker = functools.partial(collect_test_ids, cache_dir=args.cache)
+    for file_path, locations in run_in_pool(worker, iter_sized_jsx_files(args.paths), args.jobs, stats):
+        scope_ids = inverted_index.setdefault(scope_key(file_path, args.scope), {})
+        for test_id, line, column in locations:
+            scope_ids.setdefault(test_id, []).append((file_path, line, column))
+        id_count += len(locations)
+        file_count += 1
+
+    duplicate_count = 0
+    for scope in sorted(inverted_index):
+        duplicates = {test_id: locations for test_id, locations in inverted_index[scope].items()
+                      if len(locations) > 1}
+        if not duplicates:
+            continue
+
+        print(f"\nDuplicates in {scope or 'repository'}:")
+        for test_id, locations in sorted(duplicates.items()):
+            kind = 'within file' if len({location[0] for location in locations}) == 1 else 'across files'
+            print(f"  {test_id} ({len(locations)}x, {kind})")
+            for file_path, line, column in sorted(locations):
+                print(f"    {file_path}:{line}:{column}")
+        duplicate_count += len(duplicates)
+
+    print(f"\nChecked {id_count} test IDs in {file_count} files: {duplicate_count} duplicated")
+    if stats is not None:
+        stats.print_report()
+    return 1 if duplicate_count else 0
+
+
+def run_strip(args):
+    """Remove data-testid attributes from every file in place."""
+    missing = find_missing_path(args.paths)
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+
+    changed_files = 0
+    removed_total = file_count = 0
+    stats = WorkerStats() if args.stats else None
+    worker = functools.partial(strip_file, dry_run=args.dry_run, cache_dir=args.cache)
+    for file_path, removed in run_in_pool(worker, iter_sized_jsx_files(args.paths), args.jobs, stats):
+        file_count += 1
+        if removed:
+            changed_files += 1
+            removed_total += removed
+            if args.verbose:
+                print(f"  {file_path}: removed {removed}")
+
+    action = 'Would remove' if args.dry_run else 'Removed'
+    print(f"✅ {action} {removed_total} data-testid attributes from {changed_files} of {file_count} files")
+    if stats is not None:
+        stats.print_report()
+    return 0
+
+
+def run_renumber(args):
+    """Renumber generated IDs in document order and write an old-to-new mapping."""
+    missing = find_missing_path(args.paths)
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+
+    try:
+        generated_ids = load_generated_ids(args.manifest) if args.manifest else None
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 1
+
+    # file -> {old_id: new_id}
+    mapping = {}
+    renamed_total = file_count = 0
+    stats = WorkerStats() if args.stats else None
+    worker = functools.partial(renumber_file, generated_ids=generated_ids, dry_run=args.dry_run,
+                               cache_dir=args.cache)
+    for file_path, changes in run_in_pool(worker, iter_sized_jsx_files(args.paths), args.jobs, stats):
+        file_count += 1
+        if not changes:
+            continue
+        file_mapping = mapping.setdefault(file_path, {})
+        for old_id, new_id, line in changes:
+            if old_id in file_mapping:
+                print(f"⚠️  {file_path}:{line}: {old_id} is duplicated; mapping keeps its first occurrence")
+                continue
+            file_mapping[old_id] = new_id
+        renamed_total += len(changes)
+        if args.verbose:
+            for old_id, new_id, line in changes:
+                print(f"  {file_path}:{line}: {old_id} -> {new_id}")
+
+    if args.mapping:
+        with open(args.mapping, 'w') as f:
+            json.dump(mapping, f, indent=2, sort_keys=True)
+        print(f"✅ Wrote old-to-new ID mapping to {args.mapping}")
+
+    action = 'Would renumber' if args.dry_run else 'Renumbered'
+    print(f"✅ {action} {renamed_total} test IDs in {len(mapping)} of {file_count} files")
+    if stats is not None:
+        stats.print_report()
+    return 0
+
+
+def run_watch(args):
+    """Re-annotate files as they change, re-lexing only the edited regions."""
+    missing = find_missing_path(args.paths)
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+    jsx_files = list(iter_jsx_files(args.paths))
+
+    processor = ChakraTestIdAdder(id_mode=args.id_mode, verbose=False, config=get_config(args.config))
+    # Per-file state kept between polls
+    tables = {}
+    mtimes = {}
+    components = {}
+    import_ends = {}
+
+    print(f"👀 Watching {len(jsx_files)} files (Ctrl+C to stop)")
+    try:
+        while True:
+            for jsx_file in jsx_files:
+                try:
+                    mtime = os.stat(jsx_file).st_mtime_ns
+                except FileNotFoundError:
+                    tables.pop(jsx_file, None)
+                    mtimes.pop(jsx_file, None)
+                    continue
+                if mtimes.get(jsx_file) == mtime:
+                    continue
+                mtimes[jsx_file] = mtime
+
+                # Read as annotate reads: UTF-8 bytes with newlines translated
+                with open(jsx_file, 'rb') as f:
+                    content = decode_text(f.read())
+
+                table = tables.get(jsx_file)
+                if table is None:
+                    table = tables[jsx_file] = TagSpanTable(content)
+                    imports_changed = True
+                elif content == table.content:
+                    continue
+                else:
+                    old_content = table.content
+                    start, end, new_text = table.update(content)
+                    imports_changed = (start <= import_ends[jsx_file] or 'import' in new_text
+                                       or 'import' in old_content[start:end])
+
+                processor.reset_file_state()
+                if imports_changed:
+                    processor.extract_chakra_imports(content)
+                    processor.resolve_components()
+                    components[jsx_file] = processor.chakra_components
+                    import_ends[jsx_file] = max((m.end() for m in IMPORT_STATEMENT_PATTERN.finditer(content)),
+                                                default=0)
+                else:
+                    processor.chakra_components = components[jsx_file]
+
+                output_path = output_path_for(jsx_file)
+                modified_content = processor.annotate_content(content, output_path, tags=table.tags)
+                # Atomic, so stopping the watcher mid-write never leaves a truncated output
+                write_atomic(output_path, modified_content)
+
+                print(f"✅ {jsx_file}: {len(processor.added_test_ids)} data-testid attributes "
+                      f"(re-lexed {table.relexed} of {len(content)} characters)")
+
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+    return 0
+
+
+def time_core(files, annotate, repeat):
+    """Return the best total seconds over repeat runs of annotate on every (path, data) and the last outputs."""
+    best = None
+    outputs = []
+    for _ in range(repeat):
+        outputs = []
+        started = time.perf_counter()
+        for file_path, data in files:
+            outputs.append(annotate(file_path, data))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+
+def run_bench(args):
+    """Time the text and byte scanning cores, and the byte core without routing, on the same files and check they agree.
+
+    Strategies named by --strategy are then timed on the same files, with
+    the IDs each adds and how many files come out as final's do.
+    """
+    missing = find_missing_path(args.paths)
+    if missing is not None:
+        print(f"Error: File not found: {missing}")
+        return 1
+
+    # Inputs are read once up front so only decoding, scanning and annotating are timed
+    files = []
+    for file_path in iter_jsx_files(args.paths):
+        with open(file_path, 'rb') as f:
+            files.append((file_path, f.read()))
+    total_bytes = sum(len(data) for _, data in files)
+    if not total_bytes:
+        print("No JSX content to benchmark")
+        return 0
+
+    processor = ChakraTestIdAdder(id_mode=args.id_mode, verbose=False, config=get_config(args.config))
+
+    def annotate_text(file_path, data):
+        processor.reset_file_state()
+        content = decode_text(data)
+        tags, processor.chakra_components, processor.custom_components = parse_content(content, None, processor)
+        processor.resolve_components(file_path)
+        return processor.annotate_content(content, file_path, tags).encode('utf-8')
+
+    # Files the byte core skipped as no tag names a component, and the IDs it added per file
+    skipped = set()
+    added = {}
+
+    def annotate_bytes(file_path, data, skip=True):
+        processor.reset_file_state()
+        tags, processor.chakra_components, processor.custom_components = parse_bytes(data, processor, file_path,
+                                                                                     skip)
+        if processor.scan_route == 'skip':
+            skipped.add(file_path)
+            output = data
+        else:
+            output = processor.annotate_bytes(data, file_path, tags)
+        added[file_path] = len(processor.added_test_ids)
+        return output
+
+    text_seconds, text_outputs = time_core(files, annotate_text, args.repeat)
+    scan_all_seconds, scan_all_outputs = time_core(files, functools.partial(annotate_bytes, skip=False),
+                                                   args.repeat)
+    byte_seconds, byte_outputs = time_core(files, annotate_bytes, args.repeat)
+    # Files needing newline translation always take the text path, so they cannot be compared
+    comparable = [b'\r' not in data for _, data in files]
+    agreeing = sum(1 for text_output, scan_all_output, byte_output, check
+                   in zip(text_outputs, scan_all_outputs, byte_outputs, comparable)
+                   if check and text_output == scan_all_output == byte_output)
+
+    megabytes = total_bytes / (1 << 20)
+    print(f"Annotated {len(files)} files ({megabytes:.1f} MiB), best of {args.repeat} runs:")
+    print(f"  text core: {text_seconds:.3f}s ({megabytes / text_seconds:.1f} MiB/s)")
+    print(f"  byte core, every file scanned: {scan_all_seconds:.3f}s "
+          f"({megabytes / scan_all_seconds:.1f} MiB/s)")
+    print(f"  byte core: {byte_seconds:.3f}s ({megabytes / byte_seconds:.1f} MiB/s)")
+    print(f"  byte core speedup: {text_seconds / byte_seconds:.2f}x")
+    print(f"  routing: {len(skipped)} files skipped with no component tags, {len(files) - len(skipped)} scanned; "
+          f"saved {scan_all_seconds - byte_seconds:.3f}s")
+    print(f"  identical output: {agreeing}/{sum(comparable)} files")
+
+    if args.strategy:
+        names = list(STRATEGIES) if 'all' in args.strategy else list(dict.fromkeys(args.strategy))
+        print(f"Strategies on the same files, best of {args.repeat} runs:")
+        for name in names:
+            if name == 'final':
+                seconds, added_total, matching = byte_seconds, sum(added.values()), len(files)
+            else:
+                annotate = get_strategy(name)
+                # The earlier scripts report every file as they go
+                with contextlib.redirect_stdout(io.StringIO()):
+                    seconds, outputs = time_core(files, lambda file_path, data: annotate(decode_text(data)),
+                                                 args.repeat)
+                added_total = sum(count for _, count in outputs)
+                matching = sum(1 for (output, _), text_output in zip(outputs, text_outputs)
+                               if output.encode('utf-8') == text_output)
+            print(f"  {name}: {seconds:.3f}s ({megabytes / seconds:.1f} MiB/s), {added_total} IDs added, "
+                  f"{matching}/{len(files)} files as final's")
+    return 0 if agreeing == sum(comparable) else 1
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    # Annotate is the default command so "add_test_ids_final.py file.jsx" keeps working
+    commands = ('annotate', 'lookup', 'audit', 'duplicates', 'strip', 'renumber', 'watch', 'bench')
+    if not argv or (argv[0] not in commands and argv[0] not in ('-h', '--help')):
+        argv.insert(0, 'annotate')
+
+    parser = argparse.ArgumentParser(description='Add data-testid attributes to Chakra UI components.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    annotate_parser = subparsers.add_parser('annotate', help='add data-testid attributes (default)')
+    annotate_parser.add_argument('files', nargs='*',
+                                 help='JSX files or directories to process (default: test.jsx next to this script)')
+    annotate_parser.add_argument('--id-mode', choices=['counter', 'stable'], default='counter',
+                                 help='counter numbers IDs in document order; stable derives them from a structural fingerprint')
+    annotate_parser.add_argument('--manifest', help='stream test ID locations to this NDJSON file')
+    annotate_parser.add_argument('--manifest-index', help='path of the compact JSON index (default: manifest path with .json)')
+    annotate_parser.add_argument('--index', nargs='?', const=DEFAULT_INDEX_PATH,
+                                 help=f'update the SQLite test ID index (default path: {DEFAULT_INDEX_PATH})')
+    annotate_parser.add_argument('--jobs', type=int,
+                                 help='overlap reads and writes (I/O threads) with scanning in N worker processes, '
+                                      'largest files first')
+    annotate_parser.add_argument('--resume', nargs='?', const=DEFAULT_JOURNAL_PATH, metavar='JOURNAL',
+                                 help='record finished files in a checkpoint journal and skip those an interrupted '
+                                      f'run already finished (default path: {DEFAULT_JOURNAL_PATH})')
+    annotate_parser.add_argument('--stream', nargs='?', type=float, const=DEFAULT_STREAM_THRESHOLD_MB, metavar='MIB',
+                                 help='memory-map files of at least MIB MiB and annotate them in chunks with bounded '
+                                      f'memory (default: {DEFAULT_STREAM_THRESHOLD_MB})')
+    annotate_parser.add_argument('--strategy', choices=list(STRATEGIES), default='final',
+                                 help="scanning strategy: final (default) or an earlier script's, which takes "
+                                      "only the files and ignores the other options")
+    annotate_parser.set_defaults(handler=run_annotate)
+
+    lookup_parser = subparsers.add_parser('lookup', help='find where a test ID is defined')
+    lookup_parser.add_argument('test_id', help='test ID to look up, e.g. flex-header-3')
+    lookup_parser.add_argument('--prefix', action='store_true', help='match every test ID starting with test_id')
+    lookup_parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='SQLite index to query')
+    lookup_parser.set_defaults(handler=run_lookup)
+
+    audit_parser = subparsers.add_parser('audit', help='report data-testid coverage without writing files')
+    audit_parser.add_argument('paths', nargs='+', help='JSX files or directories to audit')
+    audit_parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    audit_parser.add_argument('--fail-under', type=float, metavar='PCT',
+                              help='exit with status 1 if overall coverage is below PCT percent')
+    audit_parser.set_defaults(handler=run_audit)
+
+    duplicates_parser = subparsers.add_parser('duplicates', help='report test IDs used more than once')
+    duplicates_parser.add_argument('paths', nargs='+', help='JSX files or directories to check')
+    duplicates_parser.add_argument('--scope', default='global',
+                                   help='where IDs must be unique: global (default), file, directory, '
+                                        'or route:GLOB for the nearest directory matching GLOB')
+    duplicates_parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    duplicates_parser.set_defaults(handler=run_duplicates)
+
+    strip_parser = subparsers.add_parser('strip', help='remove data-testid attributes in place')
+    strip_parser.add_argument('paths', nargs='+', help='JSX files or directories to strip')
+    strip_parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    strip_parser.add_argument('--dry-run', action='store_true', help='report what would be removed without writing')
+    strip_parser.add_argument('--verbose', action='store_true', help='list every changed file')
+    strip_parser.set_defaults(handler=run_strip)
+
+    renumber_parser = subparsers.add_parser('renumber', help='compact generated IDs into document order')
+    renumber_parser.add_argument('paths', nargs='+', help='JSX files or directories to renumber')
+    renumber_parser.add_argument('--manifest',
+                                 help='only renumber IDs this NDJSON manifest or JSON index records as generated '
+                                      'in each annotated output')
+    renumber_parser.add_argument('--mapping', help='write {file: {old_id: new_id}} JSON here')
+    renumber_parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    renumber_parser.add_argument('--dry-run', action='store_true', help='report changes without writing')
+    renumber_parser.add_argument('--verbose', action='store_true', help='list every renamed ID')
+    renumber_parser.set_defaults(handler=run_renumber)
+
+    watch_parser = subparsers.add_parser('watch', help='keep annotated outputs current as files change')
+    watch_parser.add_argument('paths', nargs='+', help='JSX files or directories to watch (discovered once at start)')
+    watch_parser.add_argument('--id-mode', choices=['counter', 'stable'], default='counter',
+                              help='counter numbers IDs in document order; stable derives them from a structural fingerprint')
+    watch_parser.add_argument('--interval', type=float, default=0.5, help='seconds between polls (default: 0.5)')
+    watch_parser.set_defaults(handler=run_watch)
+
+    bench_parser = subparsers.add_parser('bench', help='compare the text and byte scanning cores')
+    bench_parser.add_argument('paths', nargs='+', help='JSX files or directories to annotate in memory')
+    bench_parser.add_argument('--id-mode', choices=['counter', 'stable'], default='counter',
+                              help='counter numbers IDs in document order; stable derives them from a structural fingerprint')
+    bench_parser.add_argument('--repeat', type=int, default=5, help='runs per core; the best is reported (default: 5)')
+    bench_parser.add_argument('--strategy', action='append', choices=list(STRATEGIES) + ['all'],
+                              help='also time this scanning strategy side by side on the same files; repeat it '
+                                   'or give "all"')
+    bench_parser.set_defaults(handler=run_bench)
+
+    for command_parser in (annotate_parser, audit_parser, duplicates_parser, strip_parser, renumber_parser):
+        command_parser.add_argument('--cache', nargs='?', const=DEFAULT_CACHE_DIR, metavar='DIR',
+                                    help=f'reuse parse results stored on disk (default dir: {DEFAULT_CACHE_DIR})')
+
+    for command_parser in (annotate_parser, audit_parser):
+        command_parser.add_argument('--symbols', nargs='?', const=DEFAULT_SYMBOL_INDEX_PATH, metavar='PATH',
+                                    help='detect custom Chakra-based components through a project symbol index '
+                                         f'(default path: {DEFAULT_SYMBOL_INDEX_PATH})')
+        command_parser.add_argument('--project-root', default='.',
+                                    help='directory indexed for --symbols (default: current directory)')
+
+    for command_parser in (annotate_parser, audit_parser, duplicates_parser, strip_parser, renumber_parser):
+        command_parser.add_argument('--stats', action='store_true',
+                                    help='report per-worker utilisation and the slowest file (annotate: with --jobs)')
+
+    for command_parser in (annotate_parser, audit_parser, watch_parser, bench_parser):
+        command_parser.add_argument('--config', metavar='PATH',
+                                    help=f'project config (default: {CONFIG_FILE_NAME} or [tool.{PYPROJECT_TABLE}] '
+                                         'in pyproject.toml in the current directory)')
+
+    args = parser.parse_args(argv)
+
+    # Validate and compile the config once up front; workers compile their own copy from the path
+    if hasattr(args, 'config'):
+        args.config = args.config or find_config_path()
+        try:
+            get_config(args.config)
+        except (OSError, ValueError) as error:
+            print(f"Error: invalid config: {error}")
+            return 1
+
+    return args.handler(args)
@@ -0,0 +1,286 @@
+"""
+Project config: component detection and naming settings, validated and compiled once per process.
+"""
+import collections
+import fnmatch
+import hashlib
+import json
+import os
+import re
+
+from .rules import (
+    CHAKRA_LIBRARY, CHAKRA_PACKAGES, CUSTOM_SUFFIXES, FALLBACK_COMPONENTS, NAMING_PRIORITY, compile_import_patterns,
+    compile_naming_rule, describe, find_custom_components, find_imports)
+
+# Most (component, attribute text) -> base ID results remembered per config
+NAMING_MEMO_SIZE = 4096
+
+# Project config file; [tool.testid] in pyproject.toml is used when it is absent
+CONFIG_FILE_NAME = '.testidrc.json'
+PYPROJECT_TABLE = 'testid'
+
+# Settings accepted in the project config and their defaults
+CONFIG_DEFAULTS = {
+    'packages': [],
+    'components': [],
+    'ignore': [],
+    'fallback_components': list(FALLBACK_COMPONENTS),
+    'custom_suffixes': list(CUSTOM_SUFFIXES),
+    'naming': {'priority': list(NAMING_PRIORITY)},
+    'html': {'elements': [], 'naming': {}},
+    'libraries': {},
+}
+
+# JSX attribute name allowed in naming rules
+ATTRIBUTE_NAME_PATTERN = re.compile(r'^[A-Za-z][\w-]*$')
+
+# Intrinsic element name allowed in html.elements
+HTML_TAG_PATTERN = re.compile(r'^[a-z][a-z0-9]*$')
+
+# HTML elements annotated when html.elements is true (the Node v10 script's getHtmlElements)
+HTML_ELEMENTS = (
+    'div', 'span', 'section', 'article', 'header', 'footer', 'main', 'aside', 'nav',
+    'form', 'input', 'button', 'select', 'option', 'textarea', 'label',
+    'fieldset', 'legend', 'datalist', 'output', 'progress', 'meter',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'caption', 'colgroup', 'col',
+    'img', 'video', 'audio', 'source', 'track', 'figure', 'figcaption',
+    'canvas', 'picture', 'svg', 'map', 'area',
+    'a', 'dialog', 'details', 'summary', 'menu', 'menuitem',
+    'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'blockquote', 'q', 'cite', 'pre', 'code', 'kbd', 'samp', 'var', 'mark',
+    'bdi', 'bdo', 'ruby', 'rt', 'rp', 'abbr', 'address',
+    'time', 'data', 'slot', 'template', 'wbr', 'embed',
+    'object', 'param', 'iframe', 'noscript', 'hr',
+)
+
+# Naming priority per HTML element kind; html.naming overrides these, other elements use naming.priority
+HTML_NAMING_DEFAULTS = {
+    'input': ['name', 'placeholder', 'type', 'id'],
+    'textarea': ['name', 'placeholder', 'id'],
+    'select': ['name', 'id'],
+    'option': ['value'],
+    'button': ['aria-label', 'type', 'className', 'id'],
+    'a': ['aria-label', 'className', 'id'],
+    'img': ['alt', 'className', 'id'],
+    'label': ['htmlFor', 'className', 'id'],
+    'form': ['name', 'id', 'className'],
+}
+
+
+class TestIdConfig:
+    """Project settings for component detection and test ID naming, compiled once.
+
+    Settings come from a JSON object (CONFIG_FILE_NAME or the [tool.testid]
+    table of pyproject.toml) and are validated here:
+      packages: extra package names whose imports are Chakra UI components
+      components: component names always annotated
+      ignore: glob patterns of component names never annotated
+      fallback_components: used when a file has no Chakra imports
+      custom_suffixes: name suffixes guessed to be Chakra-based custom components
+      naming: {"priority": [...]} attributes tried in order for the ID description;
+              "className", "id" and "src" (images only) keep their built-in parsing,
+              any other attribute uses its string or {expression} value, lower-cased
+      html: {"elements": [...] or true, "naming": {tag: [...]}} intrinsic elements
+            annotated alongside Chakra components (true: HTML_ELEMENTS), and naming
+            priorities per element kind over HTML_NAMING_DEFAULTS
+      libraries: {name: {"packages": [...], "components": [...]}} other design
+                 systems; imports from their packages are detected in the same
+                 pass as Chakra's, and their components are annotated in files
+                 importing from them (e.g. members of a default-imported object).
+                 A "chakra" entry extends the built-in Chakra profile
+    Matchers are compiled in __init__; each process builds one per config file.
+    Base IDs are memoized on the config, so repeated tags share them across
+    every file the process handles.
+    """
+
+    # Not a test class, though pytest collects Test* names the tests import
+    __test__ = False
+
+    def __init__(self, settings=None, source='defaults'):
+        settings = dict(settings or {})
+        self.source = source
+        unknown = set(settings) - set(CONFIG_DEFAULTS)
+        if unknown:
+            raise ValueError(f"{source}: unknown setting(s): {', '.join(sorted(unknown))}")
+
+        for key in ('packages', 'components', 'ignore', 'fallback_components', 'custom_suffixes'):
+            value = settings.get(key, CONFIG_DEFAULTS[key])
+            if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+                raise ValueError(f"{source}: {key} must be a list of non-empty strings")
+            settings[key] = value
+
+        naming = settings.get('naming', CONFIG_DEFAULTS['naming'])
+        if not isinstance(naming, dict) or set(naming) - {'priority'}:
+            raise ValueError(f'{source}: naming must be an object with only a "priority" list')
+        priority = naming.get('priority', CONFIG_DEFAULTS['naming']['priority'])
+        if not isinstance(priority, list) or not all(isinstance(item, str) and ATTRIBUTE_NAME_PATTERN.match(item)
+                                                     for item in priority):
+            raise ValueError(f"{source}: naming.priority must be a list of attribute names")
+        for suffix in settings['custom_suffixes']:
+            if not re.match(r'^\w+$', suffix):
+                raise ValueError(f"{source}: custom_suffixes entries must be identifiers, got {suffix!r}")
+
+        html = settings.get('html', CONFIG_DEFAULTS['html'])
+        if not isinstance(html, dict) or set(html) - {'elements', 'naming'}:
+            raise ValueError(f'{source}: html must be an object with only "elements" and "naming"')
+        html_elements = html.get('elements', [])
+        if html_elements is True:
+            html_elements = list(HTML_ELEMENTS)
+        if not isinstance(html_elements, list) or not all(isinstance(item, str) and HTML_TAG_PATTERN.match(item)
+                                                           for item in html_elements):
+            raise ValueError(f"{source}: html.elements must be true or a list of lower-case tag names")
+        html_naming = html.get('naming', {})
+        if not isinstance(html_naming, dict) or not all(
+                HTML_TAG_PATTERN.match(tag) and isinstance(names, list)
+                and all(isinstance(item, str) and ATTRIBUTE_NAME_PATTERN.match(item) for item in names)
+                for tag, names in html_naming.items()):
+            raise ValueError(f"{source}: html.naming must map lower-case tag names to lists of attribute names")
+
+        libraries = settings.get('libraries', CONFIG_DEFAULTS['libraries'])
+        if not isinstance(libraries, dict):
+            raise ValueError(f"{source}: libraries must be an object of library profiles")
+        for name, profile in libraries.items():
+            if not isinstance(profile, dict) or set(profile) - {'packages', 'components'}:
+                raise ValueError(f'{source}: libraries.{name} must be an object with only "packages" and "components"')
+            for key in ('packages', 'components'):
+                value = profile.get(key, [])
+                if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+                    raise ValueError(f"{source}: libraries.{name}.{key} must be a list of non-empty strings")
+            if not profile.get('packages') and name != CHAKRA_LIBRARY:
+                raise ValueError(f"{source}: libraries.{name}.packages must name at least one package")
+
+        # Configured packages come first so they win over the @chakra-ui catch-all
+        chakra = libraries.get(CHAKRA_LIBRARY, {})
+        self.libraries = {CHAKRA_LIBRARY: (
+            tuple(dict.fromkeys(chakra.get('packages', []) + settings['packages'] + list(CHAKRA_PACKAGES))),
+            frozenset(chakra.get('components', [])),
+        )}
+        for name, profile in libraries.items():
+            if name != CHAKRA_LIBRARY:
+                self.libraries[name] = (tuple(dict.fromkeys(profile['packages'])),
+                                        frozenset(profile.get('components', [])))
+        # Import source -> library, for the packages matched by the import patterns
+        self.package_libraries = {}
+        for name, (packages, _) in self.libraries.items():
+            for package in packages:
+                if self.package_libraries.setdefault(package, name) != name:
+                    raise ValueError(f"{source}: package {package!r} is in both libraries."
+                                     f"{self.package_libraries[package]} and libraries.{name}")
+        self.packages = tuple(self.package_libraries)
+        # Profile components, kept when the symbol index replaces the detected ones
+        self.library_components = frozenset().union(*(components for _, components in self.libraries.values()))
+        # HTML elements are annotated like the configured components, and ignore patterns apply to both
+        self.html_elements = frozenset(html_elements)
+        self.extra_components = frozenset(settings['components']) | self.html_elements
+        self.fallback_components = frozenset(settings['fallback_components'])
+        self.naming_priority = tuple(priority)
+        html_priorities = {**HTML_NAMING_DEFAULTS, **html_naming}
+        self.html_naming_priority = {tag: tuple(html_priorities[tag])
+                                     for tag in sorted(self.html_elements) if tag in html_priorities}
+
+        self.named_import_pattern, self.default_import_pattern, self.custom_component_pattern = \
+            compile_import_patterns(self.packages, settings['custom_suffixes'])
+        self.ignore_pattern = re.compile(
+            '|'.join(fnmatch.translate(pattern) for pattern in settings['ignore'])
+        ) if settings['ignore'] else None
+        self.naming_rules = tuple(compile_naming_rule(name) for name in self.naming_priority)
+        self.html_naming_rules = {tag: tuple(compile_naming_rule(name) for name in names)
+                                  for tag, names in self.html_naming_priority.items()}
+        # Least recently used first
+        self.naming_memo = collections.OrderedDict()
+        self.naming_hits = 0
+        self.naming_misses = 0
+
+        # Settings that change detected components; part of the parse cache key
+        detection = [self.packages, sorted(self.fallback_components), settings['custom_suffixes']]
+        if len(self.libraries) > 1 or self.library_components:
+            detection.append({name: [list(packages), sorted(components)]
+                              for name, (packages, components) in self.libraries.items()})
+        self.detection_key = hashlib.sha1(json.dumps(detection).encode('utf-8')).hexdigest()[:12]
+        # Every setting; changes what annotate writes
+        everything = detection + [sorted(self.extra_components), settings['ignore'], list(self.naming_priority)]
+        if self.html_naming_priority:
+            everything.append({tag: list(names) for tag, names in self.html_naming_priority.items()})
+        self.settings_key = hashlib.sha1(json.dumps(everything).encode('utf-8')).hexdigest()[:12]
+
+    def describe(self, attributes, component_name):
+        """Return the ID description for a component using its naming rules in priority order."""
+        return describe(attributes, component_name, self.html_naming_rules.get(component_name, self.naming_rules))
+
+    def base_id(self, tag_text, component_name):
+        """Return describe() for a tag's text, memoized on the component and its attributes.
+
+        The key drops the "<Name" prefix, the closing ">" or "/>" and outer
+        whitespace, none of which a naming rule can match.
+        """
+        key = (component_name, tag_text[len(component_name) + 1:].rstrip('/> \t\r\n').lstrip())
+        memo = self.naming_memo
+        base_id = memo.get(key)
+        if base_id is not None:
+            self.naming_hits += 1
+            memo.move_to_end(key)
+            return base_id
+
+        self.naming_misses += 1
+        base_id = memo[key] = self.describe(key[1], component_name)
+        if len(memo) > NAMING_MEMO_SIZE:
+            memo.popitem(last=False)
+        return base_id
+
+    def detect_imports(self, content):
+        """Return ({library: components content imports from it}, custom components) for a file.
+
+        Imports from every configured library are matched in the same pass;
+        each import's package tells which library profile it belongs to, and
+        the profile's own components are added for each library imported from.
+        """
+        detected = {}
+        for package, component in find_imports(content, self.named_import_pattern, self.default_import_pattern):
+            detected.setdefault(self.package_libraries[package], set()).add(component)
+        for library, components in detected.items():
+            components.update(self.libraries[library][1])
+        custom_components = find_custom_components(content, self.custom_component_pattern,
+                                                   set().union(*detected.values()))
+        return detected, custom_components
+
+    def is_ignored(self, component_name):
+        """Return True if a component must never be annotated."""
+        return self.ignore_pattern is not None and self.ignore_pattern.match(component_name) is not None
+
+
+def find_config_path(root='.'):
+    """Return the project config in root: CONFIG_FILE_NAME, or pyproject.toml with [tool.testid], or None."""
+    config_path = os.path.join(root, CONFIG_FILE_NAME)
+    if os.path.isfile(config_path):
+        return config_path
+    pyproject_path = os.path.join(root, 'pyproject.toml')
+    if os.path.isfile(pyproject_path):
+        with open(pyproject_path, 'r') as f:
+            if re.search(r'^\[tool\.' + PYPROJECT_TABLE + r'(?:\.|\])', f.read(), re.MULTILINE):
+                return pyproject_path
+    return None
+
+
+def load_config(config_path):
+    """Read and validate a config file; raises ValueError with the file name on bad settings."""
+    if config_path.endswith('.toml'):
+        import tomllib
+        with open(config_path, 'rb') as f:
+            settings = tomllib.load(f).get('tool', {}).get(PYPROJECT_TABLE, {})
+    else:
+        with open(config_path, 'r') as f:
+            settings = json.load(f)
+    if not isinstance(settings, dict):
+        raise ValueError(f"{config_path}: expected an object of settings")
+    return TestIdConfig(settings, config_path)
+
+
+# One compiled TestIdConfig per config file in each worker process
+_configs = {}
+
+
+def get_config(config_path=None):
+    """Return this process's compiled config for config_path (the defaults when None)."""
+    if config_path not in _configs:
+        _configs[config_path] = load_config(config_path) if config_path else TestIdConfig()
+    return _configs[config_path]
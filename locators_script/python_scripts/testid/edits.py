@@ -0,0 +1,168 @@
+"""
+In-place edits of sources: removing data-testid attributes and renumbering generated IDs.
+"""
+import os
+import re
+import stat
+from pathlib import Path
+
+from .annotator import parse_content
+from .cache import get_parse_cache
+from .files import read_source, write_atomic
+from .scanner import COUNTER_ID_PATTERN, TESTID_VALUE_PATTERN, LineIndex, iter_attributes, scan_tags
+
+# An attribute annotate added at the end of a tag whose last line is a // comment
+TRAILING_COMMENT_TESTID_PATTERN = re.compile(r'//[^\n]*?( data-testid="[^"\n]*")\s*\Z')
+
+
+def strip_content(content, tags=None):
+    """Return content without data-testid attributes and the number removed.
+
+    Only attributes named data-testid are removed, at the boundaries
+    iter_attributes finds, so a value that merely contains "data-testid="
+    is kept. Tags in an expression value, e.g. icon={<Icon data-testid="x" />},
+    are stripped too, and so is an ID annotate wrote into a // comment
+    ending a tag, where it goes just before the whitespace ahead of ">".
+    """
+    # Most files in a production build have nothing to strip
+    if 'data-testid' not in content:
+        return content, 0
+
+    if tags is None:
+        tags = scan_tags(content)
+
+    pieces = []
+    last_pos = 0
+    removed = 0
+    for tag in tags:
+        if tag['is_closing']:
+            continue
+        attributes_end = tag['start'] + 1 + len(tag['component'])
+        for start, name, value_start, value_end in iter_attributes(content, attributes_end, tag['end']):
+            attributes_end = value_end
+            if value_start == -1:
+                continue
+            if name == 'data-testid':
+                pieces.append(content[last_pos:start])
+                last_pos = value_end
+                removed += 1
+            elif content[value_start] == '{' and 'data-testid' in content[value_start:value_end]:
+                # The expression is code, so its tags are lexed on their own
+                expression, expression_removed = strip_content(content[value_start + 1:value_end - 1])
+                if expression_removed:
+                    pieces.append(content[last_pos:value_start + 1])
+                    pieces.append(expression)
+                    last_pos = value_end - 1
+                    removed += expression_removed
+
+        body_end = tag['end'] - 1 if tag['is_self_closing'] else tag['end']
+        comment_match = TRAILING_COMMENT_TESTID_PATTERN.search(content, attributes_end, body_end)
+        if comment_match:
+            pieces.append(content[last_pos:comment_match.start(1)])
+            last_pos = comment_match.end(1)
+            removed += 1
+
+    pieces.append(content[last_pos:])
+    return ''.join(pieces), removed
+
+
+def strip_file(file_path, dry_run=False, cache_dir=None):
+    """Remove data-testid attributes from one file, writing it only if it changed.
+
+    Only the attributes are removed: newlines and the file mode are kept.
+    """
+    content = read_source(file_path)
+
+    if 'data-testid' not in content:
+        return str(file_path), 0
+
+    stripped, removed = strip_content(content, parse_content(content, get_parse_cache(cache_dir))[0])
+    if removed and not dry_run:
+        # Replace atomically so an interrupted build never leaves a truncated file
+        write_atomic(file_path, stripped, stat.S_IMODE(os.stat(file_path).st_mode))
+
+    return str(file_path), removed
+
+
+def renumber_content(content, generated_ids=None, tags=None):
+    """Renumber generated counter IDs in document order.
+
+    An ID counts as generated when it is in generated_ids, or, without a
+    manifest, when it looks like "<component>[-<description>]-<n>" for the
+    tag it is on. Other IDs are left untouched and their numbers are never
+    reused. Returns the new content and [(old_id, new_id, line)] for every
+    ID that changed.
+    """
+    if 'data-testid' not in content:
+        return content, []
+
+    if tags is None:
+        tags = scan_tags(content)
+
+    candidates = []
+    reserved = set()
+    for tag in tags:
+        if tag['is_closing']:
+            continue
+        match = TESTID_VALUE_PATTERN.search(content, tag['start'], tag['end'])
+        if not match:
+            continue
+
+        test_id = match.group(1)
+        counter_match = COUNTER_ID_PATTERN.match(test_id)
+        if generated_ids is not None:
+            is_generated = counter_match is not None and test_id in generated_ids
+        else:
+            component = tag['component'].lower()
+            is_generated = counter_match is not None and (
+                counter_match.group(1) == component or counter_match.group(1).startswith(component + '-')
+            )
+
+        if is_generated:
+            candidates.append((match, counter_match.group(1)))
+        else:
+            reserved.add(test_id)
+
+    counts = {}
+    pieces = []
+    changes = []
+    last_pos = 0
+    lines = LineIndex(content) if candidates else None
+    for match, base_id in candidates:
+        count = counts.get(base_id, 0) + 1
+        while f"{base_id}-{count}" in reserved:
+            count += 1
+        counts[base_id] = count
+
+        new_id = f"{base_id}-{count}"
+        if new_id == match.group(1):
+            continue
+        pieces.append(content[last_pos:match.start(1)])
+        pieces.append(new_id)
+        last_pos = match.end(1)
+        changes.append((match.group(1), new_id, lines.line_of(match.start(1))))
+
+    pieces.append(content[last_pos:])
+    return ''.join(pieces), changes
+
+
+def renumber_file(file_path, generated_ids=None, dry_run=False, cache_dir=None):
+    """Renumber generated IDs in one file, writing it only if it changed.
+
+    generated_ids, when given, is {resolved path: IDs} from load_generated_ids,
+    and only this file's entry counts. Only the IDs are rewritten: newlines
+    and the file mode are kept.
+    """
+    content = read_source(file_path)
+
+    if 'data-testid' not in content:
+        return str(file_path), []
+
+    if generated_ids is not None:
+        generated_ids = generated_ids.get(str(Path(file_path).resolve()), frozenset())
+    tags = parse_content(content, get_parse_cache(cache_dir))[0]
+    renumbered, changes = renumber_content(content, generated_ids, tags)
+    if changes and not dry_run:
+        write_atomic(file_path, renumbered, stat.S_IMODE(os.stat(file_path).st_mode))
+
+    return str(file_path), changes
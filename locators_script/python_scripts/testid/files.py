@@ -0,0 +1,266 @@
+"""
+Finding JSX files under directories, honouring ignore files, and writing outputs atomically.
+"""
+import contextlib
+import os
+import re
+import stat
+from pathlib import Path
+
+from .strategies import STRATEGIES
+
+# Source files searched for when a directory is given
+JSX_EXTENSIONS = ('.jsx', '.tsx', '.js')
+
+# Directories never searched: dependencies and build output such as Storybook's static export
+PRUNED_DIRECTORIES = frozenset({'node_modules', 'storybook-static', 'dist', 'build', 'coverage'})
+
+# Ignore files honoured when searching directories, with .gitignore syntax
+IGNORE_FILE_NAMES = ('.gitignore', '.testidignore')
+
+# Suffix of each strategy's annotated output written next to a processed file, before its extension
+OUTPUT_SUFFIXES = {name: f'_{name}_result' for name in STRATEGIES}
+OUTPUT_SUFFIX = OUTPUT_SUFFIXES['final']
+
+
+def compile_ignore_pattern(pattern):
+    """Translate one .gitignore pattern to a matcher of '/'-separated relative paths.
+
+    Returns (kind, value): ('name', n) and ('suffix', s) compare the last path
+    component, ('path', p) compares the whole path, and ('regex', r) covers
+    everything else, so the common literal and "*.ext" patterns skip regex
+    compilation.
+    """
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+    if not any(char in pattern for char in '*?[\\'):
+        return ('path', pattern) if anchored else ('name', pattern)
+    if not anchored and pattern.startswith('*') and not any(char in pattern[1:] for char in '*?[\\'):
+        return 'suffix', pattern[1:]
+
+    pieces = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            pieces.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            pieces.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            pieces.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            pieces.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            pieces.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and ']' in pattern[i + 2:]:
+            end = pattern.index(']', i + 2)
+            pieces.append('[' + pattern[i + 1:end].replace('!', '^', 1).replace('\\', '\\\\') + ']')
+            i = end + 1
+        elif pattern[i] == '\\' and i + 1 < len(pattern):
+            pieces.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            pieces.append(re.escape(pattern[i]))
+            i += 1
+    # Patterns without a slash match at any depth below the ignore file
+    prefix = '' if anchored else '(?:.*/)?'
+    return 'regex', re.compile(prefix + ''.join(pieces) + r'\Z')
+
+
+def load_ignore_rules(directory):
+    """Return [(kind, value, negated, directories_only)] from the ignore files in a directory."""
+    rules = []
+    for name in IGNORE_FILE_NAMES:
+        try:
+            with open(os.path.join(directory, name), 'r') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            if line.endswith('\\ '):
+                line = line.rstrip() + ' '
+            else:
+                line = line.rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated or line.startswith('\\!') or line.startswith('\\#'):
+                line = line[1:]
+            directories_only = line.endswith('/')
+            line = line.rstrip('/')
+            if line:
+                rules.append(compile_ignore_pattern(line) + (negated, directories_only))
+    return rules
+
+
+def is_ignored(rule_sets, relative_path, is_dir):
+    """Return True if ignore rules exclude a path relative to the walk root.
+
+    rule_sets is [(strip, prefix, rules)] from outermost to innermost; each
+    rule set sees prefix + relative_path[strip:], and the last matching rule wins.
+    """
+    ignored = False
+    name = relative_path.rpartition('/')[2]
+    for strip, prefix, rules in rule_sets:
+        path = prefix + relative_path[strip:]
+        for kind, value, negated, directories_only in rules:
+            if directories_only and not is_dir:
+                continue
+            if kind == 'name':
+                matched = name == value
+            elif kind == 'suffix':
+                matched = name.endswith(value)
+            elif kind == 'path':
+                matched = path == value
+            else:
+                matched = value.match(path) is not None
+            if matched:
+                ignored = not negated
+    return ignored
+
+
+def ancestor_ignore_rules(directory):
+    """Return rule sets for ignore files above directory, up to the enclosing git repository root."""
+    rule_sets = []
+    directory = os.path.abspath(directory)
+    current = directory
+    while True:
+        parent = os.path.dirname(current)
+        if os.path.exists(os.path.join(current, '.git')) or parent == current:
+            break
+        current = parent
+        rules = load_ignore_rules(current)
+        if rules:
+            prefix = os.path.relpath(directory, current).replace(os.sep, '/') + '/'
+            rule_sets.append((0, prefix, rules))
+    rule_sets.reverse()
+    return rule_sets
+
+
+def walk_jsx_files(directory, extensions=JSX_EXTENSIONS):
+    """Yield (path, size) for source files under directory in sorted order.
+
+    Uses os.scandir so sizes come from the directory entries, prunes hidden
+    directories, PRUNED_DIRECTORIES and anything matched by .gitignore or
+    .testidignore (including those of parent directories inside the git
+    repository) before descending, and skips every strategy's annotated
+    outputs.
+    """
+    output_suffixes = tuple(OUTPUT_SUFFIXES.values())
+    # Stack of (directory, path relative to the walk root, rule sets in effect);
+    # children are pushed in reverse so they pop in sorted order
+    stack = [(str(directory), '', ancestor_ignore_rules(directory))]
+    while stack:
+        current, relative, rule_sets = stack.pop()
+        rules = load_ignore_rules(current)
+        if rules:
+            rule_sets = rule_sets + [(len(relative), '', rules)]
+
+        try:
+            with os.scandir(current) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            name = entry.name
+            entry_relative = relative + name
+            if entry.is_dir(follow_symlinks=False):
+                if name.startswith('.') or name in PRUNED_DIRECTORIES or \
+                        (rule_sets and is_ignored(rule_sets, entry_relative, True)):
+                    continue
+                subdirectories.append((entry.path, entry_relative + '/'))
+                continue
+
+            stem, extension = os.path.splitext(name)
+            if extension not in extensions or stem.endswith(output_suffixes):
+                continue
+            if rule_sets and is_ignored(rule_sets, entry_relative, False):
+                continue
+            yield entry.path, entry.stat().st_size
+
+        for subdirectory, subdirectory_relative in reversed(subdirectories):
+            stack.append((subdirectory, subdirectory_relative, rule_sets))
+
+
+def iter_sized_jsx_files(paths, extensions=JSX_EXTENSIONS):
+    """Yield (path, size in bytes) for the files iter_jsx_files would yield; a missing file has size 0.
+
+    Each path given is stat'ed once; files found in directories are sized
+    from the walk's directory entries.
+    """
+    for path in paths:
+        path = Path(path)
+        try:
+            status = path.stat()
+        except OSError:
+            yield path, 0
+            continue
+        if not stat.S_ISDIR(status.st_mode):
+            yield path, status.st_size
+            continue
+
+        for file_path, size in walk_jsx_files(path, extensions):
+            yield Path(file_path), size
+
+
+def iter_jsx_files(paths, extensions=JSX_EXTENSIONS):
+    """Yield JSX files from a mix of file and directory paths in sorted order.
+
+    Directories are walked lazily with walk_jsx_files; files named
+    explicitly are always yielded, even when an ignore file matches them.
+    """
+    for path, _ in iter_sized_jsx_files(paths, extensions):
+        yield path
+
+
+def output_path_for(source_path, suffix=OUTPUT_SUFFIX):
+    """Return the path of source_path's annotated output: {stem}{suffix} with the source's extension, next to it.
+
+    Keeping the extension gives Foo.js, Foo.jsx and Foo.tsx in one directory
+    outputs of their own.
+    """
+    source_path = Path(source_path)
+    return source_path.with_name(f"{source_path.stem}{suffix}{source_path.suffix}")
+
+
+def find_missing_path(paths):
+    """Return the first path that does not exist, or None."""
+    return next((path for path in paths if not os.path.exists(path)), None)
+
+
+@contextlib.contextmanager
+def open_atomic(path, mode=None):
+    """Open a temporary binary file that replaces path when the block finishes, so a crash never leaves half a file.
+
+    The temporary file is removed if the block raises. mode, when given, is
+    set on the new file, e.g. the permissions of a source edited in place.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            yield f
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def write_atomic(path, content, mode=None):
+    """Write text or bytes to path with open_atomic; text is written as UTF-8 without newline translation."""
+    with open_atomic(path, mode) as f:
+        f.write(content if isinstance(content, bytes) else content.encode('utf-8'))
+
+
+def read_source(file_path):
+    """Read a source file to edit in place: UTF-8, with its newlines kept as they are."""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
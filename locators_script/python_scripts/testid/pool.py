@@ -0,0 +1,150 @@
+"""
+Process pool scheduling: files in windows, largest first, with small files batched together.
+"""
+import collections
+import functools
+import itertools
+import os
+import time
+
+# Files read ahead from the directory walk and scheduled largest-first as a group
+SCHEDULE_WINDOW = 2048
+
+# Bounds of the adaptive batch size for small files, and the most files in one batch
+MIN_CHUNK_BYTES = 16 * 1024
+MAX_CHUNK_BYTES = 1024 * 1024
+MAX_CHUNK_FILES = 256
+
+# Most pool results discovered but not yet emitted in path order
+REORDER_BUFFER_SIZE = 2 * SCHEDULE_WINDOW
+
+
+def plan_batches(sized_paths, jobs):
+    """Group (path, size) pairs into batches of paths, largest files first.
+
+    Files of at least the target chunk size run alone; smaller files are
+    packed together until a batch reaches the target, which scales with
+    the total size so each worker gets several batches.
+    """
+    ordered = sorted(sized_paths, key=lambda item: (-item[1], item[0]))
+    total = sum(size for _, size in ordered)
+    target = min(MAX_CHUNK_BYTES, max(MIN_CHUNK_BYTES, total // (jobs * 8)))
+
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for path, size in ordered:
+        if size >= target:
+            batches.append([path])
+            continue
+        batch.append(path)
+        batch_bytes += size
+        if batch_bytes >= target or len(batch) >= MAX_CHUNK_FILES:
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def run_batch(worker, paths, contents=None):
+    """Run worker over a batch in a pool process; returns (pid, busy seconds, (slowest seconds, path), results).
+
+    With contents, worker(path, content) is called for each path and the
+    content read for it.
+    """
+    batch_start = time.perf_counter()
+    slowest = (0.0, None)
+    results = []
+    for i, path in enumerate(paths):
+        start = time.perf_counter()
+        results.append(worker(path) if contents is None else worker(path, contents[i]))
+        elapsed = time.perf_counter() - start
+        if elapsed > slowest[0]:
+            slowest = (elapsed, str(path))
+    return os.getpid(), time.perf_counter() - batch_start, slowest, results
+
+
+class WorkerStats:
+    """Per-worker batch, file and busy-time totals for a pool run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.workers = {}
+        self.batches = 0
+        self.slowest = (0.0, None)
+        # Most results held at once waiting for earlier paths
+        self.peak_buffered = 0
+
+    def record(self, pid, busy, slowest, file_count):
+        totals = self.workers.setdefault(pid, [0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += file_count
+        totals[2] += busy
+        self.batches += 1
+        self.slowest = max(self.slowest, slowest, key=lambda item: item[0])
+
+    def print_report(self):
+        """Print utilisation per worker, the slowest file and the idle tail."""
+        wall = time.perf_counter() - self.started
+        print(f"\nWorker utilisation ({len(self.workers)} workers, {self.batches} batches, {wall:.2f}s wall):")
+        for number, (pid, (batches, files, busy)) in enumerate(sorted(self.workers.items()), 1):
+            percent = 100.0 * busy / wall if wall else 0.0
+            print(f"  worker {number} (pid {pid}): {files} files in {batches} batches, "
+                  f"busy {busy:.3f}s ({percent:.0f}%)")
+        if self.workers:
+            busiest = max(busy for _, _, busy in self.workers.values())
+            print(f"  slowest file: {self.slowest[1]} ({self.slowest[0]:.3f}s); "
+                  f"idle tail after the busiest worker: {max(0.0, wall - busiest):.3f}s")
+        print(f"  reorder buffer: at most {self.peak_buffered} results held (bound {REORDER_BUFFER_SIZE})")
+
+
+def run_in_pool(worker, sized_paths, jobs=None, stats=None):
+    """Yield worker(path) for (path, size) pairs from a process pool, in input order.
+
+    Paths are read in windows of SCHEDULE_WINDOW as they are discovered;
+    each window is split by plan_batches so the largest files start first
+    and small files share a task, with at most jobs * 4 batches in flight.
+    Results finishing early wait in a reorder buffer until every earlier
+    path is done, so output is identical across runs. A new window is only
+    read while the results outstanding stay within REORDER_BUFFER_SIZE,
+    which bounds memory regardless of the number of files.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    sized_paths = iter(sized_paths)
+    batch_worker = functools.partial(run_batch, worker)
+    queued = collections.deque()
+    # future -> sequence numbers of the paths in its batch
+    pending = {}
+    buffered = {}
+    discovered = emitted = 0
+    exhausted = False
+    import concurrent.futures
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        while True:
+            if not queued and not exhausted and discovered - emitted + SCHEDULE_WINDOW <= REORDER_BUFFER_SIZE:
+                window = list(itertools.islice(sized_paths, SCHEDULE_WINDOW))
+                exhausted = len(window) < SCHEDULE_WINDOW
+                numbered = [((discovered + i, path), size) for i, (path, size) in enumerate(window)]
+                discovered += len(window)
+                queued.extend(plan_batches(numbered, jobs))
+            while queued and len(pending) < jobs * 4:
+                batch = queued.popleft()
+                future = executor.submit(batch_worker, [path for _, path in batch])
+                pending[future] = [sequence for sequence, _ in batch]
+            if not pending:
+                break
+
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                pid, busy, slowest, results = future.result()
+                buffered.update(zip(pending.pop(future), results))
+                if stats is not None:
+                    stats.record(pid, busy, slowest, len(results))
+            if stats is not None:
+                stats.peak_buffered = max(stats.peak_buffered, len(buffered))
+
+            while emitted in buffered:
+                yield buffered.pop(emitted)
+                emitted += 1
@@ -0,0 +1,195 @@
+"""
+Detection and naming rules shared by the final scanner and every earlier strategy.
+
+Which imports name Chakra UI components, which imported names are guessed
+to be Chakra-based custom components, and how an ID's description is read
+from a tag's attributes are defined once here. TestIdConfig compiles them
+with a project's settings; the strategies use the default settings.
+"""
+import re
+
+# Common Chakra UI packages
+CHAKRA_PACKAGES = (
+    '@chakra-ui/react',
+    '@chakra-ui/core',
+    '@chakra-ui/button',
+    '@chakra-ui/layout',
+    '@chakra-ui/form-control',
+    '@chakra-ui/icons',
+    '@chakra-ui'  # Catch-all for any Chakra imports
+)
+
+# Library profile holding CHAKRA_PACKAGES and the top-level "packages" setting
+CHAKRA_LIBRARY = 'chakra'
+
+# Used when a file imports nothing from a configured library
+FALLBACK_COMPONENTS = ('Box', 'Flex', 'VStack', 'HStack', 'Image', 'Text', 'Button', 'Container', 'Input')
+
+# Name suffixes of imports guessed to be Chakra-based custom components
+CUSTOM_SUFFIXES = ('Tool', 'Modal', 'Tooltip', 'Container', 'Button', 'Box', 'Card', 'Element')
+
+# Attributes tried in order for an ID's description
+NAMING_PRIORITY = ('className', 'id', 'src')
+
+# A key attribute, which marks an element rendered for each item of a list
+LIST_KEY_PATTERN = re.compile(r'key=\{([^}]+)\}')
+
+# What may precede the last name of a className={...} expression: any dotted path, or only a Styles module
+CLASS_EXPRESSION_PREFIX = r'(?:[\w\.]+\.)?'
+STYLES_CLASS_PREFIX = r'(?:Styles\.|Styles\?\.|)'
+
+
+def compile_import_patterns(packages, custom_suffixes):
+    """Return the named, default and custom-component import patterns for packages and custom_suffixes.
+
+    The named and default patterns capture the imported name(s) and then the
+    package; the custom-component pattern is None when there are no suffixes.
+    """
+    sources = '|'.join(re.escape(package) for package in packages)
+    # import { Box, Flex, ... } from '@chakra-ui/react'
+    named_import_pattern = re.compile(r'import\s+\{\s*([\w\s,]+)\s*\}\s+from\s+[\'"](' + sources + ')[\'"]')
+    # import Box from '@chakra-ui/react/dist/Box'
+    default_import_pattern = re.compile(r'import\s+(\w+)\s+from\s+[\'"](' + sources + r')(?:\/[\w\/]+)?[\'"]')
+    custom_component_pattern = re.compile(
+        r'import\s+(\w+(?:' + '|'.join(custom_suffixes) + r'))\s+from'
+    ) if custom_suffixes else None
+    return named_import_pattern, default_import_pattern, custom_component_pattern
+
+
+def find_imports(content, named_import_pattern, default_import_pattern):
+    """Yield (package, component) for every component content imports through the two patterns."""
+    for match in named_import_pattern.finditer(content):
+        for name in match.group(1).split(','):
+            component = name.strip()
+            if component:
+                yield match.group(2), component
+
+    for match in default_import_pattern.finditer(content):
+        yield match.group(2), match.group(1)
+
+
+def find_custom_components(content, custom_component_pattern, components):
+    """Return the names imported in content that look like custom components and are not part of a detected one.
+
+    This is heuristic-based and might need adjustment.
+    """
+    if custom_component_pattern is None:
+        return set()
+    return {match.group(1) for match in custom_component_pattern.finditer(content)
+            if not any(match.group(1) in component for component in components)}
+
+
+def compile_naming_rule(name, class_prefix=CLASS_EXPRESSION_PREFIX):
+    """Return a function (attributes, component_name) -> description suffix or None.
+
+    class_prefix is what the className rule accepts before the name it reads
+    from a className={...} expression.
+    """
+    if name == 'className':
+        expression_pattern = re.compile(r'className=\{' + class_prefix + r'(\w+)\}')
+        string_pattern = re.compile(r'className=["\']([^"\']+)["\']')
+
+        def rule(attributes, component_name):
+            match = expression_pattern.search(attributes)
+            if match:
+                return match.group(1)
+            match = string_pattern.search(attributes)
+            if match:
+                return re.sub(r'\s+', '-', match.group(1)).lower()
+            return None
+    elif name == 'src':
+        src_pattern = re.compile(r'src=\{([^}]+)\}')
+
+        def rule(attributes, component_name):
+            if component_name.lower() != 'image':
+                return None
+            match = src_pattern.search(attributes)
+            if not match:
+                return None
+            src_var = match.group(1).strip()
+            if '.' in src_var:
+                return src_var.split('.')[-1].strip()
+            return src_var.replace(' ', '-')
+    else:
+        # id and any other attribute: "value", 'value', {"value"} or {expression}
+        string_pattern = re.compile(r'\b' + re.escape(name) + r'=["\']([^"\']+)["\']')
+        expression_pattern = re.compile(r'\b' + re.escape(name) + r'=\{["\']?([^}"\']+)["\']?\}')
+        if name == 'id':
+            # Unanchored like the built-in lookup so existing IDs do not change
+            string_pattern = re.compile(r'id=["\']([^"\']+)["\']')
+            expression_pattern = re.compile(r'id=\{["\']?([^}"\']+)["\']?\}')
+
+        def rule(attributes, component_name):
+            match = string_pattern.search(attributes) or expression_pattern.search(attributes)
+            if not match:
+                return None
+            if name == 'id':
+                return match.group(1)
+            return re.sub(r'\s+', '-', match.group(1).strip()).lower()
+    return rule
+
+
+def name_list_item(attributes, component_name):
+    """Naming rule of the earlier strategies: "item" for an element with a key attribute."""
+    return 'item' if LIST_KEY_PATTERN.search(attributes) else None
+
+
+# Naming rules only one earlier strategy used, kept so that strategy's IDs do not change
+STYLES_CLASS_PATTERN = re.compile(r'className=\{' + STYLES_CLASS_PREFIX + r'(\w+)\}')
+STRING_CLASS_PATTERN = re.compile(r'className=["\']([^"\']+)["\']')
+MEMBER_CLASS_PATTERN = re.compile(r'className=\{[^}]*?\.(\w+)\}')
+NAME_KEY_PATTERN = re.compile(r'key=\{(\w+)\}')
+TEXT_CONTENT_PATTERN = re.compile(r'>\s*([A-Za-z0-9 ]+)\s*</')
+
+
+def name_text_content(attributes, component_name):
+    """Naming rule of the parser strategy: short text content of the element, dashed."""
+    match = TEXT_CONTENT_PATTERN.search(attributes)
+    if not match:
+        return None
+    text_content = match.group(1).strip()
+    if text_content and len(text_content) < 20:  # Only use short text
+        return re.sub(r'[^a-zA-Z0-9]', '-', text_content.lower())
+    return None
+
+
+def name_styles_class(attributes, component_name):
+    """Naming rule of the advanced strategy: the name read from className={Styles.x} or className={x}."""
+    match = STYLES_CLASS_PATTERN.search(attributes)
+    return match.group(1) if match else None
+
+
+def name_class_words(attributes, component_name):
+    """Naming rule of the advanced strategy: a string className with every non-word character dashed."""
+    match = STRING_CLASS_PATTERN.search(attributes)
+    return re.sub(r'[^\w]', '-', match.group(1)) if match else None
+
+
+def name_list_item_kind(attributes, component_name):
+    """Naming rule of the advanced strategy: "item" for key={name}, "list-item" for any other key expression."""
+    match = LIST_KEY_PATTERN.search(attributes)
+    if not match:
+        return None
+    return 'item' if re.match(r'^\w+$', match.group(1)) else 'list-item'
+
+
+def name_class_member(attributes, component_name):
+    """Naming rule of the basic strategy: the last member of a className={a.b} expression."""
+    match = MEMBER_CLASS_PATTERN.search(attributes)
+    return match.group(1) if match else None
+
+
+def name_keyed_item(attributes, component_name):
+    """Naming rule of the basic strategy: "item-{key}" for key={name}."""
+    match = NAME_KEY_PATTERN.search(attributes)
+    return f"item-{match.group(1)}" if match else None
+
+
+def describe(attributes, component_name, naming_rules):
+    """Return the lower-cased component name and the first value one of naming_rules finds in attributes."""
+    description = component_name.lower()
+    for rule in naming_rules:
+        value = rule(attributes, component_name)
+        if value:
+            return f"{description}-{value}"
+    return description
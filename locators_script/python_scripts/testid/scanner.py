@@ -0,0 +1,755 @@
+"""
+JSX tag lexing: tags, their ends and their nesting, over text, UTF-8 bytes and chunked streams.
+
+Comments and string or template literals in code are skipped, so tags in
+them are never found. TagSpanTable keeps a file's tags current across edits
+by re-lexing only near each one.
+"""
+import array
+import bisect
+import codecs
+import contextlib
+import hashlib
+import io
+import itertools
+import mmap
+import operator
+import os
+import re
+
+# Start of a JSX opening or closing tag: "<Name" or "</Name"
+TAG_START_PATTERN = re.compile(r'<(/?)([A-Za-z][\w.]*)(?=[\s/>])')
+
+# Characters that matter while looking for the end of a tag
+TAG_SPECIAL_PATTERN = re.compile(r'["\'`{}>]')
+
+# The same two patterns for the byte scanning core; UTF-8 bytes of non-ASCII letters count as name characters
+BYTE_TAG_START_PATTERN = re.compile(rb'<(/?)([A-Za-z][\w.\x80-\xff]*)(?=[\s/>])')
+BYTE_TAG_SPECIAL_PATTERN = re.compile(rb'["\'`{}>]')
+
+# What the lexers stop at, by where they are: in JavaScript code, tags, fragments ("<>", "</>"),
+# comments and string or template literals; in the text between JSX tags, tags, fragments and the
+# "{" of an expression; in such an expression, code plus its braces. A quote left open at the end
+# of its line is not a string (it may be in a regular expression) and is passed over; a "/" ending
+# the text (but not "</") may start a comment, so it counts as a literal running to the end.
+JSX_TAG_SOURCE = r'<(/?)(?:([A-Za-z][\w.]*)(?=[\s/>])|>)'
+BYTE_JSX_TAG_SOURCE = r'<(/?)(?:([A-Za-z][\w.\x80-\xff]*)(?=[\s/>])|>)'
+JS_LITERAL_SOURCE = (r'//[^\n]*|/\*.*?(?:\*/|\Z)|(?<!<)/\Z'
+                     r'|"[^"\\\n]*(?:\\[^\n][^"\\\n]*)*(?:"|\\?\Z)'
+                     r"|'[^'\\\n]*(?:\\[^\n][^'\\\n]*)*(?:'|\\?\Z)"
+                     r'|`[^`\\]*(?:\\.[^`\\]*)*(?:`|\\?\Z)')
+
+# What they pass over before a token in one regex call: in code, anything but "<" (and braces in
+# an expression), with the comments and literals that end before the end of the text; in the text
+# between tags, anything but "<" and "{", and whole {expressions} without tags, braces, comments
+# or escapes, which covers most of them
+JS_SKIP_SOURCE = (r'(?:[^<"\'`/%s]++|//[^\n]*+\n|/\*.*?\*/|/(?=[^/*])'
+                  r'|"[^"\\\n]*+(?:\\[^\n][^"\\\n]*+)*+"|"(?![^"\\\n]*+(?:\\[^\n][^"\\\n]*+)*+\\?\Z)'
+                  r"|'[^'\\\n]*+(?:\\[^\n][^'\\\n]*+)*+'|'(?![^'\\\n]*+(?:\\[^\n][^'\\\n]*+)*+\\?\Z)"
+                  r'|`[^`\\]*+(?:\\.[^`\\]*+)*+`)*+')
+JSX_TEXT_SKIP_SOURCE = r'(?:[^<{]++|\{(?:[^<"\'`/{}]++|"[^"\\\n]*+"|\'[^\'\\\n]*+\')*+\})*+'
+
+# (passed over, tokens) in code, in the text between tags and in an expression, indexed by the
+# length of the JSX nesting as min(length, 2 - length % 2) (see nest_tag)
+LEX_SOURCES = (
+    (JS_SKIP_SOURCE % '', '|' + JS_LITERAL_SOURCE),
+    (JSX_TEXT_SKIP_SOURCE, r'|\{'),
+    (JS_SKIP_SOURCE % '{}', '|' + JS_LITERAL_SOURCE + r'|[{}]'),
+)
+
+# What is passed over, the next token, and the same matched from where the passing over starts, for
+# each place in the nesting; group 1 marks where the token starts, then come the tag's "/" and name
+SKIP_PATTERNS = tuple(re.compile(skip, re.DOTALL) for skip, tokens in LEX_SOURCES)
+TOKEN_PATTERNS = tuple(re.compile('()(?:' + JSX_TAG_SOURCE + tokens + ')', re.DOTALL)
+                       for skip, tokens in LEX_SOURCES)
+SKIP_TOKEN_PATTERNS = tuple(re.compile(skip + '()(?:' + JSX_TAG_SOURCE + tokens + ')', re.DOTALL)
+                            for skip, tokens in LEX_SOURCES)
+BYTE_SKIP_PATTERNS = tuple(re.compile(skip.encode(), re.DOTALL) for skip, tokens in LEX_SOURCES)
+BYTE_TOKEN_PATTERNS = tuple(re.compile(('()(?:' + BYTE_JSX_TAG_SOURCE + tokens + ')').encode(), re.DOTALL)
+                            for skip, tokens in LEX_SOURCES)
+BYTE_SKIP_TOKEN_PATTERNS = tuple(re.compile((skip + '()(?:' + BYTE_JSX_TAG_SOURCE + tokens + ')').encode(), re.DOTALL)
+                                 for skip, tokens in LEX_SOURCES)
+
+# Any character before the next tag start that may make a token in each place, so the tag can be
+# taken directly when there is none
+GAP_SOURCES = (r'["\'`/]|<(?=/?>)', r'\{|<(?=/?>)', r'["\'`/{}]|<(?=/?>)')
+GAP_PATTERNS = tuple(re.compile(source) for source in GAP_SOURCES)
+BYTE_GAP_PATTERNS = tuple(re.compile(source.encode()) for source in GAP_SOURCES)
+
+# Every name BYTE_TAG_START_PATTERN can give an opening tag, and more (names in strings and
+# comments too), for the cheap check of whether a file needs scanning at all
+TAG_NAME_PATTERN = re.compile(rb'<([A-Za-z][\w.\x80-\xff]*)(?=[\s/>])')
+
+# A tag body up to its closing ">" in one regex call, for the byte core: quoted strings and braces
+# nested up to two deep are skipped. Each alternative starts with a different character, so a
+# failed match backtracks in linear time; deeper nesting falls back to find_tag_end_bytes.
+BYTE_TAG_BODY_PATTERN = re.compile(
+    rb'[^"\'`{}>]*(?:(?:"[^"]*"|\'[^\']*\'|`[^`]*`'
+    rb'|\{[^"\'`{}]*(?:(?:"[^"]*"|\'[^\']*\'|`[^`]*`'
+    rb'|\{[^"\'`{}]*(?:(?:"[^"]*"|\'[^\']*\'|`[^`]*`)[^"\'`{}]*)*\})[^"\'`{}]*)*\})[^"\'`{}>]*)*>'
+)
+
+# Closing quote searches for the byte core, which also runs on memoryviews (they have no find())
+BYTE_QUOTE_PATTERNS = {ord(quote): re.compile(re.escape(quote).encode()) for quote in '"\'`'}
+
+# ASCII bytes before "<" that make it a generic or comparison rather than a tag
+BYTE_IDENTIFIER_CHARS = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$)]')
+
+# Bytes of a streamed file decoded and scanned at a time
+STREAM_CHUNK_BYTES = 1 << 20
+
+# Import statements in a memory-mapped file; detection only needs these, not the whole text
+STREAM_IMPORT_PATTERN = re.compile(rb'import\s+(?:\{[^{}]*\}|\w+)\s*(?:from(?:\s*[\'"][^\'"\n]*[\'"]?)?)?')
+
+# "<", "</" or an opening of a tag name cut off at the end of a chunk
+PARTIAL_TAG_PATTERN = re.compile(r'</?[\w.]*')
+
+# Counter ID as generated by this tool: "<base>-<n>"
+COUNTER_ID_PATTERN = re.compile(r'^(.+)-(\d{1,5})$')
+
+# Whitespace and // or /* */ comments before an attribute, and an attribute's name with the "=" before its value
+ATTRIBUTE_SPACE_PATTERN = re.compile(r'(?:\s++|//[^\n]*+|/\*.*?\*/)*+', re.DOTALL)
+ATTRIBUTE_NAME_PATTERN = re.compile(r'([^\s=/>{}"\'`<]+)(\s*=\s*)?')
+
+# Value of an existing data-testid attribute: "id", 'id', {"id"} or {`id`}
+TESTID_VALUE_PATTERN = re.compile(r'data-testid=\{?\s*["\'`]([^"\'`]*)["\'`]')
+BYTE_TESTID_VALUE_PATTERN = re.compile(rb'data-testid=\{?\s*["\'`]([^"\'`]*)["\'`]')
+
+# A data-testid attribute anywhere in a tag, for audit counts
+TESTID_MARKER_PATTERN = re.compile(r'data-testid=')
+BYTE_TESTID_MARKER_PATTERN = re.compile(rb'data-testid=')
+
+
+def find_tag_end(content, pos):
+    """Return the index of the ">" closing the tag that starts at pos, or -1."""
+    bracket_count = 0
+    search = TAG_SPECIAL_PATTERN.search
+
+    # Jump between quotes, braces and ">" instead of visiting every character
+    while True:
+        match = search(content, pos)
+        if not match:
+            return -1
+
+        i = match.start()
+        char = content[i]
+        if char in '"\'`':
+            close = content.find(char, i + 1)
+            if close == -1:
+                return -1
+            pos = close + 1
+            continue
+
+        if char == '{':
+            bracket_count += 1
+        elif char == '}':
+            bracket_count -= 1
+        elif bracket_count == 0:
+            return i
+        pos = i + 1
+
+
+def find_value_end(content, pos):
+    """Return the index just past the attribute value starting at pos, or -1."""
+    char = content[pos:pos + 1]
+    if char in ('"', "'"):
+        end = content.find(char, pos + 1)
+        return end + 1 if end != -1 else -1
+    if char != '{':
+        return -1
+
+    bracket_count = 0
+    search = TAG_SPECIAL_PATTERN.search
+    while True:
+        match = search(content, pos)
+        if not match:
+            return -1
+
+        i = match.start()
+        char = content[i]
+        if char in '"\'`':
+            close = content.find(char, i + 1)
+            if close == -1:
+                return -1
+            pos = close + 1
+            continue
+
+        if char == '{':
+            bracket_count += 1
+        elif char == '}':
+            bracket_count -= 1
+            if bracket_count == 0:
+                return i + 1
+        pos = i + 1
+
+
+def iter_attributes(content, pos, end):
+    """Yield (start, name, value start, value end) for each attribute from pos, just past a tag's name, to end.
+
+    start includes the whitespace just before the attribute, after any
+    comments between attributes, which are skipped; name is None for a
+    {...spread}, and value start is -1 for an attribute without a value, whose
+    value end is the end of its name. Quoted and braced values are skipped
+    whole as find_tag_end skips them, so text inside a value is never read
+    as an attribute. Stops at end (the tag's ">"), at "/>" or at anything
+    that is not an attribute.
+    """
+    match_space = ATTRIBUTE_SPACE_PATTERN.match
+    match_name = ATTRIBUTE_NAME_PATTERN.match
+    while True:
+        space_end = match_space(content, pos).end()
+        if space_end >= end:
+            return
+        start = pos + len(content[pos:space_end].rstrip())
+        pos = space_end
+
+        name = None
+        if content[pos] != '{':
+            match = match_name(content, pos)
+            if not match:
+                return
+            name = match.group(1)
+            pos = match.end()
+            if match.group(2) is None:
+                yield start, name, -1, pos
+                continue
+
+        value_end = find_value_end(content, pos)
+        if value_end == -1 or value_end > end:
+            return
+        yield start, name, pos, value_end
+        pos = value_end
+
+
+def nest_tag(context, is_closing, is_self_closing):
+    """Return the JSX nesting after a tag or fragment, given the nesting before it.
+
+    The nesting is a tuple alternating the depth of open elements and of
+    braces, from the outermost JSX down: () is JavaScript code outside JSX,
+    an odd length the text between tags and an even one an {expression}.
+    """
+    in_text = len(context) % 2
+    if is_closing:
+        if not in_text:
+            return context
+        depth = context[-1] - 1
+        return context[:-1] + (depth,) if depth else context[:-1]
+    if is_self_closing:
+        return context
+    return context[:-1] + (context[-1] + 1,) if in_text else context + (1,)
+
+
+def nest_brace(context, char):
+    """Return the JSX nesting after a "{" or "}" outside tags and literals."""
+    if len(context) % 2:
+        return context + (1,)
+    depth = context[-1] + (1 if char == '{' else -1)
+    return context[:-1] + (depth,) if depth else context[:-1]
+
+
+def lex_tags(content, pos=0, context=()):
+    """Yield the opening and closing tags of JSX content in document order from pos.
+
+    Each tag is a dict with its start offset, the offset of its closing ">",
+    the component name, whether it is a closing or self-closing tag and the
+    JSX nesting after it (see nest_tag). Comments and string or template
+    literals are passed over in code but not in the text between tags, so
+    "<div>" in a string or a {/* comment */} is no tag; context is the
+    nesting at pos. The generator returns (cut, nesting) when done, where
+    cut is the start of an unterminated tag, or of a literal running to the
+    end of the text, at which lexing stopped, or None.
+    """
+    length = len(content)
+    candidate = None
+    candidate_start = -1
+    while True:
+        where = len(context)
+        if where > 2:
+            where = 2 - where % 2
+        if candidate_start < pos:
+            candidate = TAG_START_PATTERN.search(content, pos)
+            candidate_start = candidate.start() if candidate else length
+        if candidate is not None and not GAP_PATTERNS[where].search(content, pos, candidate_start):
+            match = candidate
+            start = candidate_start
+            is_closing = match.group(1) == '/'
+            component = match.group(2)
+        else:
+            match = SKIP_TOKEN_PATTERNS[where].match(content, pos)
+            if not match:
+                # Passing over stopped at a "<" that starts no token, such as a<b
+                match = TOKEN_PATTERNS[where].search(content, SKIP_PATTERNS[where].match(content, pos).end())
+            if not match:
+                return None, context
+
+            start = match.start(1)
+            char = content[start]
+            if char in '{}':
+                context = nest_brace(context, char)
+                pos = start + 1
+                continue
+            if char != '<':
+                if match.end() == length:
+                    return start, context
+                pos = match.end()
+                continue
+
+            is_closing = match.group(2) == '/'
+            component = match.group(3)
+            if component is None:
+                # A fragment only changes the nesting
+                context = nest_tag(context, is_closing, False)
+                pos = match.end()
+                continue
+
+        # Skip generics and comparisons such as useState<Box> or a<b
+        if not is_closing and start > 0 and (content[start - 1].isalnum() or content[start - 1] in '_$)]'):
+            pos = match.end()
+            continue
+
+        end = find_tag_end(content, match.end())
+        if end == -1:
+            return start, context
+
+        is_self_closing = not is_closing and content[end - 1] == '/'
+        context = nest_tag(context, is_closing, is_self_closing)
+        yield {
+            'start': start,
+            'end': end,
+            'component': component,
+            'is_closing': is_closing,
+            'is_self_closing': is_self_closing,
+            'context': context,
+        }
+        pos = end + 1
+
+
+def link_ancestors(tags):
+    """Set 'ancestors' on each tag to the indices of its enclosing tags."""
+    open_stack = []
+    for index, tag in enumerate(tags):
+        tag['ancestors'] = list(open_stack)
+
+        if tag['is_closing']:
+            # Pop back to the matching opening tag, ignoring stray closers
+            for depth in range(len(open_stack) - 1, -1, -1):
+                if tags[open_stack[depth]]['component'] == tag['component']:
+                    del open_stack[depth:]
+                    break
+        elif not tag['is_self_closing']:
+            open_stack.append(index)
+
+    return tags
+
+
+def scan_tags(content):
+    """Scan JSX content for opening and closing tags in document order.
+
+    Each tag is a dict as produced by lex_tags, plus the indices of its
+    enclosing (ancestor) tags.
+    """
+    return link_ancestors(list(lex_tags(content)))
+
+
+def find_tag_end_bytes(data, pos):
+    """find_tag_end for UTF-8 bytes, a memoryview or an mmap; offsets are byte offsets."""
+    bracket_count = 0
+    search = BYTE_TAG_SPECIAL_PATTERN.search
+
+    while True:
+        match = search(data, pos)
+        if not match:
+            return -1
+
+        i = match.start()
+        char = data[i]
+        if char in BYTE_QUOTE_PATTERNS:
+            close = BYTE_QUOTE_PATTERNS[char].search(data, i + 1)
+            if not close:
+                return -1
+            pos = close.end()
+            continue
+
+        if char == 0x7b:  # {
+            bracket_count += 1
+        elif char == 0x7d:  # }
+            bracket_count -= 1
+        elif bracket_count == 0:
+            return i
+        pos = i + 1
+
+
+def follows_identifier_bytes(data, pos):
+    """Return whether the character ending just before byte offset pos is alphanumeric or _$)]."""
+    char = data[pos - 1]
+    if char < 0x80:
+        return char in BYTE_IDENTIFIER_CHARS
+    # Back up to the lead byte of the UTF-8 sequence and check the decoded character
+    start = pos - 1
+    while start > 0 and pos - start < 4 and 0x80 <= data[start] < 0xc0:
+        start -= 1
+    return bytes(data[start:pos]).decode('utf-8', 'replace')[-1:].isalnum()
+
+
+def lex_tags_bytes(data, pos=0, context=()):
+    """lex_tags for UTF-8 bytes, a memoryview or an mmap, without decoding the content.
+
+    Tags carry byte offsets; only component names are decoded, once per
+    distinct name. Most tags are matched whole by BYTE_TAG_BODY_PATTERN
+    rather than character class by character class. The two cores agree
+    wherever component names are ASCII.
+    """
+    length = len(data)
+    names = {}
+    candidate = None
+    candidate_start = -1
+    while True:
+        where = len(context)
+        if where > 2:
+            where = 2 - where % 2
+        if candidate_start < pos:
+            candidate = BYTE_TAG_START_PATTERN.search(data, pos)
+            candidate_start = candidate.start() if candidate else length
+        if candidate is not None and not BYTE_GAP_PATTERNS[where].search(data, pos, candidate_start):
+            match = candidate
+            start = candidate_start
+            is_closing = match.group(1) == b'/'
+            raw_name = match.group(2)
+        else:
+            match = BYTE_SKIP_TOKEN_PATTERNS[where].match(data, pos)
+            if not match:
+                match = BYTE_TOKEN_PATTERNS[where].search(data, BYTE_SKIP_PATTERNS[where].match(data, pos).end())
+            if not match:
+                return None, context
+
+            start = match.start(1)
+            char = data[start]
+            if char == 0x7b or char == 0x7d:  # { or }
+                context = nest_brace(context, chr(char))
+                pos = start + 1
+                continue
+            if char != 0x3c:  # <
+                if match.end() == length:
+                    return start, context
+                pos = match.end()
+                continue
+
+            is_closing = match.group(2) == b'/'
+            raw_name = match.group(3)
+            if raw_name is None:
+                context = nest_tag(context, is_closing, False)
+                pos = match.end()
+                continue
+
+        if not is_closing and start > 0 and (data[start - 1] in BYTE_IDENTIFIER_CHARS or (
+                data[start - 1] >= 0x80 and follows_identifier_bytes(data, start))):
+            pos = match.end()
+            continue
+
+        body = BYTE_TAG_BODY_PATTERN.match(data, match.end())
+        if body:
+            end = body.end() - 1
+        else:
+            end = find_tag_end_bytes(data, match.end())
+            if end == -1:
+                return start, context
+
+        component = names.get(raw_name)
+        if component is None:
+            component = names[raw_name] = raw_name.decode('utf-8')
+        is_self_closing = not is_closing and data[end - 1] == 0x2f  # /
+        context = nest_tag(context, is_closing, is_self_closing)
+        yield {
+            'start': start,
+            'end': end,
+            'component': component,
+            'is_closing': is_closing,
+            'is_self_closing': is_self_closing,
+            'context': context,
+        }
+        pos = end + 1
+
+
+def scan_tags_bytes(data):
+    """scan_tags for UTF-8 bytes, a memoryview or an mmap; offsets are byte offsets."""
+    return link_ancestors(list(lex_tags_bytes(data)))
+
+
+def decode_text(data):
+    """Decode file bytes as open() in text mode does, translating \\r\\n and \\r to \\n."""
+    content = data.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+class LineIndex:
+    """Start offset of every line of a text or UTF-8 bytes, for offset to line:column lookups.
+
+    The offsets are found once per file by C-level iterators and kept in an
+    int64 array, so each lookup is a binary search however large the file
+    is. Columns count characters, also for bytes.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        lines = content.split(b'\n' if isinstance(content, bytes) else '\n')
+        lines.pop()
+        self.starts = array.array('q', [0])
+        self.starts.extend(map(operator.add, itertools.accumulate(map(len, lines)), itertools.count(1)))
+
+    def line_of(self, offset):
+        """Return the 1-based line holding offset."""
+        return bisect.bisect_right(self.starts, offset)
+
+    def locate(self, offset):
+        """Return the 1-based (line, column) of offset."""
+        line = bisect.bisect_right(self.starts, offset)
+        start = self.starts[line - 1]
+        if isinstance(self.content, bytes):
+            prefix = self.content[start:offset]
+            if not prefix.isascii():
+                return line, len(prefix.decode('utf-8')) + 1
+        return line, offset - start + 1
+
+
+def lex_stream(chunks):
+    """Lex JSX text arriving in chunks; yields (segment, tags) pairs in document order.
+
+    Joining the segments gives the whole text, and each segment's tags are
+    lex_tags dicts with offsets into that segment. A tag cut off at the end of
+    a chunk is carried into the next segment, together with the character
+    before it so generics are still told apart, and so is a comment or string
+    literal; otherwise the chunk's last character is, for a tag starting the
+    next one. Only the current chunk and an unfinished tag or literal are
+    held at once. As in lex_tags, a tag or literal that is still unterminated
+    at the end of the text ends lexing there.
+    """
+    carry = ''
+    pos = 0
+    context = ()
+    chunks = iter(chunks)
+    chunk = next(chunks, None)
+    while chunk is not None:
+        following = next(chunks, None)
+        buffer = carry + chunk
+        tags = []
+        lexer = lex_tags(buffer, pos, context)
+        while True:
+            try:
+                tags.append(next(lexer))
+            except StopIteration as stop:
+                cut, context = stop.value
+                break
+
+        if following is None:
+            yield buffer, tags
+            return
+
+        floor = tags[-1]['end'] + 1 if tags else 0
+        if cut is None:
+            partial = buffer.rfind('<', floor)
+            if partial != -1 and PARTIAL_TAG_PATTERN.fullmatch(buffer, partial):
+                cut = partial
+        # Keep the character before the cut, or the last one, so a tag starting
+        # the next segment is still told from a generic
+        keep = max((len(buffer) if cut is None else cut) - 1, floor)
+        yield buffer[:keep], tags
+        carry = buffer[keep:]
+        pos = len(carry) if cut is None else cut - keep
+        chunk = following
+
+
+def release_pages(mapped, start, end):
+    """Drop the whole pages of mapped in [start, end) from resident memory; returns the offset released to."""
+    end -= end % mmap.PAGESIZE
+    if isinstance(mapped, mmap.mmap) and hasattr(mmap, 'MADV_DONTNEED') and end > start:
+        mapped.madvise(mmap.MADV_DONTNEED, start, end - start)
+        return end
+    return start
+
+
+def iter_text_chunks(mapped, chunk_bytes=STREAM_CHUNK_BYTES):
+    """Yield the text of a memory-mapped UTF-8 file in chunks, translating newlines as open() does.
+
+    Pages already decoded are released so resident memory stays at about one
+    chunk however large the file is.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+    size = len(mapped)
+    released = 0
+    for offset in range(0, size, chunk_bytes):
+        end = min(offset + chunk_bytes, size)
+        yield decoder.decode(mapped[offset:end], final=end == size)
+        released = release_pages(mapped, released, end)
+
+
+def map_file(f):
+    """Memory-map an open binary file read-only; an empty file maps to empty bytes."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def hash_text_file(file_path):
+    """Hash a file's text as read by open() without holding it in memory, to match journaled input hashes."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f, map_file(f) as mapped:
+        for chunk in iter_text_chunks(mapped):
+            digest.update(chunk.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+def read_import_statements(mapped, chunk_bytes=STREAM_CHUNK_BYTES):
+    """Return the import statements of a memory-mapped file as text, for import detection.
+
+    The file is searched a window at a time, releasing pages behind it. A
+    statement that may run past the end of a window (including one whose
+    optional "from" clause could start there) is searched again from its
+    start in the next one.
+    """
+    size = len(mapped)
+    if size <= chunk_bytes:
+        return b'\n'.join(STREAM_IMPORT_PATTERN.findall(mapped)).decode('utf-8', 'replace')
+
+    statements = []
+    pos = released = 0
+    width = chunk_bytes
+    while pos < size:
+        endpos = min(pos + width, size)
+        resume = pos
+        for match in STREAM_IMPORT_PATTERN.finditer(mapped, pos, endpos):
+            if match.end() + len(b'from') <= endpos or endpos == size:
+                statements.append(match.group())
+                resume = match.end()
+        if endpos == size:
+            break
+
+        # Resume at the first "import", or at a keyword cut off by the window, after the last whole match
+        tail = mapped.find(b'import', resume, endpos)
+        if tail == -1:
+            tail = max(resume, endpos - len(b'import') + 1)
+        if tail > pos:
+            pos = tail
+            width = chunk_bytes
+        else:
+            # A single statement longer than the window
+            width *= 2
+        released = release_pages(mapped, released, pos)
+    return b'\n'.join(statements).decode('utf-8', 'replace')
+
+
+def common_prefix_length(a, b):
+    """Return the length of the common prefix of two strings."""
+    low, high = 0, min(len(a), len(b))
+    # Binary search on slice comparisons keeps the work in C
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def common_suffix_length(a, b, limit):
+    """Return the length of the common suffix of two strings, at most limit."""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:len(a) - low] == b[len(b) - mid:len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class TagSpanTable:
+    """Tag spans of one file, kept current across edits by re-lexing only the edited region.
+
+    apply_edit re-lexes from the end of the last tag before the line of the
+    edit, where the JSX nesting is known, until the lexer produces a tag that matches an
+    old tag after the edit, nesting included; the remaining old tags are
+    reused with their offsets shifted. Ancestors are relinked from the spans without touching the text.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.tags = []
+        # Start of an unterminated tag where lexing stopped, if any
+        self.break_at = None
+        # Characters re-lexed by the most recent update
+        self.relexed = len(content)
+        self._lex(0, [])
+
+    def _lex(self, pos, new_tags, old_tags=(), resume=0, delta=0, resync_from=0, old_break_at=None):
+        """Lex from pos, appending to new_tags, until resynchronised with old_tags[resume:]."""
+        lexer = lex_tags(self.content, pos, new_tags[-1]['context'] if new_tags else ())
+        self.break_at = None
+        relexed_to = len(self.content)
+        while True:
+            try:
+                tag = next(lexer)
+            except StopIteration as stop:
+                self.break_at = stop.value[0]
+                break
+
+            if tag['start'] >= resync_from:
+                while resume < len(old_tags) and old_tags[resume]['start'] + delta < tag['start']:
+                    resume += 1
+                if resume < len(old_tags):
+                    old_tag = old_tags[resume]
+                    if (old_tag['start'] + delta == tag['start'] and old_tag['end'] + delta == tag['end']
+                            and old_tag['component'] == tag['component']
+                            and old_tag['is_closing'] == tag['is_closing']
+                            and old_tag['context'] == tag['context']):
+                        # Everything from here on is unchanged apart from its offsets
+                        for old_tag in old_tags[resume:]:
+                            old_tag['start'] += delta
+                            old_tag['end'] += delta
+                        new_tags.extend(old_tags[resume:])
+                        if old_break_at is not None:
+                            self.break_at = old_break_at + delta
+                        relexed_to = tag['start']
+                        break
+            new_tags.append(tag)
+
+        self.tags = link_ancestors(new_tags)
+        self.relexed = relexed_to - pos
+
+    def apply_edit(self, start, end, new_text):
+        """Replace content[start:end] with new_text and update the tag spans."""
+        old_tags = self.tags
+        old_break_at = self.break_at
+        self.content = self.content[:start] + new_text + self.content[end:]
+        delta = len(new_text) - (end - start)
+
+        # Tags ending before the line of the edit are untouched (whether a quote
+        # opens a string depends on the rest of its line), and lexing resumes
+        # after the last of them with the nesting it left
+        first = bisect.bisect_left(old_tags, self.content.rfind('\n', 0, start) + 1, key=lambda tag: tag['end'])
+        pos = old_tags[first - 1]['end'] + 1 if first > 0 else 0
+
+        resume = bisect.bisect_left(old_tags, end, key=lambda tag: tag['start'])
+        self._lex(pos, old_tags[:first], old_tags, resume, delta, start + len(new_text), old_break_at)
+
+    def update(self, new_content):
+        """Replace the content, re-lexing only the range that differs.
+
+        Returns the edit as (start, end, new_text) in old-content offsets.
+        """
+        prefix = common_prefix_length(self.content, new_content)
+        suffix = common_suffix_length(self.content, new_content,
+                                      min(len(self.content), len(new_content)) - prefix)
+        edit = (prefix, len(self.content) - suffix, new_content[prefix:len(new_content) - suffix])
+        self.apply_edit(*edit)
+        return edit
+
+
+def text_hash(data):
+    """Hash file text or bytes as the journal does: the UTF-8 of the text open() would read."""
+    if isinstance(data, bytes):
+        if b'\r' not in data:
+            return hashlib.sha1(data).hexdigest()
+        data = decode_text(data)
+    return hashlib.sha1(data.encode('utf-8', 'surrogatepass')).hexdigest()
@@ -0,0 +1,288 @@
+"""
+Where test ID locations go: the NDJSON manifest and its JSON index, the SQLite index and the checkpoint journal.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Version of the manifest's JSON index; 2 added the generated flag to each location
+MANIFEST_INDEX_VERSION = 2
+
+# Default location of the checkpoint journal used by annotate --resume
+DEFAULT_JOURNAL_PATH = '.testid_journal.ndjson'
+
+# Version of the journal's records; 2 added the output's size and mtime
+JOURNAL_VERSION = 2
+
+# Completed files buffered before the journal is appended to and synced
+JOURNAL_FLUSH_ENTRIES = 64
+
+# Default location of the SQLite test ID index used by annotate --index and lookup
+DEFAULT_INDEX_PATH = '.testid_index.sqlite'
+
+
+def load_generated_ids(manifest_path):
+    """Return {resolved output path: generated test IDs} from an NDJSON manifest or its JSON index.
+
+    IDs are kept per annotated output, as the manifest records them: an ID
+    generated in one file says nothing about the same ID in another.
+    Raises ValueError for an index older than MANIFEST_INDEX_VERSION, which
+    does not record which IDs were generated.
+    """
+    generated = {}
+    with open(manifest_path, 'r') as f:
+        if str(manifest_path).endswith('.ndjson'):
+            locations = ((entry['file'], entry['test_id']) for entry in map(json.loads, f) if entry.get('generated'))
+        else:
+            index = json.load(f)
+            if index.get('version', 1) < MANIFEST_INDEX_VERSION:
+                raise ValueError(f"{manifest_path}: this index does not record which IDs were generated; "
+                                 f"pass the NDJSON manifest or re-run annotate --manifest")
+            locations = ((index['files'][location[0]], test_id) for test_id, entries in index['ids'].items()
+                         for location in entries if location[5])
+        for file_path, test_id in locations:
+            generated.setdefault(str(Path(file_path).resolve()), set()).add(test_id)
+    return generated
+
+
+class ManifestWriter:
+    """Stream test ID locations as NDJSON and write a compact JSON index on close.
+
+    Each NDJSON line holds test_id, component, file, line, column, parent_id
+    and whether the ID was generated by this run. The index maps every test ID
+    to its locations as [file_index, line, column, component, parent_id,
+    generated] so page-object generators can load it without re-parsing any
+    JSX, and renumber can tell generated IDs from hand-written ones.
+    """
+
+    def __init__(self, manifest_path, index_path=None):
+        self.manifest_path = Path(manifest_path)
+        if index_path is None:
+            index_path = self.manifest_path.with_suffix('.json')
+            if index_path == self.manifest_path:
+                index_path = self.manifest_path.with_suffix('.index.json')
+        self.index_path = Path(index_path)
+        self.files = {}
+        self.ids = {}
+        self.entry_count = 0
+        self._stream = open(self.manifest_path, 'w')
+
+    def write_entry(self, entry):
+        """Append one entry to the NDJSON stream and the in-memory index."""
+        self._stream.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self.entry_count += 1
+
+        file_index = self.files.setdefault(entry['file'], len(self.files))
+        self.ids.setdefault(entry['test_id'], []).append(
+            [file_index, entry['line'], entry['column'], entry['component'], entry['parent_id'], entry['generated']]
+        )
+
+    def close(self):
+        """Close the NDJSON stream and write the JSON index."""
+        self._stream.close()
+
+        index = {
+            'version': MANIFEST_INDEX_VERSION,
+            'files': list(self.files),
+            'ids': self.ids,
+        }
+        with open(self.index_path, 'w') as f:
+            json.dump(index, f, separators=(',', ':'), sort_keys=True)
+
+
+class LocationBuffer:
+    """Location sink that keeps one file's entries, e.g. in a worker process for the parent's sinks."""
+
+    def __init__(self):
+        self.entries = []
+
+    def begin_file(self, file_path):
+        self.entries = []
+
+    def write_entry(self, entry):
+        self.entries.append(entry)
+
+
+class TestIdIndex:
+    """SQLite index from test ID to file, line, column and component.
+
+    Rows for a file are replaced whenever that file is processed again, so
+    the index stays current without rebuilding it. Lookups use the test_id
+    index and stay fast for hundreds of thousands of IDs.
+    """
+
+    # Not a test class, though pytest collects Test* names the tests import
+    __test__ = False
+
+    def __init__(self, index_path=DEFAULT_INDEX_PATH):
+        import sqlite3
+        self.index_path = Path(index_path)
+        self.connection = sqlite3.connect(str(self.index_path))
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS test_ids (
+                test_id TEXT NOT NULL,
+                file_id INTEGER NOT NULL REFERENCES files(id),
+                line INTEGER NOT NULL,
+                col INTEGER NOT NULL,
+                component TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS test_ids_by_test_id ON test_ids(test_id);
+            CREATE INDEX IF NOT EXISTS test_ids_by_file ON test_ids(file_id);
+        ''')
+        self.entry_count = 0
+        self._file_id = None
+        self._rows = []
+
+    def begin_file(self, file_path):
+        """Start (re)indexing a file, dropping the rows from its previous run."""
+        self.end_file()
+        path = str(Path(file_path).resolve())
+        self.connection.execute('INSERT OR IGNORE INTO files (path) VALUES (?)', (path,))
+        self._file_id = self.connection.execute('SELECT id FROM files WHERE path = ?', (path,)).fetchone()[0]
+
+    def write_entry(self, entry):
+        """Queue one located test ID for the current file."""
+        self._rows.append((entry['test_id'], self._file_id, entry['line'], entry['column'], entry['component']))
+
+    def end_file(self):
+        """Replace the current file's rows with the queued ones in one transaction."""
+        if self._file_id is None:
+            return
+        with self.connection:
+            self.connection.execute('DELETE FROM test_ids WHERE file_id = ?', (self._file_id,))
+            self.connection.executemany('INSERT INTO test_ids VALUES (?, ?, ?, ?, ?)', self._rows)
+        self.entry_count += len(self._rows)
+        self._file_id = None
+        self._rows = []
+
+    def lookup(self, test_id, prefix=False):
+        """Return (test_id, path, line, column, component) rows for a test ID or ID prefix."""
+        if prefix:
+            # A range scan uses the index, unlike LIKE with the default collation
+            where, params = 'test_id >= ? AND test_id < ?', (test_id, test_id + '\uffff')
+        else:
+            where, params = 'test_id = ?', (test_id,)
+        return self.connection.execute(
+            'SELECT test_id, path, line, col, component FROM test_ids '
+            'JOIN files ON files.id = test_ids.file_id '
+            f'WHERE {where} ORDER BY test_id, path, line, col',
+            params,
+        ).fetchall()
+
+    def close(self):
+        """Flush the current file and close the database."""
+        self.end_file()
+        self.connection.close()
+
+
+class RunJournal:
+    """Append-only NDJSON journal of files completed by an annotate run.
+
+    The first line records the run settings; each further line holds a
+    processed file, the SHA-1 of its input, the SHA-1, size and mtime of the
+    output written, and (when a manifest or index is written) its location
+    entries so they can be replayed. Lines are buffered and appended JOURNAL_FLUSH_ENTRIES at a
+    time. A run resumed with the same settings skips every journaled file
+    whose input and output are unchanged; a truncated last line from a
+    crash is ignored.
+    """
+
+    def __init__(self, journal_path, settings_key):
+        self.journal_path = Path(journal_path)
+        self.completed = {}
+        self.skipped = 0
+        self._buffer = []
+        self._entries = None
+
+        resumable = False
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r') as f:
+                for line_no, line in enumerate(f):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    if line_no == 0:
+                        resumable = record.get('journal') == JOURNAL_VERSION and record.get('settings') == settings_key
+                        if not resumable:
+                            break
+                        continue
+                    self.completed[record['path']] = record
+
+        if resumable:
+            self._stream = open(self.journal_path, 'a')
+        else:
+            self.completed = {}
+            self._stream = open(self.journal_path, 'w')
+            self._stream.write(json.dumps({'journal': JOURNAL_VERSION, 'settings': settings_key}) + '\n')
+            self._stream.flush()
+
+    def is_complete(self, file_path, input_hash, output_path):
+        """Return the journal record if file_path was finished with this input and its output is intact.
+
+        The output is stat'ed first: a different size (e.g. a truncated
+        write) fails without reading it, and an unchanged size and mtime
+        pass. Only an output rewritten at the same size is read and hashed.
+        """
+        record = self.completed.get(str(file_path))
+        if record is None or record['input'] != input_hash:
+            return None
+        try:
+            status = os.stat(output_path)
+            if status.st_size != record['size']:
+                return None
+            if status.st_mtime_ns == record['mtime']:
+                return record
+            with open(output_path, 'rb') as f:
+                output_hash = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None
+        return record if output_hash == record['output'] else None
+
+    def begin_file(self, file_path):
+        """Start capturing location entries for the file being annotated."""
+        self._entries = []
+
+    def write_entry(self, entry):
+        self._entries.append(entry)
+
+    def record(self, file_path, input_hash, output_path, output_hash, entries=None):
+        """Queue a completed file once its output is written, flushing once JOURNAL_FLUSH_ENTRIES are queued.
+
+        The output's size and mtime are recorded for is_complete. entries
+        defaults to those captured since begin_file, if any.
+        """
+        if entries is None:
+            entries = self._entries
+        self._entries = None
+        status = os.stat(output_path)
+        record = {'path': str(file_path), 'input': input_hash, 'output': output_hash,
+                  'size': status.st_size, 'mtime': status.st_mtime_ns}
+        if entries is not None:
+            record['entries'] = list(entries)
+        self._buffer.append(json.dumps(record, separators=(',', ':')) + '\n')
+        if len(self._buffer) >= JOURNAL_FLUSH_ENTRIES:
+            self.flush()
+
+    def flush(self):
+        """Append queued records and push them to disk."""
+        if not self._buffer:
+            return
+        self._stream.write(''.join(self._buffer))
+        self._stream.flush()
+        os.fsync(self._stream.fileno())
+        self._buffer = []
+
+    def close(self, finished=False):
+        """Flush the journal; a finished run deletes it so the next run starts fresh."""
+        self.flush()
+        self._stream.close()
+        if finished:
+            self.journal_path.unlink()
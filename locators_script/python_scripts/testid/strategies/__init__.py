@@ -0,0 +1,39 @@
+"""
+Registry of scanning strategies for annotate --strategy and bench --strategy.
+
+'final' is the annotator module; the others are the earlier scripts, one
+module here each, subclassing base.BaseChakraTestIdAdder. A strategy's
+module is only imported when the strategy is first used.
+"""
+import importlib
+
+# name -> (module in this package, adder class, summary); every strategy but 'final' writes {stem}_{name}_result
+STRATEGIES = {
+    'final': (None, None, 'byte tokenizer with import, config and symbol-index detection (default)'),
+    'v6_multiline': ('v6_multiline', 'ChakraTestIdAdder', 'line scanner joining multi-line tags'),
+    'v6': ('v6', 'ChakraTestIdAdder', 'attribute-aware tag regex over newline-folded tags'),
+    'v5': ('v5', 'ChakraTestIdAdder', 'opening-tag regex repeated until nothing changes'),
+    'v4': ('v4', 'ChakraTestIdAdder', 'opening- and closing-tag regex passes'),
+    'fixed': ('fixed', 'ChakraTestIdAdder', 'per-line regex, single-line tags only'),
+    'parser': ('parser', 'JSXProcessor', "fixed component list, v4's passes"),
+    'advanced': ('advanced', 'TestIdAdder', "fixed component list, v4's passes with a lazy whole-tag regex"),
+    'basic': ('basic', 'BasicTestIdAdder', 'fixed component list, one regex substitution'),
+}
+
+_strategies = {}
+
+
+def get_strategy(name):
+    """Return this process's function annotating text with an earlier script's strategy: text -> (output, IDs added).
+
+    The strategy's module is imported on the first call; its adder is created
+    once and reset for each file.
+    """
+    if name not in _strategies:
+        module_name, class_name, _ = STRATEGIES[name]
+        adder = getattr(importlib.import_module(f'.{module_name}', __name__), class_name)()
+
+        def annotate(content):
+            return adder.annotate(content), len(adder.added_test_ids)
+        _strategies[name] = annotate
+    return _strategies[name]
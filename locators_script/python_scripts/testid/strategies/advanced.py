@@ -0,0 +1,13 @@
+"""
+Script to add data-testid attributes to Chakra UI components in JSX files.
+This version matches each opening tag lazily up to its first ">", across lines.
+"""
+from ..rules import name_class_words, name_list_item_kind, name_styles_class
+from . import v4
+
+
+class TestIdAdder(v4.ChakraTestIdAdder):
+    # Chakra UI components to add data-testid to
+    components = ('Box', 'Flex', 'VStack', 'Image', 'CustomToolTip', 'RequestSentModal')
+    naming_rules = (name_styles_class, name_class_words, name_list_item_kind)
+    opening_tag_rest = r'([\s\S]*?)(?:>|/>)'
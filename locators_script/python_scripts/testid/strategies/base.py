@@ -0,0 +1,103 @@
+"""
+Shared base of the earlier scripts' strategies (fixed, v4, v5, v6, v6_multiline, parser, advanced, basic).
+Components are detected from imports with the default config, as the final strategy detects them,
+or taken from a strategy's fixed list; IDs are described with the shared naming rules. Each
+strategy only supplies how it finds and rewrites tags.
+"""
+import abc
+
+from ..config import get_config
+from ..rules import CHAKRA_LIBRARY, compile_naming_rule, describe
+
+
+class BaseChakraTestIdAdder(abc.ABC):
+    # Components always annotated; None detects them from each file's imports
+    components = None
+    # Naming rules tried in order for an ID's description (see rules)
+    naming_rules = (compile_naming_rule('className'), compile_naming_rule('id'))
+    # Whether a component no naming rule describes is named after the enclosing tag's type
+    name_after_parent = False
+
+    def __init__(self):
+        # Default config: Chakra packages, fallback components and custom-component suffixes
+        self.config = get_config()
+        # Will be populated dynamically from imports
+        self.chakra_components = set()
+        # Track additional custom components that might be chakra-based
+        self.custom_components = set()
+        # Component counts for unique IDs
+        self.component_counts = {}
+        # Added test IDs
+        self.added_test_ids = []
+        # Component hierarchy
+        self.path_stack = []
+        # Track component types
+        self.component_types = {}
+
+    def reset_file_state(self):
+        """Reset counters, hierarchy and detected components before processing another file."""
+        self.chakra_components = set()
+        self.custom_components = set()
+        self.component_counts = {}
+        self.added_test_ids = []
+        self.path_stack = []
+        self.component_types = {}
+
+    def extract_chakra_imports(self, content):
+        """Extract Chakra UI component names from import statements."""
+        detected, self.custom_components = self.config.detect_imports(content)
+        self.chakra_components = set(detected.get(CHAKRA_LIBRARY, ()))
+
+        print(f"Detected Chakra UI components: {', '.join(sorted(self.chakra_components))}")
+        if self.custom_components:
+            print(f"Detected potential custom Chakra components: {', '.join(sorted(self.custom_components))}")
+
+        # If no Chakra components were found, use common ones as fallback
+        if not self.chakra_components:
+            self.chakra_components = set(self.config.fallback_components)
+            print(f"No Chakra UI imports found. Using default components: {', '.join(sorted(self.chakra_components))}")
+
+        # Add custom components to the list
+        self.chakra_components.update(self.custom_components)
+
+    def _get_component_description(self, attributes, component_name):
+        """Extract meaningful description from component attributes."""
+        description = describe(attributes, component_name, self.naming_rules)
+        if self.name_after_parent and description == component_name.lower() and self.path_stack:
+            parent = self.path_stack[-1].split('-')[0]  # Get base component type
+            return f"{parent}-{description}"
+        return description
+
+    def _generate_test_id(self, component_name, attributes):
+        """Generate a unique test ID for a component and record it."""
+        base_id = self._get_component_description(attributes, component_name)
+
+        if base_id in self.component_counts:
+            self.component_counts[base_id] += 1
+        else:
+            self.component_counts[base_id] = 1
+
+        test_id = f"{base_id}-{self.component_counts[base_id]}"
+        self.added_test_ids.append(test_id)
+
+        # Track component types
+        component_type = component_name.lower()
+        self.component_types[component_type] = self.component_types.get(component_type, 0) + 1
+
+        return test_id
+
+    @abc.abstractmethod
+    def annotate_content(self, content):
+        """Return content with data-testid attributes added to the detected components' tags."""
+
+    def annotate(self, content):
+        """Detect the components content imports, or take the fixed list, and return it annotated."""
+        self.reset_file_state()
+        if self.components is None:
+            self.extract_chakra_imports(content)
+        else:
+            self.chakra_components = set(self.components)
+        # Longest names first, so the strategies' alternations of them match <WrapItem> as WrapItem, not Wrap,
+        # whatever the set's hash order
+        self.chakra_components = sorted(self.chakra_components, key=lambda name: (-len(name), name))
+        return self.annotate_content(content)
@@ -0,0 +1,42 @@
+"""
+Script to add data-testid attributes to Chakra UI components in JSX files.
+This version replaces every opening tag of a fixed component list in one regex substitution.
+"""
+import re
+
+from ..rules import name_class_member, name_keyed_item
+from .base import BaseChakraTestIdAdder
+
+
+class BasicTestIdAdder(BaseChakraTestIdAdder):
+    # Chakra UI components to add data-testid to
+    components = ('Box', 'Flex', 'VStack', 'Image', 'CustomToolTip', 'RequestSentModal')
+    naming_rules = (name_class_member, name_keyed_item)
+
+    def _add_test_id(self, match):
+        """Replace one Chakra component's opening tag with one that has a data-testid."""
+        component_name = match.group(1)
+
+        # Skip if it already has a data-testid
+        if 'data-testid=' in match.group(0):
+            return match.group(0)
+
+        test_id = self._generate_test_id(component_name, match.group(0))
+
+        # Add data-testid attribute before the closing angle bracket
+        # Handle both self-closing and normal opening tags
+        if match.group(0).rstrip().endswith('/>'):  # Self-closing tag
+            replacement = match.group(0).rstrip()[:-2] + f' data-testid="{test_id}" />'
+        else:  # Normal opening tag
+            replacement = match.group(0).rstrip()[:-1] + f' data-testid="{test_id}">'
+
+        return replacement
+
+    def annotate_content(self, content):
+        """Return content with data-testid attributes added to Chakra UI components."""
+        # Build regex pattern for all Chakra components
+        component_pattern = '|'.join(self.chakra_components)
+        pattern = r'<(' + component_pattern + r')([\s\S]*?)(?:>|/>)'
+
+        # Replace all Chakra components with ones that have data-testid
+        return re.sub(pattern, self._add_test_id, content)
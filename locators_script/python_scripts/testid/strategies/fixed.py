@@ -0,0 +1,58 @@
+"""
+Fixed Script: Add data-testid attributes to Chakra UI components in JSX files.
+This version correctly handles attribute placement for all components.
+"""
+import re
+
+from ..rules import NAMING_PRIORITY, compile_naming_rule
+from .base import BaseChakraTestIdAdder
+
+class ChakraTestIdAdder(BaseChakraTestIdAdder):
+    naming_rules = tuple(compile_naming_rule(name) for name in NAMING_PRIORITY)
+
+    def annotate_content(self, content):
+        """Add data-testid attributes to the detected Chakra UI components' tags in content."""
+        # Simple regex approach using line-by-line processing to avoid issues with complex JSX
+        lines = content.split('\n')
+        modified_lines = []
+
+        # Pattern to find component opening tags
+        component_pattern = '|'.join(map(re.escape, self.chakra_components))
+        tag_pattern = re.compile(r'(<(' + component_pattern + r')\s+[^>]*?)(/?>)')
+
+        for line in lines:
+            # Find all component tags in this line
+            matches = list(tag_pattern.finditer(line))
+
+            if not matches:
+                # No components on this line
+                modified_lines.append(line)
+                continue
+
+            # Process matches in reverse to avoid messing up positions
+            for match in reversed(matches):
+                full_match = match.group(0)  # The entire tag
+                opening = match.group(1)     # Everything before the closing '>' or '/>'
+                component = match.group(2)   # The component name
+                closing = match.group(3)     # The closing '>' or '/>'
+
+                # Skip if already has a data-testid
+                if 'data-testid=' in full_match:
+                    continue
+
+                # Generate test ID
+                test_id = self._generate_test_id(component, opening)
+
+                # Insert data-testid attribute before closing tag
+                modified_tag = f"{opening} data-testid=\"{test_id}\"{closing}"
+
+                # Replace in the line
+                start, end = match.span()
+                line = line[:start] + modified_tag + line[end:]
+
+            modified_lines.append(line)
+
+        # Join lines back together
+        modified_content = '\n'.join(modified_lines)
+
+        return modified_content
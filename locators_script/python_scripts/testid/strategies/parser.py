@@ -0,0 +1,14 @@
+"""
+Script to add data-testid attributes to Chakra UI components in JSX files.
+This version uses regular expressions with special handling for JSX syntax.
+"""
+from ..rules import STYLES_CLASS_PREFIX, compile_naming_rule, name_list_item, name_text_content
+from . import v4
+
+
+class JSXProcessor(v4.ChakraTestIdAdder):
+    # Chakra UI components to add data-testid attributes to
+    components = ('Box', 'Flex', 'VStack', 'Image', 'CustomToolTip',
+                  'RequestSentModal', 'HStack', 'Text', 'Button', 'Container')
+    naming_rules = (compile_naming_rule('className', STYLES_CLASS_PREFIX), compile_naming_rule('id'), name_list_item,
+                    name_text_content)
@@ -0,0 +1,66 @@
+"""
+Script v4: Add data-testid attributes to Chakra UI components in JSX files.
+This version dynamically detects Chakra UI imports rather than using a fixed list.
+"""
+import re
+
+from ..rules import name_list_item
+from .base import BaseChakraTestIdAdder
+
+class ChakraTestIdAdder(BaseChakraTestIdAdder):
+    naming_rules = BaseChakraTestIdAdder.naming_rules + (name_list_item,)
+    name_after_parent = True
+    # Rest of an opening tag after the component name
+    opening_tag_rest = r'([\s\n][^>]*?)(?:>|/>)'
+
+    def _add_test_id_to_tag(self, match):
+        """Add a data-testid attribute to a component opening tag."""
+        full_tag = match.group(0)
+        component_name = match.group(1)
+
+        # Skip if already has a data-testid
+        if 'data-testid=' in full_tag:
+            # If this is an opening tag, track it for hierarchy
+            if not full_tag.rstrip().endswith('/>'):
+                existing_id = re.search(r'data-testid=["\']([^"\']+)["\']', full_tag)
+                if existing_id:
+                    self.path_stack.append(existing_id.group(1))
+            return full_tag
+
+        # Generate component description based on props and context
+        test_id = self._generate_test_id(component_name, full_tag)
+
+        # Add the test ID attribute to the tag
+        if full_tag.rstrip().endswith('/>'):  # Self-closing tag
+            result = full_tag.rstrip()[:-2] + f' data-testid="{test_id}" />'
+        else:  # Opening tag
+            result = full_tag.rstrip()[:-1] + f' data-testid="{test_id}">'
+            # Add to path stack for nested components
+            self.path_stack.append(test_id)
+
+        return result
+
+    def _process_closing_tag(self, match):
+        """Process a closing JSX tag and maintain the component hierarchy."""
+        component_name = match.group(1)
+        if component_name in self.chakra_components and self.path_stack:
+            self.path_stack.pop()
+        return match.group(0)
+
+    def annotate_content(self, content):
+        """Add data-testid attributes to the detected Chakra components' tags in content."""
+        # Regex patterns for opening and closing tags
+        component_pattern = '|'.join(self.chakra_components)
+        opening_tag_pattern = r'<(' + component_pattern + r')' + self.opening_tag_rest
+        closing_tag_pattern = r'</(' + component_pattern + r')>'
+
+        # First process all opening tags
+        modified_content = re.sub(opening_tag_pattern, self._add_test_id_to_tag, content)
+
+        # Reset path stack for second pass
+        self.path_stack = []
+
+        # Process closing tags to maintain hierarchy
+        modified_content = re.sub(closing_tag_pattern, self._process_closing_tag, modified_content)
+
+        return modified_content
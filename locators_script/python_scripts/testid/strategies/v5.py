@@ -0,0 +1,58 @@
+"""
+Script v5: Add data-testid attributes to Chakra UI components in JSX files.
+This version dynamically detects Chakra UI imports and properly handles attribute placement.
+"""
+import re
+
+from ..rules import name_list_item
+from .base import BaseChakraTestIdAdder
+
+class ChakraTestIdAdder(BaseChakraTestIdAdder):
+    naming_rules = BaseChakraTestIdAdder.naming_rules + (name_list_item,)
+    name_after_parent = True
+
+    def annotate_content(self, content):
+        """Add data-testid attributes to the detected Chakra components' tags in content."""
+        # Create regex pattern for JSX tags
+        component_pattern = '|'.join(self.chakra_components)
+
+        # We'll use a more sophisticated approach to handle JSX properly
+        # First, let's find all opening tags
+        modified_content = content
+
+        # Pattern to match opening tags with proper attribute handling
+        opening_pattern = r'<(' + component_pattern + r')([^>]*?)(/?)>'
+
+        # Function to process each match
+        def process_tag(match):
+            tag_name = match.group(1)  # Component name
+            attrs = match.group(2)     # All attributes
+            self_closing = match.group(3)  # "/" for self-closing tags
+
+            # Skip if it already has a data-testid
+            if 'data-testid=' in attrs:
+                return match.group(0)
+
+            # Generate test ID
+            test_id = self._generate_test_id(tag_name, attrs)
+
+            # For self-closing tag: <Component ... />
+            if self_closing:
+                return f"<{tag_name}{attrs} data-testid=\"{test_id}\" />"
+            # For opening tag: <Component ...>
+            else:
+                new_tag = f"<{tag_name}{attrs} data-testid=\"{test_id}\">"
+                # Track for hierarchy
+                self.path_stack.append(test_id)
+                return new_tag
+
+        # Keep applying the replacement until no more changes (handles nested tags)
+        prev_content = ""
+        while prev_content != modified_content:
+            prev_content = modified_content
+            modified_content = re.sub(opening_pattern, process_tag, modified_content)
+
+        # Reset path stack for tracking closing tags
+        self.path_stack = []
+
+        return modified_content
@@ -0,0 +1,74 @@
+"""
+Script v6: Add data-testid attributes to Chakra UI components in JSX files.
+This version properly handles JSX syntax to ensure correct attribute placement.
+"""
+import re
+
+from ..rules import name_list_item
+from .base import BaseChakraTestIdAdder
+
+class ChakraTestIdAdder(BaseChakraTestIdAdder):
+    naming_rules = BaseChakraTestIdAdder.naming_rules + (name_list_item,)
+    name_after_parent = True
+
+    def annotate_content(self, content):
+        """Add data-testid attributes to the detected Chakra components' tags in content."""
+        # Create regex pattern for JSX tags with more careful handling
+        component_pattern = '|'.join(map(re.escape, self.chakra_components))
+
+        # This is the key improvement - we're using a much more careful pattern
+        # that won't match inside other attributes
+        # We look for the tag opening with spaces, newlines, or braces preceding it
+        jsx_tag_pattern = r'([\s{(])<(' + component_pattern + r')((?:\s+[a-zA-Z0-9_\-:]+(?:=(?:"[^"]*"|\'[^\']*\'|\{(?:\{[^{}]*\}|[^{}])*\}))?)*)\s*(/?)>'
+
+        # First, let's join opening multiline tags by temporarily replacing newlines
+        # This helps us handle multiline components correctly
+        content = re.sub(r'<(' + component_pattern + r')([^>]*?\n)([^<]*?)(/?)>',
+                        lambda m: '<' + m.group(1) + m.group(2).replace('\n', '___NEWLINE___') +
+                                 m.group(3).replace('\n', '___NEWLINE___') + m.group(4) + '>',
+                        content)
+
+        # Process all JSX components in content
+        matches = list(re.finditer(jsx_tag_pattern, content))
+
+        # Process the matches in reverse order to avoid messing up string indices
+        for match in reversed(matches):
+            prefix = match.group(1)  # The character before the tag
+            component_name = match.group(2)
+            attributes = match.group(3)
+            self_closing = match.group(4)  # "/" for self-closing tags
+
+            # Skip if already has a data-testid
+            if 'data-testid=' in attributes:
+                continue
+
+            # Generate test ID
+            test_id = self._generate_test_id(component_name, attributes)
+
+            # Create the new tag with data-testid
+            if self_closing:
+                # Self-closing tag: <Component ... />
+                new_tag = f"{prefix}<{component_name}{attributes} data-testid=\"{test_id}\" />"
+            else:
+                # Opening tag: <Component ...>
+                new_tag = f"{prefix}<{component_name}{attributes} data-testid=\"{test_id}\">"
+                # Track for hierarchy
+                self.path_stack.append(test_id)
+
+            # Replace the matched part in the content
+            start, end = match.span()
+            content = content[:start] + new_tag + content[end:]
+
+        # Restore newlines
+        modified_content = content.replace('___NEWLINE___', '\n')
+
+        # Handle closing tags to maintain hierarchy - This is just for stack maintenance,
+        # we don't actually need to modify the closing tags
+        closing_pattern = r'</(' + component_pattern + r')>'
+        closing_matches = list(re.finditer(closing_pattern, modified_content))
+        for match in closing_matches:
+            component_name = match.group(1)
+            if component_name in self.chakra_components and self.path_stack:
+                self.path_stack.pop()
+
+        return modified_content
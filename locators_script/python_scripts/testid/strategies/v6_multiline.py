@@ -0,0 +1,105 @@
+"""
+Script v6 (multiline): Add data-testid attributes to Chakra UI components in JSX files.
+This version handles both single-line and multi-line JSX elements.
+"""
+import re
+
+from ..rules import compile_naming_rule, name_list_item
+from .base import BaseChakraTestIdAdder
+
+class ChakraTestIdAdder(BaseChakraTestIdAdder):
+    naming_rules = BaseChakraTestIdAdder.naming_rules + (name_list_item, compile_naming_rule('src'))
+    name_after_parent = True
+
+    def annotate_content(self, content):
+        """Add data-testid attributes to the detected Chakra components' tags in content."""
+        # Process multi-line components as a special case
+        # This approach is more thorough and handles components that span multiple lines
+
+        # Build a regex pattern for all components
+        component_pattern = '|'.join(map(re.escape, self.chakra_components))
+
+        # Function to process a matched component
+        def process_component(match_text, component_name):
+            # Skip if it already has a data-testid
+            if 'data-testid=' in match_text:
+                return match_text
+
+            # Generate the test ID
+            test_id = self._generate_test_id(component_name, match_text)
+
+            # Add the data-testid attribute to the component
+            if '/>' in match_text:  # Self-closing tag
+                return match_text.replace('/>', f' data-testid="{test_id}" />')
+            else:  # Opening tag
+                # Track for hierarchy
+                self.path_stack.append(test_id)
+                return match_text.replace('>', f' data-testid="{test_id}">')
+
+        # Process the content line by line to handle both single and multi-line components
+        lines = content.split('\n')
+        in_component = False
+        current_component = None
+        component_lines = []
+        result_lines = []
+
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+
+            # Check for component start
+            component_start_match = re.search(r'<(' + component_pattern + r')([\s>])', line)
+
+            if not in_component and component_start_match:
+                # Found a new component start
+                component_name = component_start_match.group(1)
+
+                # Check if the component ends on this line
+                if '/>' in line:
+                    # Self-closing tag - process the entire component on this line
+                    component_text = line[component_start_match.start():line.find('/>') + 2]
+                    processed_text = process_component(component_text, component_name)
+                    result_lines.append(line.replace(component_text, processed_text))
+                elif '>' in line[component_start_match.end():]:
+                    # Opening tag ends on this line
+                    component_text = line[component_start_match.start():line.find('>', component_start_match.end()) + 1]
+                    processed_text = process_component(component_text, component_name)
+                    result_lines.append(line.replace(component_text, processed_text))
+                else:
+                    # Start of a multi-line component
+                    in_component = True
+                    current_component = component_name
+                    component_lines = [line]
+                    i += 1  # Move to the next line
+
+                    # Collect all lines of this component
+                    while i < len(lines):
+                        line = lines[i]
+                        component_lines.append(line)
+
+                        if '/>' in line:
+                            # Found end of self-closing tag
+                            break
+                        elif '>' in line:
+                            # Found end of opening tag
+                            break
+
+                        i += 1
+
+                    # Process the complete multi-line component
+                    component_text = '\n'.join(component_lines)
+                    processed_text = process_component(component_text, current_component)
+
+                    # Add the processed lines
+                    result_lines.extend(processed_text.split('\n'))
+                    in_component = False
+            else:
+                # Not a component start or already inside a component
+                result_lines.append(line)
+
+            i += 1
+
+        # Join all lines back together
+        modified_content = '\n'.join(result_lines)
+
+        return modified_content
@@ -0,0 +1,485 @@
+"""
+Project symbol index used by --symbols: module summaries, barrels and path aliases.
+"""
+import bisect
+import json
+import os
+import re
+from pathlib import Path
+
+from . import TOOL_VERSION
+from .config import get_config
+from .files import JSX_EXTENSIONS, iter_jsx_files, write_atomic
+from .rules import CHAKRA_PACKAGES
+from .scanner import scan_tags
+
+# Module files summarized for the project symbol index
+MODULE_EXTENSIONS = JSX_EXTENSIONS + ('.ts',)
+
+# Default location of the project symbol index used by --symbols
+DEFAULT_SYMBOL_INDEX_PATH = '.testid_symbols.json'
+
+# import Default, { a, b as c } from 'x' / import * as ns from 'x'
+IMPORT_CLAUSE_PATTERN = re.compile(
+    r'^import\s+(?:type\s+)?(?:([\w$]+)\s*,?\s*)?(?:\{([^}]*)\}\s*|\*\s+as\s+([\w$]+)\s*)?'
+    r'from\s+[\'"]([^\'"]+)[\'"]',
+    re.MULTILINE
+)
+
+# export { a, b as c } from 'x' / export * from 'x' / export * as ns from 'x'
+REEXPORT_PATTERN = re.compile(
+    r'^export\s+(?:type\s+)?(?:\{([^}]*)\}|\*\s+as\s+([\w$]+)|\*)\s*from\s+[\'"]([^\'"]+)[\'"]',
+    re.MULTILINE
+)
+
+# export { a, b as c }; without a source
+EXPORT_LIST_PATTERN = re.compile(r'^export\s+\{([^}]*)\}(?!\s*from)', re.MULTILINE)
+
+# Named top-level declarations, optionally exported
+DECLARATION_PATTERN = re.compile(
+    r'^(export\s+(?:default\s+)?)?(?:const|let|var|class|(?:async\s+)?function\*?)\s+([\w$]+)',
+    re.MULTILINE
+)
+
+# export default <expression>
+DEFAULT_EXPORT_PATTERN = re.compile(r'^export\s+default\s+(?!(?:const|let|var|class|async|function)\b)',
+                                    re.MULTILINE)
+
+# export default Foo; or a wrapped name such as memo(Foo)
+DEFAULT_EXPORT_NAME_PATTERN = re.compile(r'(?:[\w$.]+\(\s*)*([A-Za-z_$][\w$]*)\s*\)*\s*;?[ \t]*$', re.MULTILINE)
+
+# Call creating a component after its name, e.g. "= chakra('div')" or "= forwardRef("
+COMPONENT_FACTORY_PATTERN = re.compile(r'\s*(?::[^=;]*)?=?\s*([\w$]+)\s*[(<]')
+
+# Comments in tsconfig.json; strings are matched first so "@/*" survives
+JSONC_COMMENT_PATTERN = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+# Trailing commas in tsconfig.json
+JSONC_TRAILING_COMMA_PATTERN = re.compile(r',(\s*[}\]])')
+
+# Start of a top-level statement
+TOP_LEVEL_STATEMENT_PATTERN = re.compile(r'^(?:export|import|const|let|var|class|function|async)\b', re.MULTILINE)
+
+
+def summarize_module(content):
+    """Summarize a module's imports, exports and top-level component declarations.
+
+    The summary is JSON-serializable:
+      imports: {local_name: [source, imported_name]} ('default' and '*' included)
+      exports: {exported_name: ['local', local_name] or ['reexport', source, imported_name]}
+      export_all: [source, ...] for "export * from"
+      declarations: {name: {'factory': callee of chakra(...)-style calls or None,
+                            'root': first element rendered, or None,
+                            'forwards_props': whether the root spreads props}}
+    """
+    imports = {}
+    for match in IMPORT_CLAUSE_PATTERN.finditer(content):
+        default_name, named, namespace, source = match.groups()
+        if default_name:
+            imports[default_name] = [source, 'default']
+        if namespace:
+            imports[namespace] = [source, '*']
+        for imported, local in parse_named_bindings(named):
+            imports[local] = [source, imported]
+
+    exports = {}
+    export_all = []
+    for match in REEXPORT_PATTERN.finditer(content):
+        named, namespace, source = match.groups()
+        if namespace:
+            exports[namespace] = ['reexport', source, '*']
+            continue
+        if named is None:
+            export_all.append(source)
+            continue
+        for imported, exported in parse_named_bindings(named):
+            exports[exported] = ['reexport', source, imported]
+    for match in EXPORT_LIST_PATTERN.finditer(content):
+        for local, exported in parse_named_bindings(match.group(1)):
+            exports.setdefault(exported, ['local', local])
+
+    # Top-level statements start at column 0; a declaration's body runs to the next one
+    boundaries = [match.start() for match in TOP_LEVEL_STATEMENT_PATTERN.finditer(content)]
+    tags = [tag for tag in scan_tags(content) if not tag['is_closing']]
+    tag_starts = [tag['start'] for tag in tags]
+
+    def declare(name, pos):
+        body_end = len(content)
+        next_boundary = bisect.bisect_right(boundaries, pos)
+        if next_boundary < len(boundaries):
+            body_end = boundaries[next_boundary]
+        first_tag = bisect.bisect_left(tag_starts, pos)
+        factory = COMPONENT_FACTORY_PATTERN.match(content, pos)
+        root = tags[first_tag] if first_tag < len(tags) and tag_starts[first_tag] < body_end else None
+        declarations[name] = {
+            'factory': factory.group(1) if factory else None,
+            'root': root['component'] if root else None,
+            # data-testid only reaches the root element through a props spread
+            'forwards_props': root is not None and '{...' in content[root['start']:root['end']],
+        }
+
+    declarations = {}
+    for match in DECLARATION_PATTERN.finditer(content):
+        export_keyword, name = match.groups()
+        if export_keyword:
+            exports['default' if 'default' in export_keyword else name] = ['local', name]
+        if name[:1].isupper():
+            declare(name, match.end())
+
+    for match in DEFAULT_EXPORT_PATTERN.finditer(content):
+        named = DEFAULT_EXPORT_NAME_PATTERN.match(content, match.end())
+        if named:
+            # export default Foo; or export default memo(Foo);
+            exports['default'] = ['local', named.group(1)]
+        else:
+            # export default forwardRef(...) or chakra('div')
+            exports['default'] = ['local', 'default']
+            declare('default', match.end())
+
+    return {
+        'imports': imports,
+        'exports': exports,
+        'export_all': export_all,
+        'declarations': declarations,
+    }
+
+
+def parse_named_bindings(named):
+    """Yield (name, alias) pairs from the inside of "{ a, b as c }"."""
+    if not named:
+        return
+    for binding in named.split(','):
+        binding = binding.strip()
+        if binding.startswith('type '):
+            continue
+        parts = binding.split()
+        if len(parts) == 3 and parts[1] == 'as':
+            yield parts[0], parts[2]
+        elif len(parts) == 1 and re.match(r'^[\w$]+$', parts[0]):
+            yield parts[0], parts[0]
+
+
+def read_jsonc(path):
+    """Load a JSON file that may contain comments and trailing commas (tsconfig style)."""
+    with open(path, 'r') as f:
+        text = f.read()
+    text = JSONC_COMMENT_PATTERN.sub(lambda match: match.group(1) or '', text)
+    text = JSONC_TRAILING_COMMA_PATTERN.sub(r'\1', text)
+    return json.loads(text)
+
+
+def load_compiler_options(config_path, seen=None):
+    """Return compilerOptions from a tsconfig/jsconfig, merged over any relative "extends".
+
+    baseUrl and paths are made absolute relative to the file declaring them.
+    """
+    seen = seen if seen is not None else set()
+    config_path = os.path.abspath(config_path)
+    if config_path in seen or not os.path.isfile(config_path):
+        return {}
+    seen.add(config_path)
+
+    config = read_jsonc(config_path)
+    config_dir = os.path.dirname(config_path)
+    options = {}
+    extends = config.get('extends')
+    if isinstance(extends, str) and extends.startswith('.'):
+        if not extends.endswith('.json'):
+            extends += '.json'
+        options.update(load_compiler_options(os.path.join(config_dir, extends), seen))
+
+    own = config.get('compilerOptions', {})
+    if 'baseUrl' in own:
+        options['baseUrl'] = os.path.normpath(os.path.join(config_dir, own['baseUrl']))
+    if 'paths' in own:
+        # Without baseUrl, path targets are relative to the declaring config
+        options['paths'] = own['paths']
+        options['pathsBase'] = options.get('baseUrl', config_dir)
+    return options
+
+
+def load_path_aliases(root):
+    """Return (base_url, [(prefix, suffix, [target, ...])]) from the project's tsconfig or jsconfig.
+
+    Targets are absolute and keep their "*"; aliases are ordered by longest
+    prefix first, as TypeScript matches them.
+    """
+    for name in ('tsconfig.json', 'jsconfig.json'):
+        config_path = os.path.join(root, name)
+        if os.path.isfile(config_path):
+            break
+    else:
+        return None, []
+
+    options = load_compiler_options(config_path)
+    aliases = []
+    for pattern, targets in options.get('paths', {}).items():
+        prefix, _, suffix = pattern.partition('*')
+        if '*' not in pattern:
+            suffix = None
+        aliases.append((prefix, suffix, [os.path.normpath(os.path.join(options['pathsBase'], target))
+                                         for target in targets]))
+    aliases.sort(key=lambda alias: len(alias[0]), reverse=True)
+    return options.get('baseUrl'), aliases
+
+
+class SymbolIndex:
+    """Project-wide index of module exports and whether they render Chakra UI elements.
+
+    Module summaries are stored in a JSON file keyed by path, with the file's
+    mtime and size; build() re-summarizes only files that changed. A component
+    counts as Chakra-based when it is created with chakra()/styled() or when
+    the first element it renders resolves to a Chakra UI component and
+    receives the component's props (e.g. forwardRef around Box), following
+    local imports and barrel re-exports.
+
+    build() also links every import and re-export source to the module it
+    names (relative paths, tsconfig "paths" aliases and baseUrl), so later
+    resolution is one dictionary lookup. The module graph is saved with the
+    summaries for worker processes.
+    """
+
+    def __init__(self, index_path=DEFAULT_SYMBOL_INDEX_PATH, chakra_packages=None):
+        self.index_path = Path(index_path)
+        self.chakra_packages = chakra_packages or CHAKRA_PACKAGES
+        self.modules = {}
+        # {module path: {import source: resolved module path}}, local sources only
+        self.graph = {}
+        self._stats = {}
+        self._chakra_exports = {}
+        self._chakra_locals = {}
+        self.summarized = 0
+
+        if self.index_path.exists():
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == TOOL_VERSION:
+                for path, (mtime_ns, size, summary) in data['modules'].items():
+                    self.modules[path] = summary
+                    self._stats[path] = (mtime_ns, size)
+                self.graph = data.get('graph', {})
+
+    def build(self, root):
+        """Summarize every module under root that is new or changed since the last build."""
+        seen = set()
+        for module_path in iter_jsx_files([root], MODULE_EXTENSIONS):
+            path = os.path.abspath(module_path)
+            seen.add(path)
+            stat = os.stat(path)
+            if self._stats.get(path) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            with open(path, 'r') as f:
+                self.modules[path] = summarize_module(f.read())
+            self._stats[path] = (stat.st_mtime_ns, stat.st_size)
+            self.summarized += 1
+
+        root = os.path.abspath(root)
+        for path in list(self.modules):
+            if path not in seen and path.startswith(root + os.sep):
+                del self.modules[path]
+                del self._stats[path]
+
+        self.link(root)
+        self._chakra_exports = {}
+        self._chakra_locals = {}
+
+    def link(self, root):
+        """Resolve every import and re-export source in the index to a module path."""
+        base_url, aliases = load_path_aliases(root)
+        # Sources resolve the same way from every file in a directory
+        resolved = {}
+
+        def candidates(base):
+            yield base
+            for extension in MODULE_EXTENSIONS:
+                yield base + extension
+            for extension in MODULE_EXTENSIONS:
+                yield os.path.join(base, 'index' + extension)
+
+        def resolve(directory, source):
+            if source.startswith('.'):
+                bases = [os.path.normpath(os.path.join(directory, source))]
+            else:
+                bases = []
+                for prefix, suffix, targets in aliases:
+                    if suffix is None:
+                        if source == prefix:
+                            bases = list(targets)
+                            break
+                    elif source.startswith(prefix) and source.endswith(suffix) and \
+                            len(source) >= len(prefix) + len(suffix):
+                        star = source[len(prefix):len(source) - len(suffix)]
+                        bases = [target.replace('*', star) for target in targets]
+                        break
+                if base_url is not None:
+                    bases.append(os.path.join(base_url, source))
+            for base in bases:
+                for candidate in candidates(base):
+                    if candidate in self.modules:
+                        return candidate
+            return None
+
+        self.graph = {}
+        for path, summary in self.modules.items():
+            directory = os.path.dirname(path)
+            sources = [source for source, _ in summary['imports'].values()]
+            sources += [export[1] for export in summary['exports'].values() if export[0] == 'reexport']
+            sources += summary['export_all']
+
+            edges = {}
+            for source in sources:
+                if self.is_chakra_package(source):
+                    continue
+                key = (directory, source) if source.startswith('.') else source
+                if key not in resolved:
+                    resolved[key] = resolve(directory, source)
+                if resolved[key] is not None:
+                    edges[source] = resolved[key]
+            self.graph[path] = edges
+
+    def save(self):
+        """Write the module summaries to the index file."""
+        data = {
+            'version': TOOL_VERSION,
+            'modules': {path: [*self._stats[path], summary] for path, summary in self.modules.items()},
+            'graph': self.graph,
+        }
+        write_atomic(self.index_path, json.dumps(data, separators=(',', ':')))
+
+    def is_chakra_package(self, source):
+        """Return True if an import source is a Chakra UI package."""
+        return any(source == package or source.startswith(package + '/') for package in self.chakra_packages)
+
+    def resolve_module(self, from_path, source):
+        """Return the indexed module an import source points to, or None."""
+        return self.graph.get(from_path, {}).get(source)
+
+    def _is_chakra_import(self, module_path, source, imported, visiting):
+        if self.is_chakra_package(source):
+            return imported != '*'
+        target = self.resolve_module(module_path, source)
+        return target is not None and self.is_chakra_export(target, imported, visiting)
+
+    def is_chakra_local(self, module_path, name, visiting=None):
+        """Return True if a name in a module's scope is a Chakra-based component."""
+        key = (module_path, name)
+        if key in self._chakra_locals:
+            return self._chakra_locals[key]
+        visiting = visiting if visiting is not None else set()
+        if ('local', key) in visiting:
+            return False
+        visiting.add(('local', key))
+
+        summary = self.modules[module_path]
+        result = False
+        if name in summary['imports']:
+            source, imported = summary['imports'][name]
+            result = self._is_chakra_import(module_path, source, imported, visiting)
+        elif '.' in name:
+            # chakra.div from the package, or UI.Button from "import * as UI from './ui'"
+            namespace, member = name.split('.', 1)
+            if namespace in summary['imports']:
+                source, imported = summary['imports'][namespace]
+                if self.is_chakra_package(source):
+                    result = True
+                elif imported == '*':
+                    target = self.resolve_module(module_path, source)
+                    result = target is not None and self.is_chakra_export(target, member, visiting)
+        elif name in summary['declarations']:
+            declaration = summary['declarations'][name]
+            factory = declaration['factory']
+            if factory is not None and factory in summary['imports']:
+                # chakra('div'), chakra(Box), styled(Box) from a Chakra package
+                result = self.is_chakra_package(summary['imports'][factory][0])
+            if not result and declaration['root'] is not None and declaration['forwards_props']:
+                result = self.is_chakra_local(module_path, declaration['root'], visiting)
+
+        self._chakra_locals[key] = result
+        return result
+
+    def is_chakra_export(self, module_path, export_name, visiting=None):
+        """Return True if a module export is a Chakra-based component."""
+        key = (module_path, export_name)
+        if key in self._chakra_exports:
+            return self._chakra_exports[key]
+        visiting = visiting if visiting is not None else set()
+        if ('export', key) in visiting:
+            return False
+        visiting.add(('export', key))
+
+        summary = self.modules[module_path]
+        result = False
+        export = summary['exports'].get(export_name)
+        if export is not None and export[0] == 'local':
+            result = self.is_chakra_local(module_path, export[1], visiting)
+        elif export is not None:
+            result = self._is_chakra_import(module_path, export[1], export[2], visiting)
+        elif export_name != 'default':
+            # Barrel files: export * from './Button'. A package's export list is
+            # unknown, so "export * from '@chakra-ui/react'" only claims names
+            # that no local module in the barrel exports.
+            for source in summary['export_all']:
+                target = self.resolve_module(module_path, source)
+                if target is not None and self.exports_name(target, export_name):
+                    result = self.is_chakra_export(target, export_name, visiting)
+                    break
+            else:
+                result = any(self.is_chakra_package(source) for source in summary['export_all'])
+
+        self._chakra_exports[key] = result
+        return result
+
+    def exports_name(self, module_path, export_name, seen=None):
+        """Return True if a module exports a name, directly or through local "export *"."""
+        seen = seen if seen is not None else set()
+        if module_path in seen:
+            return False
+        seen.add(module_path)
+
+        summary = self.modules[module_path]
+        if export_name in summary['exports']:
+            return True
+        for source in summary['export_all']:
+            target = self.resolve_module(module_path, source)
+            if target is not None and self.exports_name(target, export_name, seen):
+                return True
+        return False
+
+    def components_for(self, file_path):
+        """Return (chakra_components, custom_components) usable in a file, or None if unindexed.
+
+        chakra_components holds every imported or declared name that resolves
+        to Chakra UI, including imports through barrels and path aliases;
+        custom_components is the subset not imported from a Chakra package.
+        """
+        module_path = os.path.abspath(file_path)
+        summary = self.modules.get(module_path)
+        if summary is None:
+            return None
+
+        chakra_components = set()
+        custom_components = set()
+        for name, (source, _) in summary['imports'].items():
+            if self.is_chakra_local(module_path, name):
+                chakra_components.add(name)
+                if not self.is_chakra_package(source):
+                    custom_components.add(name)
+        for name in summary['declarations']:
+            if name != 'default' and self.is_chakra_local(module_path, name):
+                chakra_components.add(name)
+                custom_components.add(name)
+        return chakra_components, custom_components
+
+
+# One SymbolIndex per index file in each worker process
+_symbol_indexes = {}
+
+
+def get_symbol_index(index_path, config=None):
+    """Return this process's SymbolIndex loaded from index_path, or None when not in use."""
+    if index_path is None:
+        return None
+    packages = (config or get_config()).packages
+    if (index_path, packages) not in _symbol_indexes:
+        _symbol_indexes[index_path, packages] = SymbolIndex(index_path, packages)
+    return _symbol_indexes[index_path, packages]
@@ -0,0 +1,42 @@
+import React from 'react';
+import { Box, Flex, Text, Button } from '@chakra-ui/react';
+
+const SxTestComponent = () => {
+  return (
+    <Box sx={{ width: '100%', backgroundColor: 'gray.100', p: 4 }} data-testid="box-1">
+      <Flex sx={{ justifyContent: 'space-between', alignItems: 'center' }} data-testid="box-flex-1">
+        <Text sx={{ fontSize: 'lg', fontWeight: 'bold', color: 'blue.500' }} data-testid="box-text-1">
+          Profile Information
+        </Text>
+        <Button
+          sx={{
+            bg: 'green.400',
+            color: 'white',
+            _hover: { bg: 'green.500' }
+          }}
+          onClick={() => console.log('Edit clicked')}
+        >
+          Edit Profile
+        </Button>
+      </Flex>
+      <Box
+        className="user-details-container"
+        sx={{ mt: 4, p: 3, borderRadius: 'md', bg: 'white' }}
+      >
+        <Text sx={{ color: 'gray.500', mb: 2 }} data-testid="box-text-2">User Information</Text>
+        <Flex sx={{ gap: 4 }} data-testid="box-flex-2">
+          <Box sx={{ flex: 1 }} data-testid="box-box-1">
+            <Text sx={{ fontWeight: 'semibold' }} data-testid="box-text-3">Name</Text>
+            <Text data-testid="box-text-4">John Doe</Text data-testid="box-text-4">
+          </Box>
+          <Box sx={{ flex: 1 }} data-testid="box-box-2">
+            <Text sx={{ fontWeight: 'semibold' }} data-testid="box-text-5">Email</Text>
+            <Text data-testid="box-text-6">john.doe@example.com</Text data-testid="box-text-6">
+          </Box>
+        </Flex>
+      </Box>
+    </Box>
+  );
+};
+
+export default SxTestComponent;
\ No newline at end of file
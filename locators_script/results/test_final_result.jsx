@@ -83,16 +83,16 @@ const SchoolUpdatesView = ({
                   onCreditsRequest={handleCreditsRequest}
                   nudgeObject={nudgeObject}
                   setNudgeObject={setNudgeObject}
-                  isNudgeLoading={isNudgeLoading}
-                / data-testid="learningcreditscontainer-1">
+                  isNudgeLoading={isNudgeLoading} data-testid="learningcreditscontainer-1"
+                />
                 <Box className={Styles?.optionRightTopContainer} data-testid="box-6">
                   <OptionContainer
                     isMobile={isMobile}
                     userAdditionalDetails={userAdditionalDetails}
                     isTaskScreen={false}
                     emotionalMessage={emotionalMessage}
-                    hasUpdates={isNotEmptyOrNull(data)}
-                  / data-testid="optioncontainer-1">
+                    hasUpdates={isNotEmptyOrNull(data)} data-testid="optioncontainer-1"
+                  />
                 </Box>
                 <Box className={Styles.mainContainer} data-testid="box-mainContainer-1">
                   {isMobile && (
@@ -108,7 +108,8 @@ const SchoolUpdatesView = ({
                           className={Styles.individualContainer}
                           key={index}
                           cursor={"pointer"}
-                          onClick={() => onhandleUpdateClick(item)} data-testid="box-individualContainer-1">
+                          onClick={() => onhandleUpdateClick(item)} data-testid="box-individualContainer-1"
+                        >
                           <Box className={Styles.leftContainer} data-testid="box-leftContainer-1">
                             <Box className={Styles.updateIcon} data-testid="box-updateIcon-1">
                               {/* EVENT TYPE ICON */}
@@ -129,14 +130,15 @@ const SchoolUpdatesView = ({
                                 <Image
                                   src={getEventTypeIcon(item)}
                                   width={isMobile ? "24px" : "42px"}
-                                  height={isMobile ? "24px" : "42px"}
-                                / data-testid="image-getEventTypeIcon(item)-1">
+                                  height={isMobile ? "24px" : "42px"} data-testid="image-getEventTypeIcon(item)-1"
+                                />
                               )}
                             </Box>
                             <VStack
                               className={Styles.updateContentBox}
                               spacing={"8px"}
-                              align={"start"} data-testid="vstack-updateContentBox-1">
+                              align={"start"} data-testid="vstack-updateContentBox-1"
+                            >
                               <Box className={Styles.updateEventType} data-testid="box-updateEventType-1">
                                 {/* UNLOCK ICON */}
                                 {!isMobile &&
@@ -144,8 +146,8 @@ const SchoolUpdatesView = ({
                                     <Image
                                       src={getUnlockIcon(item)}
                                       width={"24px"}
-                                      height={"24px"}
-                                    / data-testid="image-getUnlockIcon(item)-1">
+                                      height={"24px"} data-testid="image-getUnlockIcon(item)-1"
+                                    />
                                   )}
                                 {/* UPDATE TITLE */}
                                 <Box className={Styles.updateTypeText} data-testid="box-updateTypeText-1">
@@ -167,7 +169,8 @@ const SchoolUpdatesView = ({
                                     dueDateColor === "red"
                                       ? Styles.dueDate
                                       : Styles.completedDate
-                                  } data-testid="box-7">
+                                  } data-testid="box-7"
+                                >
                                   {/* DUE DATE */}
                                   {dueDateColor === "red" ||
                                   dueDateColor === "inProgressGrey"
@@ -187,8 +190,8 @@ const SchoolUpdatesView = ({
                                 <Image
                                   src={getUnlockIcon(item)}
                                   width={"16px"}
-                                  height={"16px"}
-                                / data-testid="image-getUnlockIcon(item)-2">
+                                  height={"16px"} data-testid="image-getUnlockIcon(item)-2"
+                                />
                               )}
 
                             {/* TASK TYPE ICON */}
@@ -199,8 +202,8 @@ const SchoolUpdatesView = ({
                                 <Image
                                   src={getUpdatesTaskTypeIcons(item)}
                                   width={isMobile ? "20px" : "70px"}
-                                  height={isMobile ? "20px" : "68px"}
-                                / data-testid="image-getUpdatesTaskTypeIcons(item)-1">
+                                  height={isMobile ? "20px" : "68px"} data-testid="image-getUpdatesTaskTypeIcons(item)-1"
+                                />
                               )}
                             {!isMobile && (
                               <Box className={Styles.taskTypeName} data-testid="box-taskTypeName-1">
@@ -216,8 +219,8 @@ const SchoolUpdatesView = ({
                     <Box className={Styles.noUpdates} data-testid="box-noUpdates-1">
                       <Image
                         src={accordion_images.noUpdates}
-                        className={Styles.noUpdatesImage}
-                      / data-testid="image-noUpdatesImage-1">
+                        className={Styles.noUpdatesImage} data-testid="image-noUpdatesImage-1"
+                      />
                       <Box className={Styles.noUpdatesContent} data-testid="box-noUpdatesContent-1">
                         You don't have any updates now!
                       </Box>